@@ -11,7 +11,7 @@ from backend_app.api.auth.schemas import (
     SignupRequest, LoginRequest, LoginResponse, RefreshTokenRequest
 )
 from backend_app.api.auth.service import AuthService
-from backend_app.models.users import User
+from backend_app.repositories.user_repo import CachedUser
 
 router = APIRouter()
 security = HTTPBearer()
@@ -116,7 +116,7 @@ async def refresh_token(
 
 @router.get("/me")
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user)
+    current_user: CachedUser = Depends(get_current_user)
 ):
     """Get current user profile information"""
     return {
@@ -135,7 +135,7 @@ async def get_current_user_profile(
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CachedUser:
     """Get current authenticated user from JWT token"""
     auth_service = AuthService(db)
     return await auth_service.get_current_user(credentials.credentials)
@@ -143,7 +143,7 @@ async def get_current_user(
 
 def require_roles(*allowed_roles: List[str]):
     """Decorator to enforce role-based access control"""
-    def role_checker(current_user: User = Depends(get_current_user)):
+    def role_checker(current_user: CachedUser = Depends(get_current_user)):
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
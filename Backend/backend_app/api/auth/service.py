@@ -12,7 +12,7 @@ from sqlalchemy import select
 from backend_app.config import settings
 from backend_app.db.connection import get_db
 from backend_app.models.users import User
-from backend_app.repositories.user_repo import UserRepository
+from backend_app.repositories.user_repo import CachedUser, UserRepository
 
 
 class AuthService:
@@ -31,7 +31,7 @@ class AuthService:
     ) -> User:
         """Create a new user account"""
         # Check if user already exists
-        existing_user = await self.user_repo.get_by_email(email)
+        existing_user = await self.user_repo.get_cached_by_email(email)
         if existing_user:
             raise ValueError("Email already registered")
         
@@ -50,12 +50,13 @@ class AuthService:
         }
         
         user = await self.user_repo.create(user_data)
+        await self.user_repo.commit()
         return user
     
     async def login(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate user and return JWT tokens"""
         # Get user by email
-        user = await self.user_repo.get_by_email(email)
+        user = await self.user_repo.get_login_row(email)
         if not user:
             return None
         
@@ -73,6 +74,7 @@ class AuthService:
         
         # Update last login
         await self.user_repo.update_last_login(user.id)
+        await self.user_repo.commit()
         
         return {
             "access_token": access_token,
@@ -97,7 +99,7 @@ class AuthService:
                 return None
             
             # Get user from database
-            user = await self.user_repo.get_by_id(user_id)
+            user = await self.user_repo.get_cached_by_id(user_id)
             if not user or user.status != "Active":
                 return None
             
@@ -116,7 +118,7 @@ class AuthService:
         except jwt.PyJWTError:
             return None
     
-    async def get_current_user(self, token: str) -> User:
+    async def get_current_user(self, token: str) -> CachedUser:
         """Get current user from JWT token"""
         try:
             payload = jwt.decode(
@@ -130,7 +132,7 @@ class AuthService:
                 raise Exception("Invalid token")
             
             # Get user from database
-            user = await self.user_repo.get_by_id(user_id)
+            user = await self.user_repo.get_cached_by_id(user_id)
             if not user:
                 raise Exception("User not found")
             
@@ -9,7 +9,7 @@ from typing import Dict
 from backend_app.db.connection import get_db
 from backend_app.schemas.auth import LoginRequest, LoginResponse, SignupRequest, RefreshTokenRequest
 from backend_app.services.auth import AuthService
-from backend_app.models.users import User
+from backend_app.repositories.user_repo import CachedUser
 
 router = APIRouter()
 
@@ -107,7 +107,7 @@ async def refresh_token(
 
 @router.get("/me")
 async def get_current_user(
-    current_user: User = Depends(AuthService.get_current_user)
+    current_user: CachedUser = Depends(AuthService.get_current_user)
 ):
     """Get current user information"""
     return {
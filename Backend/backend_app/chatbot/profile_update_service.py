@@ -6,8 +6,10 @@ Handle freshness logic and global profile updates
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import logging
+import time
 
 from backend_app.chatbot.config import settings
+from backend_app.chatbot.utils.timeutils import parse_timestamp, days_since
 
 
 class ProfileUpdateService:
@@ -47,17 +49,15 @@ class ProfileUpdateService:
         # Parse timestamp
         try:
             if isinstance(last_updated, str):
-                last_updated_dt = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-            else:
-                last_updated_dt = last_updated
+                last_updated = parse_timestamp(last_updated)
             
-            # Check if older than threshold
-            time_diff = datetime.utcnow() - last_updated_dt.replace(tzinfo=None)
-            should_update = time_diff.days > threshold_days
+            # Check if older than threshold (epoch arithmetic, no datetime/timedelta allocation)
+            days_old = days_since(last_updated)
+            should_update = days_old > threshold_days
             
             self.logger.debug(
-                f"Field {field}: last_updated={last_updated_dt}, "
-                f"diff={time_diff.days} days, should_update={should_update}"
+                f"Field {field}: last_updated={last_updated}, "
+                f"diff={days_old} days, should_update={should_update}"
             )
             
             return should_update
@@ -143,7 +143,7 @@ class ProfileUpdateService:
             ]
         
         freshness_status = {}
-        current_time = datetime.utcnow()
+        current_ts = time.time()
         
         for field in fields:
             last_updated_field = f"{field}_last_updated"
@@ -159,14 +159,11 @@ class ProfileUpdateService:
                 }
             else:
                 try:
-                    if isinstance(last_updated, str):
-                        last_updated_dt = datetime.fromisoformat(
-                            last_updated.replace('Z', '+00:00')
-                        )
-                    else:
-                        last_updated_dt = last_updated
+                    last_updated_value = last_updated
+                    if isinstance(last_updated_value, str):
+                        last_updated_value = parse_timestamp(last_updated_value)
                     
-                    days_old = (current_time - last_updated_dt.replace(tzinfo=None)).days
+                    days_old = days_since(last_updated_value, current_ts)
                     is_fresh = days_old <= self.freshness_days
                     should_update = not is_fresh
                     
@@ -6,6 +6,7 @@ AI responses, extracting intent, and handling chat completions.
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
 
@@ -16,6 +17,39 @@ from datetime import timedelta
 logger = logging.getLogger(__name__)
 
 
+def _keyword_re(*keywords: str) -> "re.Pattern[str]":
+    """Compile a substring alternation matching any of the keywords"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Stable intent-extraction instructions and examples. They are kept byte-for-byte
+# identical across calls and placed before the per-message part of the prompt,
+# so providers with prompt prefix caching can reuse them.
+_INTENT_SYSTEM_PROMPT = """Analyze the user message below and extract the intent and entities.
+
+Please respond with a JSON object containing:
+- intent: The primary intent (e.g., 'greeting', 'help', 'job_search', 'resume_upload', 'goodbye', 'unknown')
+- confidence: Confidence score (0.0 to 1.0)
+- entities: List of extracted entities (e.g., ['job_title', 'location', 'experience_level'])
+
+Example response:
+{
+  "intent": "job_search",
+  "confidence": 0.9,
+  "entities": ["software_engineer", "remote", "senior"]
+}
+"""
+
+# Fallback intent rules in priority order: (intent, confidence, keyword pattern)
+_SIMPLE_INTENT_RULES = (
+    ('greeting', 0.8, _keyword_re('hello', 'hi', 'hey', 'good morning', 'good afternoon')),
+    ('help', 0.8, _keyword_re('help', 'assist', 'guide', 'how to')),
+    ('goodbye', 0.8, _keyword_re('bye', 'goodbye', 'see you', 'later')),
+    ('job_search', 0.7, _keyword_re('job', 'work', 'position', 'career', 'employment')),
+    ('resume_upload', 0.7, _keyword_re('resume', 'cv', 'curriculum', 'profile'))
+)
+
+
 class LLMService:
     """
     LLM Service for AI-powered chatbot responses.
@@ -368,24 +402,11 @@ Response:
         Returns:
             str: Prepared prompt
         """
-        prompt = f"""
-Analyze the following user message and extract the intent and entities.
-
-Message: "{text}"
-
+        # Volatile parts go last so the shared prefix stays cacheable
+        prompt = f"""{_INTENT_SYSTEM_PROMPT}
 Context: {context or 'None'}
 
-Please respond with a JSON object containing:
-- intent: The primary intent (e.g., 'greeting', 'help', 'job_search', 'resume_upload', 'goodbye', 'unknown')
-- confidence: Confidence score (0.0 to 1.0)
-- entities: List of extracted entities (e.g., ['job_title', 'location', 'experience_level'])
-
-Example response:
-{{
-  "intent": "job_search",
-  "confidence": 0.9,
-  "entities": ["software_engineer", "remote", "senior"]
-}}
+Message: "{text}"
 """
         
         return prompt
@@ -573,25 +594,9 @@ Please provide the questions as a numbered list:
         """
         text_lower = text.lower()
         
-        # Greeting patterns
-        if any(word in text_lower for word in ['hello', 'hi', 'hey', 'good morning', 'good afternoon']):
-            return {'intent': 'greeting', 'confidence': 0.8, 'entities': [], 'text': text}
-        
-        # Help patterns
-        if any(word in text_lower for word in ['help', 'assist', 'guide', 'how to']):
-            return {'intent': 'help', 'confidence': 0.8, 'entities': [], 'text': text}
-        
-        # Goodbye patterns
-        if any(word in text_lower for word in ['bye', 'goodbye', 'see you', 'later']):
-            return {'intent': 'goodbye', 'confidence': 0.8, 'entities': [], 'text': text}
-        
-        # Job search patterns
-        if any(word in text_lower for word in ['job', 'work', 'position', 'career', 'employment']):
-            return {'intent': 'job_search', 'confidence': 0.7, 'entities': [], 'text': text}
-        
-        # Resume patterns
-        if any(word in text_lower for word in ['resume', 'cv', 'curriculum', 'profile']):
-            return {'intent': 'resume_upload', 'confidence': 0.7, 'entities': [], 'text': text}
+        for intent, confidence, pattern in _SIMPLE_INTENT_RULES:
+            if pattern.search(text_lower):
+                return {'intent': intent, 'confidence': confidence, 'entities': [], 'text': text}
         
         # Default
         return {'intent': 'unknown', 'confidence': 0.1, 'entities': [], 'text': text}
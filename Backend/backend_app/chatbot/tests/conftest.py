@@ -0,0 +1,32 @@
+"""
+Chatbot Test Fixtures
+Session-scoped fixtures shared across the chatbot test suite
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+
+@pytest.fixture(scope="session")
+def test_candidate_id():
+    """Candidate identifier shared by the test session"""
+    return str(uuid4())
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Mock current timestamp, computed once per test session"""
+    return datetime.utcnow()
+
+
+@pytest.fixture(scope="session")
+def fresh_date(now):
+    """10 days old - still fresh"""
+    return now - timedelta(days=10)
+
+
+@pytest.fixture(scope="session")
+def stale_date(now):
+    """35 days old - stale"""
+    return now - timedelta(days=35)
@@ -7,6 +7,19 @@ import pytest
 from uuid import uuid4
 
 
+def _build_large_kb(size):
+    """Build a mock knowledge base with `size` FAQ entries"""
+    return [
+        {
+            "id": f"faq-{i}",
+            "question": f"Question {i} about topic",
+            "answer": f"Answer {i} for the question",
+            "keywords": ["topic", f"question-{i}"]
+        }
+        for i in range(size)
+    ]
+
+
 class TestJDKB:
     """Test suite for JD knowledge base functionality"""
     
@@ -182,32 +195,18 @@ class TestJDKB:
         for norm in normalized:
             assert norm == expected_base
     
-    def test_kb_search_performance(self):
+    def test_kb_search_performance(self, benchmark):
         """Test knowledge base search performance"""
-        # Mock large knowledge base
-        large_kb = []
-        for i in range(1000):
-            large_kb.append({
-                "id": f"faq-{i}",
-                "question": f"Question {i} about topic",
-                "answer": f"Answer {i} for the question",
-                "keywords": [f"topic", f"question-{i}"]
-            })
-        
-        # Test search performance
-        import time
-        start_time = time.time()
-        
-        # Simple search
-        search_term = "topic"
-        results = [faq for faq in large_kb if search_term in faq["question"].lower()]
+        large_kb = _build_large_kb(1000)
         
-        end_time = time.time()
-        search_time = end_time - start_time
+        # Simple search, timed by pytest-benchmark (warmup + multiple rounds)
+        search_term = "topic"
+        results = benchmark(
+            lambda: [faq for faq in large_kb if search_term in faq["question"].lower()]
+        )
         
-        # Should find results quickly
+        # Should find results
         assert len(results) > 0
-        assert search_time < 1.0  # Should be much faster in practice
     
     def test_kb_update_functionality(self):
         """Test updating existing FAQ entries"""
@@ -0,0 +1,65 @@
+"""
+Test Chatbot Time Utilities
+Tests for the epoch helpers behind profile freshness checks
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from backend_app.chatbot.utils.timeutils import SECONDS_PER_DAY, days_since, to_epoch
+
+
+NOW = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+NOW_TS = NOW.timestamp()
+
+
+class TestToEpoch:
+    """Test suite for to_epoch"""
+    
+    def test_naive_datetime_is_utc(self):
+        """Test that a naive datetime converts as UTC"""
+        assert to_epoch(NOW.replace(tzinfo=None)) == NOW_TS
+    
+    def test_aware_datetime(self):
+        """Test that an aware datetime in another zone converts to the same instant"""
+        ist = NOW.astimezone(timezone(timedelta(hours=5, minutes=30)))
+        
+        assert to_epoch(ist) == NOW_TS
+    
+    def test_epoch_passthrough(self):
+        """Test that epoch seconds are returned unchanged"""
+        assert to_epoch(NOW_TS) == NOW_TS
+
+
+class TestDaysSince:
+    """Test suite for days_since around the day boundary"""
+    
+    def test_one_second_short_of_day(self):
+        """Test that a second short of 30 days counts as 29"""
+        assert days_since(NOW - timedelta(days=30) + timedelta(seconds=1), NOW_TS) == 29
+    
+    def test_exactly_day_boundary(self):
+        """Test that exactly 30 days counts as 30"""
+        assert days_since(NOW - timedelta(days=30), NOW_TS) == 30
+    
+    def test_one_second_past_day(self):
+        """Test that a second past 30 days still counts as 30"""
+        assert days_since(NOW - timedelta(days=30, seconds=1), NOW_TS) == 30
+    
+    def test_naive_timestamp(self):
+        """Test that naive timestamps are measured as UTC"""
+        assert days_since(NOW.replace(tzinfo=None) - timedelta(days=30), NOW_TS) == 30
+    
+    def test_epoch_timestamp(self):
+        """Test that epoch seconds are accepted"""
+        assert days_since(NOW_TS - 30 * SECONDS_PER_DAY, NOW_TS) == 30
+    
+    def test_matches_timedelta_days(self):
+        """Test that the result matches the datetime subtraction it replaces"""
+        for seconds in (-1, 0, 1, SECONDS_PER_DAY - 1, SECONDS_PER_DAY, 7 * SECONDS_PER_DAY + 5):
+            then = NOW - timedelta(seconds=seconds)
+            
+            assert days_since(then, NOW_TS) == (NOW - then).days
+    
+    def test_defaults_to_current_time(self):
+        """Test that now defaults to the current time"""
+        assert days_since(datetime.now(timezone.utc) - timedelta(days=2, hours=1)) == 2
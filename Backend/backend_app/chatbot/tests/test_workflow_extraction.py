@@ -0,0 +1,45 @@
+"""
+Test Workflow Information Extraction
+Tests for the profile-field patterns in WorkflowEngine
+"""
+
+import pytest
+
+from backend_app.chatbot.workflow_engine import WorkflowEngine
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Engine without its services; extraction doesn't use them"""
+    return WorkflowEngine.__new__(WorkflowEngine)
+
+
+class TestExtractInformation:
+    """Test suite for _extract_information"""
+    
+    def test_extracts_every_field(self, engine):
+        """Test that all fields are found in one message"""
+        message = "Hi, my name is Jane Doe, jane@example.com, 9876543210, 5 years experience"
+        
+        extracted = engine._extract_information(message, {})
+        
+        assert extracted["email"] == "jane@example.com"
+        assert extracted["phone"] == "9876543210"
+        assert extracted["name"].startswith("Jane Doe")
+        assert extracted["experience"] == 5
+    
+    def test_fields_starting_at_same_position(self, engine):
+        """Test that a phone number used as an email local part yields both fields"""
+        extracted = engine._extract_information("9876543210@gmail.com", {})
+        
+        assert extracted == {"email": "9876543210@gmail.com", "phone": "9876543210"}
+    
+    def test_keeps_first_occurrence(self, engine):
+        """Test that the first match of each field wins"""
+        extracted = engine._extract_information("a@b.com then c@d.org", {})
+        
+        assert extracted == {"email": "a@b.com"}
+    
+    def test_no_fields(self, engine):
+        """Test that a message without fields extracts nothing"""
+        assert engine._extract_information("hello there", {}) == {}
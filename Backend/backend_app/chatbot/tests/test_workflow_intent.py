@@ -0,0 +1,112 @@
+"""
+Test Workflow Intent Analysis
+Tests and benchmarks for the keyword intent patterns in WorkflowEngine
+"""
+
+import re
+import timeit
+
+import pytest
+
+from backend_app.chatbot.workflow_engine import WorkflowEngine, _INTENT_KEYWORDS
+
+
+# Candidate replies of typical chat lengths, from one word to a long paragraph
+REALISTIC_MESSAGES = (
+    "ready",
+    "ok next",
+    "hi there, my name is priya sharma and i have 4 years of work in sales ok",
+    "I've attached everything I had. Is there anything else you need from me before we move on?",
+    "i have been working as a backend engineer at a fintech startup for the last four years, mostly on "
+    "payment integrations and reconciliation services. before that i spent two years at a consulting firm "
+    "building internal tooling for clients in retail and logistics. i am looking for a role with more "
+    "ownership over system design, ideally in a product company based in bangalore or pune. my notice "
+    "period is sixty days and i can join sooner if required. let me know the next steps, thanks",
+    "sure, sounds good to me, talk soon",
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Engine without its services; intent analysis doesn't use them"""
+    return WorkflowEngine.__new__(WorkflowEngine)
+
+
+# The previous single lookahead-alternation scan, kept as a reference
+_LOOKAHEAD_RE = re.compile(
+    "(?=(?:" + "|".join(
+        f"(?P<{intent}>" + "|".join(map(re.escape, keywords)) + ")"
+        for intent, keywords in _INTENT_KEYWORDS
+    ) + "))"
+)
+_PRIORITY = {intent: rank for rank, (intent, _) in enumerate(_INTENT_KEYWORDS)}
+
+
+def _lookahead_intent(message_lower):
+    """Classify with the reference scan"""
+    best_intent, best_rank = None, len(_INTENT_KEYWORDS)
+    for match in _LOOKAHEAD_RE.finditer(message_lower):
+        rank = _PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            best_intent, best_rank = match.lastgroup, rank
+            if rank == 0:
+                break
+    return best_intent or "input_received"
+
+
+class TestAnalyzeMessageIntent:
+    """Test suite for _analyze_message_intent"""
+    
+    @pytest.mark.parametrize("message,intent", [
+        ("I'm done", "info_complete"),
+        ("How does this work?", "help"),
+        ("My name is Ravi", "info_provided"),
+        ("Ready when you are", "ready_to_proceed"),
+        ("sure, sounds good", "input_received"),
+    ])
+    def test_single_intent(self, engine, message, intent):
+        """Test that each intent is recognised from its keywords"""
+        assert engine._analyze_message_intent(message, {}) == intent
+    
+    def test_priority_order(self, engine):
+        """Test that the highest-priority intent wins regardless of position"""
+        message = "what else do you need? i am ready, please submit it"
+        
+        assert engine._analyze_message_intent(message, {}) == "info_complete"
+    
+    def test_matches_reference_scan(self, engine):
+        """Test that results match the previous lookahead scan"""
+        for message in REALISTIC_MESSAGES:
+            expected = _lookahead_intent(message.lower())
+            
+            assert engine._analyze_message_intent(message, {}) == expected
+    
+    def test_empty_message(self, engine):
+        """Test that an empty message has no intent"""
+        assert engine._analyze_message_intent("", {}) == "unknown"
+
+
+class TestIntentPerformance:
+    """Benchmarks for intent analysis on realistic message lengths"""
+    
+    def test_intent_benchmark(self, engine, benchmark):
+        """Benchmark intent analysis over the realistic message set"""
+        results = benchmark(
+            lambda: [engine._analyze_message_intent(message, {}) for message in REALISTIC_MESSAGES]
+        )
+        
+        assert len(results) == len(REALISTIC_MESSAGES)
+    
+    @pytest.mark.parametrize("message", REALISTIC_MESSAGES[2:], ids=lambda m: f"{len(m)}chars")
+    def test_faster_than_lookahead_scan(self, engine, message):
+        """Test that per-intent searches beat the lookahead scan on realistic messages"""
+        message_lower = message.lower()
+        
+        per_intent = min(timeit.repeat(
+            lambda: engine._analyze_message_intent(message, {}), number=500, repeat=5
+        ))
+        lookahead = min(timeit.repeat(
+            lambda: _lookahead_intent(message_lower), number=500, repeat=5
+        ))
+        
+        assert per_intent < lookahead
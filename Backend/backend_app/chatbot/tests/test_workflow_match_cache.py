@@ -0,0 +1,57 @@
+"""
+Test Workflow Match Response Cache
+Tests that cached matching replies stay within their session
+"""
+
+import pytest
+
+from backend_app.chatbot import workflow_engine
+from backend_app.chatbot.workflow_engine import WorkflowEngine, _ResponseCache
+
+
+PROFILE = {"current_role": "Backend Engineer", "experience": 5, "skills": ["Python", "SQL"]}
+
+
+@pytest.fixture
+def match_calls(monkeypatch):
+    """Contexts the matcher was run for; it replies with the candidate's name"""
+    calls = []
+    
+    async def match_profile(self, context):
+        calls.append(context)
+        return f"Matches for {context['name']}"
+    
+    monkeypatch.setattr(workflow_engine, "_match_response_cache", _ResponseCache())
+    monkeypatch.setattr(WorkflowEngine, "_match_profile", match_profile)
+    return calls
+
+
+@pytest.fixture
+def engine(match_calls):
+    """Engine without its services; matching doesn't use them"""
+    return WorkflowEngine.__new__(WorkflowEngine)
+
+
+class TestMatchResponseCache:
+    """Test suite for the match response cache"""
+    
+    @pytest.mark.asyncio
+    async def test_not_shared_between_sessions(self, engine, match_calls):
+        """Test that another user's session with the same profile gets its own reply"""
+        first = await engine._process_information("session-a", "", {**PROFILE, "name": "Asha"})
+        second = await engine._process_information("session-b", "", {**PROFILE, "name": "Ravi"})
+        
+        assert first == "Matches for Asha"
+        assert second == "Matches for Ravi"
+        assert len(match_calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_reused_within_session(self, engine, match_calls):
+        """Test that the same session and profile reuse the cached reply"""
+        context = {**PROFILE, "name": "Asha"}
+        
+        await engine._process_information("session-a", "", context)
+        reply = await engine._process_information("session-a", "", {**context, "skills": ["sql", "python"]})
+        
+        assert reply == "Matches for Asha"
+        assert len(match_calls) == 1
@@ -1,49 +1,53 @@
 """
 Chatbot Utilities Package
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+callers that only need a time helper don't pay for zipfile/logging setup.
 """
 
-from .logging import ChatbotLogger, setup_chatbot_logging
-from .timeutils import (
-    get_utc_now,
-    format_timestamp,
-    parse_timestamp,
-    is_fresh,
-    add_days,
-    get_age_in_days
-)
-from .fileutils import (
-    create_export_zip,
-    get_file_size_mb,
-    ensure_directory,
-    get_file_extension,
-    is_allowed_file_type,
-    cleanup_temp_files,
-    get_file_mime_type,
-    validate_file_size,
-    sanitize_filename
-)
-
-__all__ = [
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
     # Logging
-    'ChatbotLogger',
-    'setup_chatbot_logging',
-    
+    'ChatbotLogger': '.logging',
+    'setup_chatbot_logging': '.logging',
+
     # Time utilities
-    'get_utc_now',
-    'format_timestamp',
-    'parse_timestamp',
-    'is_fresh',
-    'add_days',
-    'get_age_in_days',
-    
+    'get_utc_now': '.timeutils',
+    'format_timestamp': '.timeutils',
+    'parse_timestamp': '.timeutils',
+    'is_fresh': '.timeutils',
+    'to_epoch': '.timeutils',
+    'days_since': '.timeutils',
+    'add_days': '.timeutils',
+    'get_age_in_days': '.timeutils',
+
     # File utilities
-    'create_export_zip',
-    'get_file_size_mb',
-    'ensure_directory',
-    'get_file_extension',
-    'is_allowed_file_type',
-    'cleanup_temp_files',
-    'get_file_mime_type',
-    'validate_file_size',
-    'sanitize_filename'
-]
\ No newline at end of file
+    'create_export_zip': '.fileutils',
+    'get_file_size_mb': '.fileutils',
+    'ensure_directory': '.fileutils',
+    'get_file_extension': '.fileutils',
+    'is_allowed_file_type': '.fileutils',
+    'cleanup_temp_files': '.fileutils',
+    'get_file_mime_type': '.fileutils',
+    'validate_file_size': '.fileutils',
+    'sanitize_filename': '.fileutils'
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
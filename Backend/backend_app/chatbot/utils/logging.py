@@ -2,12 +2,20 @@
 Chatbot Logging Utilities
 """
 
+import atexit
 import logging
-import json
-from datetime import datetime
+import logging.handlers
+import threading
+import time
 from typing import Dict, Any, Optional
 
 
+# File log buffering: records are flushed in batches, immediately on ERROR,
+# and at least every _LOG_FLUSH_INTERVAL_SECONDS by a background thread
+_LOG_BUFFER_CAPACITY = 500
+_LOG_FLUSH_INTERVAL_SECONDS = 30
+
+
 class ChatbotLogger:
     """Enhanced logging for chatbot operations"""
     
@@ -16,19 +24,22 @@ class ChatbotLogger:
         
     def log_session_start(self, session_id: str, user_id: str, platform: str):
         """Log session start"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Session started",
             extra={
                 "session_id": session_id,
                 "user_id": user_id,
                 "platform": platform,
-                "timestamp": datetime.utcnow().isoformat(),
                 "event_type": "session_start"
             }
         )
     
     def log_message(self, session_id: str, message: str, direction: str, message_type: str = "text"):
         """Log message exchange"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             f"Message {direction}",
             extra={
@@ -36,13 +47,14 @@ class ChatbotLogger:
                 "message": message,
                 "direction": direction,
                 "message_type": message_type,
-                "timestamp": datetime.utcnow().isoformat(),
                 "event_type": "message"
             }
         )
     
     def log_prescreen_answer(self, application_id: str, qid: str, answer: str, score: int):
         """Log prescreen answer processing"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Prescreen answer processed",
             extra={
@@ -50,13 +62,14 @@ class ChatbotLogger:
                 "qid": qid,
                 "answer": answer,
                 "score": score,
-                "timestamp": datetime.utcnow().isoformat(),
                 "event_type": "prescreen_answer"
             }
         )
     
     def log_export_job(self, export_job_id: str, job_id: str, status: str, details: Optional[Dict[str, Any]] = None):
         """Log export job status"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             f"Export job {status}",
             extra={
@@ -64,18 +77,18 @@ class ChatbotLogger:
                 "job_id": job_id,
                 "status": status,
                 "details": details or {},
-                "timestamp": datetime.utcnow().isoformat(),
                 "event_type": "export_job"
             }
         )
     
     def log_error(self, error_message: str, context: Optional[Dict[str, Any]] = None):
         """Log error with context"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         self.logger.error(
             error_message,
             extra={
                 "context": context or {},
-                "timestamp": datetime.utcnow().isoformat(),
                 "event_type": "error"
             }
         )
@@ -83,23 +96,57 @@ class ChatbotLogger:
 
 def setup_chatbot_logging():
     """Setup chatbot-specific logging configuration"""
-    # Configure formatter
+    chatbot_logger = logging.getLogger('chatbot')
+    if any(isinstance(h, logging.handlers.MemoryHandler) for h in chatbot_logger.handlers):
+        # Already configured; adding handlers again would duplicate every record
+        return chatbot_logger
+    
+    # Configure formatter; the UTC timestamp comes from LogRecord.created
     formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        '%(asctime)s.%(msecs)03dZ - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%dT%H:%M:%S'
     )
+    formatter.converter = time.gmtime
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     
-    # File handler for chatbot logs
+    # File handler for chatbot logs, buffered to batch disk writes
     file_handler = logging.FileHandler('logs/chatbot.log')
     file_handler.setFormatter(formatter)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    buffered_handler.setFormatter(formatter)
+    _start_periodic_flush(buffered_handler)
     
     # Configure chatbot logger
-    chatbot_logger = logging.getLogger('chatbot')
     chatbot_logger.setLevel(logging.INFO)
     chatbot_logger.addHandler(console_handler)
-    chatbot_logger.addHandler(file_handler)
+    chatbot_logger.addHandler(buffered_handler)
+    
+    return chatbot_logger
+
+
+def _start_periodic_flush(handler: logging.handlers.MemoryHandler) -> None:
+    """
+    Flush a buffered handler on a daemon thread so quiet periods still reach disk.
+    
+    The thread is kept on the handler so each handler gets exactly one, and the
+    buffer is flushed once more at interpreter exit.
+    """
+    if getattr(handler, "_flush_thread", None) is not None:
+        return
+    
+    def _flush_loop():
+        # close() clears the target, which ends the loop
+        while handler.target is not None:
+            time.sleep(_LOG_FLUSH_INTERVAL_SECONDS)
+            handler.flush()
     
-    return chatbot_logger
\ No newline at end of file
+    handler._flush_thread = threading.Thread(target=_flush_loop, name="chatbot-log-flush", daemon=True)
+    handler._flush_thread.start()
+    atexit.register(handler.flush)
\ No newline at end of file
@@ -2,8 +2,13 @@
 Chatbot Time Utilities
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+
+
+SECONDS_PER_DAY = 86400
 
 
 def get_utc_now() -> datetime:
@@ -11,14 +16,19 @@ def get_utc_now() -> datetime:
     return datetime.utcnow()
 
 
-def format_timestamp(dt: datetime) -> str:
-    """Format datetime as ISO string"""
-    return dt.isoformat()
+# Format datetime as ISO string; bound to the C method to skip a Python frame
+format_timestamp = datetime.isoformat
 
 
-def parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime"""
-    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+if sys.version_info >= (3, 11):
+    # fromisoformat parses a trailing 'Z' natively, so bind the C method directly
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(timestamp_str: str) -> datetime:
+        """Parse ISO timestamp string to datetime"""
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp_str)
 
 
 def is_fresh(timestamp: datetime, freshness_days: int = 30) -> bool:
@@ -26,6 +36,22 @@ def is_fresh(timestamp: datetime, freshness_days: int = 30) -> bool:
     return (get_utc_now() - timestamp).days < freshness_days
 
 
+def to_epoch(timestamp: Union[datetime, float]) -> float:
+    """Convert datetime (naive values are treated as UTC) or epoch seconds to epoch seconds"""
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+    return timestamp
+
+
+def days_since(timestamp: Union[datetime, float], now: Optional[float] = None) -> int:
+    """Whole days elapsed since timestamp (datetime or epoch seconds), up to now (epoch seconds)"""
+    if now is None:
+        now = time.time()
+    return int((now - to_epoch(timestamp)) // SECONDS_PER_DAY)
+
+
 def add_days(dt: datetime, days: int) -> datetime:
     """Add days to datetime"""
     return dt + timedelta(days=days)
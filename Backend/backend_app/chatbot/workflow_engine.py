@@ -3,15 +3,24 @@ Chatbot Workflow Engine
 Main dispatcher & state transitions for chatbot functionality
 """
 
-from typing import Dict, Any, Optional, List
+import functools
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Hashable, Mapping, Optional, List, Tuple
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 
 from backend_app.chatbot.models.session_model import UserRole, ConversationState
 from backend_app.chatbot.services.message_router import MessageRouter
 from backend_app.chatbot.services.llm_service import LLMService
 from backend_app.chatbot.services.skill_registry import SkillRegistry
 
+logger = logging.getLogger(__name__)
+
 
 class WorkflowState(Enum):
     """Workflow states for chatbot conversations"""
@@ -24,41 +33,238 @@ class WorkflowState(Enum):
     ERROR = "error"
 
 
+# Valid state transitions, built once at import time
+_EMPTY_TRANSITIONS: FrozenSet[str] = frozenset()
+_STATE_TRANSITIONS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    WorkflowState.INITIALIZED.value: frozenset({WorkflowState.ONBOARDING.value}),
+    WorkflowState.ONBOARDING.value: frozenset({
+        WorkflowState.COLLECTING_INFO.value,
+        WorkflowState.PROCESSING.value,
+        WorkflowState.ERROR.value
+    }),
+    WorkflowState.COLLECTING_INFO.value: frozenset({
+        WorkflowState.PROCESSING.value,
+        WorkflowState.WAITING_FOR_INPUT.value,
+        WorkflowState.ERROR.value
+    }),
+    WorkflowState.PROCESSING.value: frozenset({
+        WorkflowState.WAITING_FOR_INPUT.value,
+        WorkflowState.COMPLETED.value,
+        WorkflowState.ERROR.value
+    }),
+    WorkflowState.WAITING_FOR_INPUT.value: frozenset({
+        WorkflowState.PROCESSING.value,
+        WorkflowState.COMPLETED.value,
+        WorkflowState.ERROR.value
+    }),
+    WorkflowState.COMPLETED.value: _EMPTY_TRANSITIONS,
+    WorkflowState.ERROR.value: frozenset({WorkflowState.INITIALIZED.value})
+})
+
+
+# Next state per current state: (intent -> next state, default next state).
+# States not listed here move to a fixed state regardless of intent.
+_NEXT_STATE_RULES: Mapping[str, Any] = MappingProxyType({
+    WorkflowState.ONBOARDING.value: ({
+        "info_provided": WorkflowState.COLLECTING_INFO.value,
+        "ready_to_proceed": WorkflowState.COLLECTING_INFO.value,
+        "help": WorkflowState.WAITING_FOR_INPUT.value
+    }, WorkflowState.ONBOARDING.value),
+    WorkflowState.COLLECTING_INFO.value: ({
+        "info_complete": WorkflowState.PROCESSING.value,
+        "more_info_needed": WorkflowState.WAITING_FOR_INPUT.value
+    }, WorkflowState.COLLECTING_INFO.value),
+    WorkflowState.PROCESSING.value: ({
+        "processing_complete": WorkflowState.COMPLETED.value
+    }, WorkflowState.PROCESSING.value),
+    WorkflowState.WAITING_FOR_INPUT.value: ({
+        "input_received": WorkflowState.PROCESSING.value
+    }, WorkflowState.WAITING_FOR_INPUT.value)
+})
+_FIXED_NEXT_STATE: Mapping[str, str] = MappingProxyType({
+    # If current state is error, always go back to initialized
+    WorkflowState.ERROR.value: WorkflowState.INITIALIZED.value,
+    WorkflowState.INITIALIZED.value: WorkflowState.ONBOARDING.value,
+    WorkflowState.COMPLETED.value: WorkflowState.COMPLETED.value
+})
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, trim and collapse whitespace so equivalent inputs compare equal"""
+    return _WHITESPACE_RE.sub(' ', text.strip().lower())
+
+
+# Intent keywords in priority order: when a message matches several intents,
+# the earliest entry wins
+_INTENT_KEYWORDS = (
+    ("info_complete", ("done", "completed", "finished", "that's all", "submit", "send")),
+    ("help", ("help", "how", "what", "why", "don't understand")),
+    ("info_provided", ("my name is", "i am", "email", "phone", "ctc", "experience")),
+    ("ready_to_proceed", ("ready", "proceed", "continue", "next")),
+    ("more_info_needed", ("what else", "anything else", "more information")),
+)
+
+# One plain keyword alternation per intent, searched in priority order
+_INTENT_PATTERNS = tuple(
+    (intent, re.compile("|".join(map(re.escape, keywords))))
+    for intent, keywords in _INTENT_KEYWORDS
+)
+
+
+# Information extraction patterns (simple regex-based; in production, use NLP)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'(\+\d{1,3}[- ]?)?\d{10}')
+_NAME_RE = re.compile(r'name is ([A-Za-z\s]+)', re.IGNORECASE)
+_EXPERIENCE_RE = re.compile(r'(\d+)\s*years?\s*experience', re.IGNORECASE)
+
+# Profile fields gathered during the collecting_info state
+_REQUIRED_FIELDS = ("name", "email", "phone", "current_role", "experience")
+
+
+# Static responses, built once at import time
+_ONBOARDING_CANDIDATE = (
+    "Welcome to the AI Recruitment Assistant! 🎯\n\n"
+    "I'll help you find the perfect job opportunities. "
+    "Let's start by collecting some basic information about you.\n\n"
+    "Please provide the following:\n"
+    "1. Your full name\n"
+    "2. Email address\n"
+    "3. Phone number\n"
+    "4. Current role/position\n"
+    "5. Years of experience\n\n"
+    "You can provide this information one at a time or all together. "
+    "How would you like to proceed?"
+)
+_ONBOARDING_RECRUITER = (
+    "Welcome Recruiter! 👋\n\n"
+    "I'll help you manage candidates and job postings. "
+    "What would you like to do today?\n\n"
+    "Available options:\n"
+    "- Create a new job posting\n"
+    "- View candidates for a job\n"
+    "- Send outreach to candidates\n"
+    "- Export candidate data"
+)
+_WAITING_RESPONSE = (
+    "I'm ready when you are! Please provide the information or let me know "
+    "what you'd like to do next.\n\n"
+    "You can:\n"
+    "- Answer the questions I asked\n"
+    "- Ask me a question\n"
+    "- Request help with something specific"
+)
+_ERROR_STATE_RESPONSE = (
+    "I apologize, but I encountered an error. Let's start over. How can I help you today?"
+)
+_STEP_FAILED_RESPONSE = "An error occurred while processing your request."
+_UNKNOWN_STATE_RESPONSE = (
+    "I'm not sure how to proceed. Can you please provide more information?"
+)
+_COMPLETION_RESPONSE = (
+    "Excellent! 🎉\n\n"
+    "I've successfully processed your information. Here's what happens next:\n\n"
+    "1. Your profile has been updated in our system\n"
+    "2. You've been matched with suitable job opportunities\n"
+    "3. Our recruiters will review your profile\n"
+    "4. You'll be contacted for suitable matches\n\n"
+    "Is there anything else I can help you with today?"
+)
+
+
+# Profile fields that decide the matching result, and so key its cache
+_MATCH_KEY_FIELDS = ("current_role", "experience", "skills")
+
+
+class _ResponseCache:
+    """Bounded LRU cache whose entries also expire after a fixed TTL"""
+    
+    __slots__ = ("_entries", "_max_entries", "_ttl")
+    
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600.0):
+        self._entries: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _match_cache_key(session_id: str, context: Dict[str, Any]) -> bytes:
+    """Hash the session and the profile's normalized matching fields into an order-insensitive key"""
+    parts = [str(session_id)]
+    for field in _MATCH_KEY_FIELDS:
+        value = context.get(field)
+        if value is None:
+            parts.append("")
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            parts.append(",".join(sorted(_normalize(str(item)) for item in value)))
+        else:
+            parts.append(_normalize(str(value)))
+    return hashlib.sha256("\x1f".join(parts).encode()).digest()
+
+
+# Shared across engines; keys include the session, so a reply is only ever
+# reused for the conversation it was built for
+_match_response_cache = _ResponseCache()
+
+
+# Services are shared by every engine instead of being rebuilt per request
+@functools.cache
+def _message_router() -> MessageRouter:
+    return MessageRouter()
+
+
+@functools.cache
+def _llm_service() -> LLMService:
+    return LLMService()
+
+
+@functools.cache
+def _skill_registry() -> SkillRegistry:
+    return SkillRegistry()
+
+
 class WorkflowEngine:
     """Main workflow engine for chatbot state management and transitions"""
     
-    def __init__(self):
-        self.message_router = MessageRouter()
-        self.llm_service = LLMService()
-        self.skill_registry = SkillRegistry()
-        self.state_transitions = self._initialize_state_transitions()
+    __slots__ = (
+        "message_router",
+        "llm_service",
+        "skill_registry",
+        "_state_handlers",
+        "_async_state_handlers"
+    )
     
-    def _initialize_state_transitions(self) -> Dict[str, List[str]]:
-        """Initialize valid state transitions"""
-        return {
-            WorkflowState.INITIALIZED.value: [WorkflowState.ONBOARDING.value],
-            WorkflowState.ONBOARDING.value: [
-                WorkflowState.COLLECTING_INFO.value,
-                WorkflowState.PROCESSING.value,
-                WorkflowState.ERROR.value
-            ],
-            WorkflowState.COLLECTING_INFO.value: [
-                WorkflowState.PROCESSING.value,
-                WorkflowState.WAITING_FOR_INPUT.value,
-                WorkflowState.ERROR.value
-            ],
-            WorkflowState.PROCESSING.value: [
-                WorkflowState.WAITING_FOR_INPUT.value,
-                WorkflowState.COMPLETED.value,
-                WorkflowState.ERROR.value
-            ],
-            WorkflowState.WAITING_FOR_INPUT.value: [
-                WorkflowState.PROCESSING.value,
-                WorkflowState.COMPLETED.value,
-                WorkflowState.ERROR.value
-            ],
-            WorkflowState.COMPLETED.value: [],
-            WorkflowState.ERROR.value: [WorkflowState.INITIALIZED.value]
+    def __init__(self):
+        self.message_router = _message_router()
+        self.llm_service = _llm_service()
+        self.skill_registry = _skill_registry()
+        self._state_handlers = {
+            WorkflowState.ONBOARDING.value: self._process_onboarding,
+            WorkflowState.WAITING_FOR_INPUT.value: self._process_waiting_for_input,
+            WorkflowState.COMPLETED.value: self._process_completion
+        }
+        # Handlers that will call out to the LLM/matching services
+        self._async_state_handlers = {
+            WorkflowState.COLLECTING_INFO.value: self._process_info_collection,
+            WorkflowState.PROCESSING.value: self._process_information
         }
     
     async def process_workflow_step(
@@ -80,9 +286,12 @@ class WorkflowEngine:
         Returns:
             Dict containing next_state, response, and updated context
         """
+        # One timestamp per step, shared by the context and the reply
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
         try:
             # Determine next state based on current state and message
-            next_state = await self._determine_next_state(
+            next_state = self._determine_next_state(
                 current_state, message, context
             )
             
@@ -92,26 +301,31 @@ class WorkflowEngine:
             )
             
             # Update context
-            updated_context = await self._update_context(
-                context, next_state, response
+            updated_context = self._update_context(
+                context, next_state, response, now_iso
             )
             
             return {
                 "next_state": next_state,
                 "response": response,
                 "context": updated_context,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso
             }
             
-        except Exception as e:
+        except Exception:
+            # Keep the traceback for diagnosis; the user gets a fixed reply
+            logger.exception(
+                "Workflow step failed",
+                extra={"session_id": session_id, "state": current_state}
+            )
             return {
                 "next_state": WorkflowState.ERROR.value,
-                "response": f"An error occurred: {str(e)}",
+                "response": _STEP_FAILED_RESPONSE,
                 "context": context,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso
             }
     
-    async def _determine_next_state(
+    def _determine_next_state(
         self,
         current_state: str,
         message: str,
@@ -119,90 +333,33 @@ class WorkflowEngine:
     ) -> str:
         """Determine the next workflow state"""
         
-        # If current state is error, always go back to initialized
-        if current_state == WorkflowState.ERROR.value:
-            return WorkflowState.INITIALIZED.value
+        fixed_state = _FIXED_NEXT_STATE.get(current_state)
+        if fixed_state is not None:
+            return fixed_state
+        
+        rules = _NEXT_STATE_RULES.get(current_state)
+        if rules is None:
+            # Default fallback
+            return current_state
         
         # Analyze message intent
-        intent = await self._analyze_message_intent(message, context)
-        
-        # State-specific logic
-        if current_state == WorkflowState.INITIALIZED.value:
-            return WorkflowState.ONBOARDING.value
-        
-        elif current_state == WorkflowState.ONBOARDING.value:
-            if intent in ["info_provided", "ready_to_proceed"]:
-                return WorkflowState.COLLECTING_INFO.value
-            elif intent == "help":
-                return WorkflowState.WAITING_FOR_INPUT.value
-            else:
-                return WorkflowState.ONBOARDING.value
-        
-        elif current_state == WorkflowState.COLLECTING_INFO.value:
-            if intent == "info_complete":
-                return WorkflowState.PROCESSING.value
-            elif intent == "more_info_needed":
-                return WorkflowState.WAITING_FOR_INPUT.value
-            else:
-                return WorkflowState.COLLECTING_INFO.value
-        
-        elif current_state == WorkflowState.PROCESSING.value:
-            if intent == "processing_complete":
-                return WorkflowState.COMPLETED.value
-            else:
-                return WorkflowState.PROCESSING.value
-        
-        elif current_state == WorkflowState.WAITING_FOR_INPUT.value:
-            if intent == "input_received":
-                return WorkflowState.PROCESSING.value
-            else:
-                return WorkflowState.WAITING_FOR_INPUT.value
-        
-        elif current_state == WorkflowState.COMPLETED.value:
-            return WorkflowState.COMPLETED.value
-        
-        # Default fallback
-        return current_state
+        intent = self._analyze_message_intent(message, context)
+        transitions, default_state = rules
+        return transitions.get(intent, default_state)
     
-    async def _analyze_message_intent(
+    def _analyze_message_intent(
         self,
         message: str,
         context: Dict[str, Any]
     ) -> str:
         """Analyze message intent using LLM"""
         
-        # Simple intent analysis based on keywords
-        message_lower = message.lower().strip()
-        
-        # Completion indicators
-        if any(word in message_lower for word in [
-            "done", "completed", "finished", "that's all", "submit", "send"
-        ]):
-            return "info_complete"
-        
-        # Help indicators
-        if any(word in message_lower for word in [
-            "help", "how", "what", "why", "don't understand"
-        ]):
-            return "help"
-        
-        # Information provision indicators
-        if any(word in message_lower for word in [
-            "my name is", "i am", "email", "phone", "ctc", "experience"
-        ]):
-            return "info_provided"
-        
-        # Ready indicators
-        if any(word in message_lower for word in [
-            "ready", "proceed", "continue", "next"
-        ]):
-            return "ready_to_proceed"
-        
-        # More info needed
-        if any(word in message_lower for word in [
-            "what else", "anything else", "more information"
-        ]):
-            return "more_info_needed"
+        # Keyword intent analysis; the first intent with a keyword wins
+        message_lower = _normalize(message)
+        
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(message_lower):
+                return intent
         
         # Input received
         if message and len(message) > 0:
@@ -219,29 +376,23 @@ class WorkflowEngine:
     ) -> str:
         """Process a specific state step"""
         
-        if state == WorkflowState.ONBOARDING.value:
-            return await self._process_onboarding(session_id, context)
+        handler = self._state_handlers.get(state)
+        if handler is not None:
+            return handler(session_id, message, context)
         
-        elif state == WorkflowState.COLLECTING_INFO.value:
-            return await self._process_info_collection(session_id, message, context)
+        async_handler = self._async_state_handlers.get(state)
+        if async_handler is not None:
+            return await async_handler(session_id, message, context)
         
-        elif state == WorkflowState.PROCESSING.value:
-            return await self._process_information(session_id, context)
+        if state == WorkflowState.ERROR.value:
+            return _ERROR_STATE_RESPONSE
         
-        elif state == WorkflowState.WAITING_FOR_INPUT.value:
-            return await self._process_waiting_for_input(session_id, context)
-        
-        elif state == WorkflowState.COMPLETED.value:
-            return await self._process_completion(session_id, context)
-        
-        elif state == WorkflowState.ERROR.value:
-            return "I apologize, but I encountered an error. Let's start over. How can I help you today?"
-        
-        return "I'm not sure how to proceed. Can you please provide more information?"
+        return _UNKNOWN_STATE_RESPONSE
     
-    async def _process_onboarding(
+    def _process_onboarding(
         self,
         session_id: str,
+        message: str,
         context: Dict[str, Any]
     ) -> str:
         """Process onboarding state"""
@@ -249,30 +400,8 @@ class WorkflowEngine:
         user_role = context.get("user_role", "candidate")
         
         if user_role == "candidate":
-            return (
-                "Welcome to the AI Recruitment Assistant! 🎯\n\n"
-                "I'll help you find the perfect job opportunities. "
-                "Let's start by collecting some basic information about you.\n\n"
-                "Please provide the following:\n"
-                "1. Your full name\n"
-                "2. Email address\n"
-                "3. Phone number\n"
-                "4. Current role/position\n"
-                "5. Years of experience\n\n"
-                "You can provide this information one at a time or all together. "
-                "How would you like to proceed?"
-            )
-        else:
-            return (
-                "Welcome Recruiter! 👋\n\n"
-                "I'll help you manage candidates and job postings. "
-                "What would you like to do today?\n\n"
-                "Available options:\n"
-                "- Create a new job posting\n"
-                "- View candidates for a job\n"
-                "- Send outreach to candidates\n"
-                "- Export candidate data"
-            )
+            return _ONBOARDING_CANDIDATE
+        return _ONBOARDING_RECRUITER
     
     async def _process_info_collection(
         self,
@@ -283,14 +412,16 @@ class WorkflowEngine:
         """Process information collection state"""
         
         # Extract information from message
-        extracted_info = await self._extract_information(message, context)
+        extracted_info = self._extract_information(message, context)
         
-        # Update context with extracted info
-        context.update(extracted_info)
+        # Update context with extracted info (usually nothing was found)
+        if extracted_info:
+            context.update(extracted_info)
         
-        # Check if we have all required information
-        required_fields = ["name", "email", "phone", "current_role", "experience"]
-        collected_fields = [field for field in required_fields if field in context]
+        # Check if we have all required information, in one pass
+        collected_fields, missing_fields = [], []
+        for field in _REQUIRED_FIELDS:
+            (collected_fields if field in context else missing_fields).append(field)
         
         if len(collected_fields) >= 3:
             return (
@@ -302,7 +433,6 @@ class WorkflowEngine:
                 f"with finding suitable job opportunities?"
             )
         else:
-            missing_fields = [field for field in required_fields if field not in context]
             return (
                 f"I've collected some information. Please provide:\n"
                 f"- {', '.join(missing_fields[:2])}\n\n"
@@ -312,10 +442,21 @@ class WorkflowEngine:
     async def _process_information(
         self,
         session_id: str,
+        message: str,
         context: Dict[str, Any]
     ) -> str:
         """Process collected information"""
         
+        cache_key = _match_cache_key(session_id, context)
+        response = _match_response_cache.get(cache_key)
+        if response is None:
+            response = await self._match_profile(context)
+            _match_response_cache.put(cache_key, response)
+        return response
+    
+    async def _match_profile(self, context: Dict[str, Any]) -> str:
+        """Run profile matching and build the reply"""
+        
         # This is where you would integrate with matching algorithms
         # For now, return a placeholder response
         
@@ -329,40 +470,27 @@ class WorkflowEngine:
             "3. Browse available jobs"
         )
     
-    async def _process_waiting_for_input(
+    def _process_waiting_for_input(
         self,
         session_id: str,
+        message: str,
         context: Dict[str, Any]
     ) -> str:
         """Process waiting for user input"""
         
-        return (
-            "I'm ready when you are! Please provide the information or let me know "
-            "what you'd like to do next.\n\n"
-            "You can:\n"
-            "- Answer the questions I asked\n"
-            "- Ask me a question\n"
-            "- Request help with something specific"
-        )
+        return _WAITING_RESPONSE
     
-    async def _process_completion(
+    def _process_completion(
         self,
         session_id: str,
+        message: str,
         context: Dict[str, Any]
     ) -> str:
         """Process workflow completion"""
         
-        return (
-            "Excellent! 🎉\n\n"
-            "I've successfully processed your information. Here's what happens next:\n\n"
-            "1. Your profile has been updated in our system\n"
-            "2. You've been matched with suitable job opportunities\n"
-            "3. Our recruiters will review your profile\n"
-            "4. You'll be contacted for suitable matches\n\n"
-            "Is there anything else I can help you with today?"
-        )
+        return _COMPLETION_RESPONSE
     
-    async def _extract_information(
+    def _extract_information(
         self,
         message: str,
         context: Dict[str, Any]
@@ -371,52 +499,47 @@ class WorkflowEngine:
         
         extracted = {}
         
-        # Simple regex-based extraction (in production, use NLP)
-        import re
-        
         # Extract email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', message)
+        email_match = _EMAIL_RE.search(message)
         if email_match:
             extracted['email'] = email_match.group()
         
         # Extract phone (simple pattern)
-        phone_match = re.search(r'(\+\d{1,3}[- ]?)?\d{10}', message)
+        phone_match = _PHONE_RE.search(message)
         if phone_match:
             extracted['phone'] = phone_match.group()
         
         # Extract name (simple heuristic)
-        if 'name is' in message.lower():
-            name_match = re.search(r'name is ([A-Za-z\s]+)', message, re.IGNORECASE)
-            if name_match:
-                extracted['name'] = name_match.group(1).strip()
+        name_match = _NAME_RE.search(message)
+        if name_match:
+            extracted['name'] = name_match.group(1).strip()
         
         # Extract experience
-        exp_match = re.search(r'(\d+)\s*years?\s*experience', message, re.IGNORECASE)
+        exp_match = _EXPERIENCE_RE.search(message)
         if exp_match:
             extracted['experience'] = int(exp_match.group(1))
         
         return extracted
     
-    async def _update_context(
+    def _update_context(
         self,
         context: Dict[str, Any],
         state: str,
-        response: str
+        response: str,
+        now_iso: str
     ) -> Dict[str, Any]:
-        """Update workflow context"""
+        """Update workflow context in place and return it"""
         
-        updated_context = context.copy()
-        updated_context['last_state'] = state
-        updated_context['last_response'] = response
-        updated_context['updated_at'] = datetime.utcnow().isoformat()
+        context['last_state'] = state
+        context['last_response'] = response
+        context['updated_at'] = now_iso
         
-        return updated_context
+        return context
     
-    def get_valid_transitions(self, state: str) -> List[str]:
+    def get_valid_transitions(self, state: str) -> FrozenSet[str]:
         """Get valid transitions from a given state"""
-        return self.state_transitions.get(state, [])
+        return _STATE_TRANSITIONS.get(state, _EMPTY_TRANSITIONS)
     
     def is_valid_transition(self, from_state: str, to_state: str) -> bool:
         """Check if a state transition is valid"""
-        valid_transitions = self.get_valid_transitions(from_state)
-        return to_state in valid_transitions
\ No newline at end of file
+        return to_state in _STATE_TRANSITIONS.get(from_state, _EMPTY_TRANSITIONS)
\ No newline at end of file
@@ -3,14 +3,20 @@ Telegram Bot Configuration
 Secure configuration management for Telegram bot integration
 """
 
+import html
 import os
+import re
 import logging
 from typing import Optional
+from urllib.parse import urlparse
 from pydantic import BaseModel, Field, validator
 from pydantic_settings import BaseSettings
 
 logger = logging.getLogger(__name__)
 
+# Telegram bot tokens are typically in format: 123456789:ABCdefGHIjklMNOpqrsTUVwxYZ123abc456
+_TOKEN_RE = re.compile(r'^\d+:[A-Za-z0-9_-]{35}$')
+
 
 class TelegramSettings(BaseSettings):
     """Telegram bot configuration settings"""
@@ -95,16 +101,12 @@ class TelegramSettings(BaseSettings):
     @staticmethod
     def _is_valid_token(token: str) -> bool:
         """Check if token follows Telegram bot token format"""
-        # Telegram bot tokens are typically in format: 123456789:ABCdefGHIjklMNOpqrsTUVwxYZ123abc456
-        import re
-        pattern = r'^\d+:[A-Za-z0-9_-]{35}$'
-        return bool(re.match(pattern, token))
+        return bool(_TOKEN_RE.match(token))
     
     @staticmethod
     def _is_valid_url(url: str) -> bool:
         """Basic URL validation"""
         try:
-            from urllib.parse import urlparse
             result = urlparse(url)
             return all([result.scheme, result.netloc])
         except Exception:
@@ -195,13 +197,19 @@ class TelegramSecurityManager:
         if not text:
             return ""
         
+        max_length = telegram_settings.TELEGRAM_MAX_MESSAGE_LENGTH
+        
+        # Escaping never shortens text, so only the first max_length + 1
+        # characters can reach the output; one past the limit keeps the
+        # truncation below firing for over-long messages
+        text = text[:max_length + 1]
+        
         # Remove potentially dangerous characters
-        import html
         sanitized = html.escape(text)
         
         # Limit message length
-        if len(sanitized) > telegram_settings.TELEGRAM_MAX_MESSAGE_LENGTH:
-            sanitized = sanitized[:telegram_settings.TELEGRAM_MAX_MESSAGE_LENGTH - 3] + "..."
+        if len(sanitized) > max_length:
+            sanitized = sanitized[:max_length - 3] + "..."
         
         return sanitized
     
@@ -3,20 +3,50 @@ Database Connection Module
 """
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, text
+from sqlalchemy.pool import NullPool
+import asyncio
 import logging
 
 from backend_app.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _engine_options() -> dict:
+    """Pool and driver options for the async engine, taken from settings"""
+    if settings.DATABASE_USE_NULL_POOL:
+        options = {"poolclass": NullPool}
+    else:
+        options = {
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING
+        }
+    if "asyncpg" in settings.DATABASE_URL:
+        # Short OLTP queries never benefit from JIT, it only adds planning time
+        options["connect_args"] = {"server_settings": {"jit": "off"}}
+    return options
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
-    future=True
+    future=True,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    **_engine_options()
 )
 
+# Dialects that don't opt in recompile every statement on each execution
+if not engine.dialect.supports_statement_cache:
+    logger.warning(
+        "Dialect %s does not support the SQL compilation cache; "
+        "statements will be recompiled on every execution",
+        engine.dialect.name
+    )
+
 # Create async session factory
 AsyncSessionLocal = sessionmaker(
     engine,
@@ -41,30 +71,41 @@ async def init_db():
     """Initialize database tables"""
     try:
         async with engine.begin() as conn:
-            # Import all models to ensure they are registered
-            from backend_app.db.models import users
-            from backend_app.db.models import candidate_profiles
-            from backend_app.db.models import jobs
-            from backend_app.db.models import applications
-            from backend_app.db.models import external_job_postings
-            from backend_app.db.models import action_queue
-            from backend_app.db.models import chat_messages
-            from backend_app.db.models import activity_logs
-            from backend_app.db.models import clients
-            from backend_app.db.models import leads
-            from backend_app.db.models import sales_tasks
-            from backend_app.db.models import system_settings
-            from backend_app.db.models import candidate_work_history
-            from backend_app.db.models import application_timeline
+            # The models package imports every model, registering them all
+            from backend_app.db import models  # noqa: F401
             
             # Create all tables
             await conn.run_sync(Base.metadata.create_all)
+            
+            # Pre-create monthly log partitions and drop expired ones
+            from backend_app.db.partitions import maintain_partitions
+            await maintain_partitions(conn)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
 
 
+async def warm_pool() -> None:
+    """Open pool connections up front so the first requests don't pay connection setup"""
+    count = min(
+        settings.DATABASE_POOL_WARM_CONNECTIONS,
+        settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    )
+    if settings.DATABASE_USE_NULL_POOL or count <= 0:
+        return
+    # Hold every connection open at once so each is a separate pooled one
+    connections = [engine.connect() for _ in range(count)]
+    try:
+        await asyncio.gather(*(conn.start() for conn in connections))
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+        logger.info(f"Warmed {count} database connections")
+    except Exception as e:
+        logger.warning(f"Connection pool warm-up failed: {e}")
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections), return_exceptions=True)
+
+
 async def close_db():
     """Close database connection"""
     await engine.dispose()
@@ -0,0 +1,28 @@
+"""
+Primary Key Generation
+"""
+import os
+import time
+import uuid
+
+_RAND_A_MASK = (1 << 12) - 1
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at
+    the right-hand edge of the primary key B-tree instead of a random page.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                              # version
+        | ((rand >> 62) & _RAND_A_MASK) << 64
+        | 0x2 << 62                              # RFC 4122 variant
+        | (rand & _RAND_B_MASK)
+    )
+    return uuid.UUID(int=value)
@@ -2,10 +2,14 @@
 Action Queue Model
 Manages the recruiter's "My Action Queue" panel.
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Boolean, Enum, ForeignKey
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, TIMESTAMP, Boolean, Enum, ForeignKey, Index, text, event, DDL
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,26 +17,40 @@ class ActionQueue(Base):
     """Action queue model for recruiter tasks"""
     
     __tablename__ = "action_queue"
+    __table_args__ = (
+        # Open items for a recruiter's queue, newest first
+        Index("ix_aq_user_open", "user_id", "created_at", postgresql_where=text("is_dismissed = false")),
+        # Covers dismissed rows too, for ON DELETE CASCADE from users
+        Index("ix_aq_user", "user_id"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to user (recruiter)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     
     # Task details
-    type = Column(Enum('NEW_MATCHES', 'CHAT_FOLLOWUP', 'NO_RESPONSE', 'PARSE_FAILURE', 'INTERVENTION_NEEDED', name='action_type_enum'))
-    title = Column(String(255), nullable=False)
-    description = Column(Text)
-    priority = Column(Enum('High', 'Medium', 'Low', name='priority_enum'))
+    type: Mapped[Optional[str]] = mapped_column(Enum('NEW_MATCHES', 'CHAT_FOLLOWUP', 'NO_RESPONSE', 'PARSE_FAILURE', 'INTERVENTION_NEEDED', name='action_type_enum', native_enum=False, create_constraint=True, length=32))
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    priority: Mapped[Optional[str]] = mapped_column(Enum('High', 'Medium', 'Low', name='priority_enum', native_enum=False, create_constraint=True, length=32))
     
     # Related entities
-    related_job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"), nullable=True)
-    related_candidate_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    related_job_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True)
+    related_candidate_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
     # Status
-    is_dismissed = Column(Boolean, default=False)
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    is_dismissed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
     
     def __repr__(self):
-        return f"<ActionQueue(id={self.id}, user_id={self.user_id}, type={self.type}, title={self.title})>"
\ No newline at end of file
+        return f"<ActionQueue(id={self.id}, user_id={self.user_id}, type={self.type}, title={self.title})>"
+
+
+# Items are dismissed in place; leave page room for HOT updates
+event.listen(
+    ActionQueue.__table__,
+    "after_create",
+    DDL("ALTER TABLE %(fullname)s SET (fillfactor = 80)")
+)
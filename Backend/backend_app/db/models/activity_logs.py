@@ -2,10 +2,14 @@
 Activity Logs Model
 Global audit trail and dashboard feed.
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Enum, ForeignKey
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, TIMESTAMP, Enum, ForeignKey, Index, event, DDL, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,22 +17,36 @@ class ActivityLog(Base):
     """Activity logs model for audit trail"""
     
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_al_user_time", "user_id", "created_at"),
+        Index("ix_al_entity", "entity_id"),
+        # Monthly partitions; see backend_app.db.partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
-    # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # Primary key (includes the partition key, as PostgreSQL requires)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to user (nullable for System events)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
     # Action details
-    action_type = Column(String(100), nullable=False)  # 'CREATED_JOB', 'APPLIED', 'CONVERTED_LEAD', 'LOGIN', 'USER_UPDATE'
-    severity = Column(Enum('INFO', 'WARN', 'ERROR', 'SUCCESS', name='severity_enum'))
-    entity_id = Column(UUID(as_uuid=True))  # ID of the job/application/lead
-    description = Column(Text, nullable=False)  # e.g., "John created a new job: React Dev"
+    action_type: Mapped[str] = mapped_column(String(100), nullable=False)  # 'CREATED_JOB', 'APPLIED', 'CONVERTED_LEAD', 'LOGIN', 'USER_UPDATE'
+    severity: Mapped[Optional[str]] = mapped_column(Enum('INFO', 'WARN', 'ERROR', 'SUCCESS', name='severity_enum', native_enum=False, create_constraint=True, length=32))
+    entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))  # ID of the job/application/lead
+    description: Mapped[str] = mapped_column(Text, nullable=False)  # e.g., "John created a new job: React Dev"
     
     # Metadata
-    ip_address = Column(String(50))  # Request IP for security auditing
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    ip_address: Mapped[Optional[str]] = mapped_column(String(50))  # Request IP for security auditing
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     
     def __repr__(self):
-        return f"<ActivityLog(id={self.id}, action_type={self.action_type}, user_id={self.user_id})>"
\ No newline at end of file
+        return f"<ActivityLog(id={self.id}, action_type={self.action_type}, user_id={self.user_id})>"
+
+
+# Catch-all for rows outside the pre-created monthly partitions
+event.listen(
+    ActivityLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS %(fullname)s_default PARTITION OF %(fullname)s DEFAULT")
+)
@@ -2,10 +2,14 @@
 Application Timeline Model
 Logs history of status changes for a specific application.
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,19 +17,25 @@ class ApplicationTimeline(Base):
     """Application timeline model for status change history"""
     
     __tablename__ = "application_timeline"
+    __table_args__ = (
+        Index("ix_timeline_app", "application_id"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to application
-    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"))
+    application_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"))
     
     # Status change details
-    previous_status = Column(String(100))
-    new_status = Column(String(100))
-    changed_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    remarks = Column(Text)
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    previous_status: Mapped[Optional[str]] = mapped_column(String(100))
+    new_status: Mapped[Optional[str]] = mapped_column(String(100))
+    changed_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
+    remarks: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    application: Mapped[Optional["Application"]] = relationship("Application", back_populates="timeline", lazy="raise")
     
     def __repr__(self):
         return f"<ApplicationTimeline(id={self.id}, application_id={self.application_id}, changed_by={self.changed_by})>"
\ No newline at end of file
@@ -2,10 +2,14 @@
 Applications Model
 The MOST CRITICAL table for tracking "One Candidate, Multiple Jobs".
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, Boolean, ForeignKey, Enum
+import uuid
+from datetime import date, datetime
+from typing import List, Optional
+from sqlalchemy import Text, DATE, TIMESTAMP, Integer, SmallInteger, Boolean, ForeignKey, Enum, Index, text, event, DDL
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,31 +17,51 @@ class Application(Base):
     """Application model for job applications"""
     
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_app_candidate_active", "candidate_id", "is_active"),
+        Index("ix_app_job_status", "job_id", "status"),
+        Index("ix_app_followup_date", "next_follow_up_date", postgresql_where=text("is_active = true")),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign keys
-    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id"))
-    candidate_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    job_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"))
+    candidate_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     
     # Application details
-    applied_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    applied_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
     
     # Job-Specific Tracking
-    status = Column(Enum('New', 'Screening', 'Interview', 'Offer', 'Rejected', 'Withdrawn', name='application_status_enum'), default='New')
-    is_active = Column(Boolean, default=True)  # True if process is ongoing. False if rejected/hired/withdrawn.
-    match_score = Column(Integer)  # 0-100. Specific to this job description.
-    ai_custom_summary = Column(Text)  # "Candidate matches React requirement but is expensive for this specific budget."
+    status: Mapped[Optional[str]] = mapped_column(Enum('New', 'Screening', 'Interview', 'Offer', 'Rejected', 'Withdrawn', name='application_status_enum', native_enum=False, create_constraint=True, length=32), default='New')
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)  # True if process is ongoing. False if rejected/hired/withdrawn.
+    match_score: Mapped[Optional[int]] = mapped_column(Integer)  # 0-100. Specific to this job description.
+    ai_custom_summary: Mapped[Optional[str]] = mapped_column(Text)  # "Candidate matches React requirement but is expensive for this specific budget."
     
     # Automation & Co-Pilot State
-    automation_status = Column(Enum('New', 'Contacting...', 'Awaiting Reply', 'Live Chat', 'Intervention Needed', 'Completed', 'Declined', name='automation_status_enum'), default='New')
-    is_recruiter_approved = Column(Boolean, default=False)  # Manual override to boost candidate visibility.
+    automation_status: Mapped[Optional[str]] = mapped_column(Enum('New', 'Contacting...', 'Awaiting Reply', 'Live Chat', 'Intervention Needed', 'Completed', 'Declined', name='automation_status_enum', native_enum=False, create_constraint=True, length=32), default='New')
+    is_recruiter_approved: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)  # Manual override to boost candidate visibility.
+    unread_candidate_msgs: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)  # Kept by a trigger on chat_messages.
     
     # Manual Follow-up Tracking
-    follow_up_status = Column(String(100))  # 'Shortlisted', 'Int-scheduled', 'Offered', 'Joined', 'No Show', 'Under Follow-up', 'Rejected'
-    next_follow_up_date = Column(DATE)  # For calendar reminders.
-    follow_up_remarks = Column(Text)  # Recruiter's internal notes.
+    follow_up_status_id: Mapped[Optional[int]] = mapped_column(SmallInteger, ForeignKey("follow_up_statuses.id"))  # See FollowUpStatus
+    next_follow_up_date: Mapped[Optional[date]] = mapped_column(DATE)  # For calendar reminders.
+    follow_up_remarks: Mapped[Optional[str]] = mapped_column(Text)  # Recruiter's internal notes.
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    candidate: Mapped[Optional["User"]] = relationship("User", foreign_keys=[candidate_id], lazy="raise")
+    job: Mapped[Optional["Job"]] = relationship("Job", back_populates="applications", lazy="raise")
+    timeline: Mapped[List["ApplicationTimeline"]] = relationship("ApplicationTimeline", back_populates="application", lazy="raise", passive_deletes=True)
+    chat_messages: Mapped[List["ChatMessage"]] = relationship("ChatMessage", back_populates="application", lazy="raise", passive_deletes=True)
     
     def __repr__(self):
-        return f"<Application(id={self.id}, job_id={self.job_id}, candidate_id={self.candidate_id}, status={self.status})>"
\ No newline at end of file
+        return f"<Application(id={self.id}, job_id={self.job_id}, candidate_id={self.candidate_id}, status={self.status})>"
+
+
+# Status and follow-up columns change constantly; leave page room for HOT updates
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL("ALTER TABLE %(fullname)s SET (fillfactor = 80)")
+)
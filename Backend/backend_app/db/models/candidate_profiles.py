@@ -2,79 +2,110 @@
 Candidate Profile Model
 Stores the "Master Profile" of a user. One user = One Profile. Independent of specific jobs.
 """
-from sqlalchemy import Column, String, Text, Integer, DECIMAL, DATE, Boolean, TIMESTAMP, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+from sqlalchemy import String, Text, Integer, SmallInteger, DECIMAL, DATE, Boolean, TIMESTAMP, ForeignKey, Index, event, DDL
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.sql import func
 import uuid
 from backend_app.db.connection import Base
 
+# Must match the output size of the skills embedding model
+SKILLS_EMBEDDING_DIM = 384
+
 
 class CandidateProfile(Base):
     """Candidate profile model for master profile"""
     
     __tablename__ = "candidate_profiles"
+    __table_args__ = (
+        # Skill matching: skills @> ARRAY['React', 'TypeScript']
+        Index("ix_candidate_skills_gin", "skills", postgresql_using="gin"),
+        # Top-K semantic matching: ORDER BY ai_skills_vector <=> :query_vec LIMIT k
+        Index(
+            "ix_candidate_skills_hnsw",
+            "ai_skills_vector",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"ai_skills_vector": "vector_cosine_ops"}
+        ),
+    )
     
     # Primary key (One-to-One with User)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     
     # Contact information
-    phone = Column(String(20))
-    linkedin_url = Column(String(500))
-    portfolio_url = Column(String(500))
-    github_url = Column(String(500))
-    resume_url = Column(String(1000))  # Link to the master resume file (S3)
-    resume_last_updated = Column(TIMESTAMP(timezone=True))
-    bio = Column(Text)  # Professional Summary
-    is_actively_searching = Column(Boolean, default=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(20))
+    linkedin_url: Mapped[Optional[str]] = mapped_column(String(500))
+    portfolio_url: Mapped[Optional[str]] = mapped_column(String(500))
+    github_url: Mapped[Optional[str]] = mapped_column(String(500))
+    resume_url: Mapped[Optional[str]] = mapped_column(String(1000))  # Link to the master resume file (S3)
+    resume_last_updated: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
+    bio: Mapped[Optional[str]] = mapped_column(Text)  # Professional Summary
+    is_actively_searching: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Skills & Education (Section B)
-    highest_education = Column(String(255))
-    year_of_passing = Column(Integer)
-    skills = Column(JSONB)  # ["React", "TypeScript"]
-    certificates = Column(JSONB)  # ["AWS Certified"]
-    projects_summary = Column(Text)
-    ai_skills_vector = Column(String(500))  # For semantic search matching (pgvector)
+    highest_education: Mapped[Optional[str]] = mapped_column(String(255))
+    year_of_passing: Mapped[Optional[int]] = mapped_column(Integer)
+    skills: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # ["React", "TypeScript"]
+    certificates: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # ["AWS Certified"]
+    projects_summary: Mapped[Optional[str]] = mapped_column(Text)
+    ai_skills_vector: Mapped[Optional[Any]] = mapped_column(Vector(SKILLS_EMBEDDING_DIM))  # For semantic search matching (pgvector)
     
     # Job Preferences (Section C)
-    total_experience_years = Column(DECIMAL(3, 1))
-    current_role = Column(String(255))
-    expected_role = Column(String(255))
-    job_type_preference = Column(String(100))  # Full-time/Contract
-    current_locations = Column(JSONB)  # ["Bangalore"]
-    preferred_locations = Column(JSONB)  # ["Remote", "Mumbai"]
-    ready_to_relocate = Column(String(50))  # 'Yes', 'No', 'Open to Discussion'
-    notice_period = Column(Integer)  # Days
-    availability_date = Column(DATE)
-    shift_preference = Column(String(100))  # Day/Night/Flex
-    work_authorization = Column(String(255))
+    total_experience_years: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(3, 1))
+    current_role: Mapped[Optional[str]] = mapped_column(String(255))
+    expected_role: Mapped[Optional[str]] = mapped_column(String(255))
+    job_type_preference_id: Mapped[Optional[int]] = mapped_column(SmallInteger, ForeignKey("job_type_preferences.id"))  # Full-time/Contract
+    current_locations: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # ["Bangalore"]
+    preferred_locations: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # ["Remote", "Mumbai"]
+    ready_to_relocate: Mapped[Optional[str]] = mapped_column(String(50))  # 'Yes', 'No', 'Open to Discussion'
+    notice_period: Mapped[Optional[int]] = mapped_column(Integer)  # Days
+    availability_date: Mapped[Optional[date]] = mapped_column(DATE)
+    shift_preference_id: Mapped[Optional[int]] = mapped_column(SmallInteger, ForeignKey("shift_preferences.id"))  # Day/Night/Flex
+    work_authorization: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Salary Info (Section D)
-    current_ctc = Column(DECIMAL(12, 2))
-    expected_ctc = Column(DECIMAL(12, 2))
-    currency = Column(String(10))
-    is_ctc_negotiable = Column(Boolean, default=False)
+    current_ctc: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(12, 2))
+    expected_ctc: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(12, 2))
+    currency: Mapped[Optional[str]] = mapped_column(String(10))
+    is_ctc_negotiable: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Personal & Broader Preferences (Section E)
-    looking_for_jobs_abroad = Column(Boolean, default=False)
-    sector_preference = Column(String(100))  # Private/Govt
-    preferred_industries = Column(JSONB)
-    gender = Column(String(50))
-    marital_status = Column(String(50))
-    dob = Column(DATE)
-    languages = Column(JSONB)
-    reservation_category = Column(String(50))  # General/OBC/SC/ST
-    disability = Column(String(255))  # Text description or NULL
-    willingness_to_travel = Column(String(100))
-    has_driving_license = Column(Boolean, default=False)
+    looking_for_jobs_abroad: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    sector_preference_id: Mapped[Optional[int]] = mapped_column(SmallInteger, ForeignKey("sector_preferences.id"))  # Private/Govt
+    preferred_industries: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    gender: Mapped[Optional[str]] = mapped_column(String(50))
+    marital_status: Mapped[Optional[str]] = mapped_column(String(50))
+    dob: Mapped[Optional[date]] = mapped_column(DATE)
+    languages: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    reservation_category_id: Mapped[Optional[int]] = mapped_column(SmallInteger, ForeignKey("reservation_categories.id"))  # General/OBC/SC/ST
+    disability: Mapped[Optional[str]] = mapped_column(String(255))  # Text description or NULL
+    willingness_to_travel: Mapped[Optional[str]] = mapped_column(String(100))
+    has_driving_license: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Contact & Availability (Section G)
-    has_current_offers = Column(Boolean, default=False)
-    number_of_offers = Column(Integer, default=0)
-    best_time_to_contact = Column(String(100))
-    preferred_contact_mode = Column(String(100))  # Email/Call/WhatsApp
-    alternate_email = Column(String(255))
-    alternate_phone = Column(String(20))
-    time_zone = Column(String(100))
+    has_current_offers: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    number_of_offers: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    best_time_to_contact: Mapped[Optional[str]] = mapped_column(String(100))
+    preferred_contact_mode: Mapped[Optional[str]] = mapped_column(String(100))  # Email/Call/WhatsApp
+    alternate_email: Mapped[Optional[str]] = mapped_column(String(255))
+    alternate_phone: Mapped[Optional[str]] = mapped_column(String(20))
+    time_zone: Mapped[Optional[str]] = mapped_column(String(100))
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    work_history: Mapped[List["CandidateWorkHistory"]] = relationship("CandidateWorkHistory", back_populates="profile", lazy="raise", passive_deletes=True)
     
     def __repr__(self):
-        return f"<CandidateProfile(user_id={self.user_id})>"
\ No newline at end of file
+        return f"<CandidateProfile(user_id={self.user_id})>"
+
+
+# The vector type comes from the pgvector extension
+event.listen(
+    CandidateProfile.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS vector")
+)
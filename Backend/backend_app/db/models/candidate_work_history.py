@@ -1,8 +1,13 @@
 """
 Candidate Work History Model (Section F)
 """
-from sqlalchemy import Column, String, Text, DATE, Boolean, ForeignKey
+import uuid
+from datetime import date
+from typing import Optional
+from sqlalchemy import String, Text, DATE, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -10,22 +15,28 @@ class CandidateWorkHistory(Base):
     """Candidate work history model"""
     
     __tablename__ = "candidate_work_history"
+    __table_args__ = (
+        Index("ix_work_history_profile", "profile_id"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to candidate profile
-    profile_id = Column(UUID(as_uuid=True), ForeignKey("candidate_profiles.user_id"))
+    profile_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("candidate_profiles.user_id", ondelete="CASCADE"))
     
     # Work experience details
-    company_name = Column(String(255), nullable=False)
-    job_title = Column(String(255), nullable=False)
-    start_date = Column(DATE, nullable=False)
-    end_date = Column(DATE)
-    is_current = Column(Boolean, default=False)
-    responsibilities = Column(Text)
-    tools_used = Column(String(500))  # JSONB as string for simplicity
-    ctc_at_role = Column(String(100))
+    company_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    job_title: Mapped[str] = mapped_column(String(255), nullable=False)
+    start_date: Mapped[date] = mapped_column(DATE, nullable=False)
+    end_date: Mapped[Optional[date]] = mapped_column(DATE)
+    is_current: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    responsibilities: Mapped[Optional[str]] = mapped_column(Text)
+    tools_used: Mapped[Optional[str]] = mapped_column(String(500))  # JSONB as string for simplicity
+    ctc_at_role: Mapped[Optional[str]] = mapped_column(String(100))
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    profile: Mapped[Optional["CandidateProfile"]] = relationship("CandidateProfile", back_populates="work_history", lazy="raise")
     
     def __repr__(self):
         return f"<CandidateWorkHistory(id={self.id}, company={self.company_name}, title={self.job_title})>"
\ No newline at end of file
@@ -2,10 +2,14 @@
 Chat Messages Model
 Stores the transcript for the Live Chat Co-Pilot.
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Enum, ForeignKey
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Text, TIMESTAMP, Boolean, Enum, ForeignKey, Index, text, event, DDL
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,18 +17,69 @@ class ChatMessage(Base):
     """Chat messages model for live chat transcripts"""
     
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_cm_app_sent", "application_id", "sent_at"),
+        Index("ix_cm_unread", "application_id", postgresql_where=text("is_read = false")),
+        # Monthly partitions; see backend_app.db.partitions
+        {"postgresql_partition_by": "RANGE (sent_at)"},
+    )
     
-    # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # Primary key (includes the partition key, as PostgreSQL requires)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to application (context of the chat)
-    application_id = Column(UUID(as_uuid=True), ForeignKey("applications.id"))
+    application_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"))
     
     # Message details
-    sender_type = Column(Enum('CANDIDATE', 'BOT', 'RECRUITER', name='sender_type_enum'))
-    message_text = Column(Text, nullable=False)
-    sent_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    is_read = Column(Boolean, default=False)
+    sender_type: Mapped[Optional[str]] = mapped_column(Enum('CANDIDATE', 'BOT', 'RECRUITER', name='sender_type_enum', native_enum=False, create_constraint=True, length=32))
+    message_text: Mapped[str] = mapped_column(Text, nullable=False)
+    sent_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True, nullable=False, server_default=func.now())
+    is_read: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    application: Mapped[Optional["Application"]] = relationship("Application", back_populates="chat_messages", lazy="raise")
     
     def __repr__(self):
-        return f"<ChatMessage(id={self.id}, application_id={self.application_id}, sender={self.sender_type})>"
\ No newline at end of file
+        return f"<ChatMessage(id={self.id}, application_id={self.application_id}, sender={self.sender_type})>"
+
+
+# Catch-all for rows outside the pre-created monthly partitions
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS %(fullname)s_default PARTITION OF %(fullname)s DEFAULT")
+)
+
+
+# Keep Application.unread_candidate_msgs in step with unread candidate messages,
+# so dashboards read a counter instead of aggregating the chat history
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION public.count_unread_candidate_msgs() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' AND OLD.sender_type = 'CANDIDATE' AND OLD.is_read IS NOT TRUE THEN
+        UPDATE public.applications
+        SET unread_candidate_msgs = unread_candidate_msgs - 1
+        WHERE id = OLD.application_id;
+    END IF;
+    IF TG_OP <> 'DELETE' AND NEW.sender_type = 'CANDIDATE' AND NEW.is_read IS NOT TRUE THEN
+        UPDATE public.applications
+        SET unread_candidate_msgs = unread_candidate_msgs + 1
+        WHERE id = NEW.application_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+)
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("""
+CREATE TRIGGER trg_chat_messages_unread_count
+AFTER INSERT OR DELETE OR UPDATE OF is_read, sender_type, application_id ON %(fullname)s
+FOR EACH ROW EXECUTE FUNCTION public.count_unread_candidate_msgs()
+""")
+)
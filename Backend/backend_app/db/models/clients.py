@@ -1,10 +1,14 @@
 """
 Clients Model
 """
-from sqlalchemy import Column, String, Text, DATE, TIMESTAMP, Enum, ForeignKey
+import uuid
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import String, Text, DATE, TIMESTAMP, Enum, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -14,22 +18,22 @@ class Client(Base):
     __tablename__ = "clients"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Client details
-    name = Column(String(255), nullable=False)
-    billing_address = Column(Text)
-    status = Column(Enum('Active', 'Inactive', 'Blacklisted', name='client_status_enum'), default='Active')
-    corporate_identity = Column(String(500))  # JSONB as string for simplicity: { "gst": "...", "pan": "..." }
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    billing_address: Mapped[Optional[str]] = mapped_column(Text)
+    status: Mapped[Optional[str]] = mapped_column(Enum('Active', 'Inactive', 'Blacklisted', name='client_status_enum', native_enum=False, create_constraint=True, length=32), default='Active')
+    corporate_identity: Mapped[Optional[str]] = mapped_column(String(500))  # JSONB as string for simplicity: { "gst": "...", "pan": "..." }
     
     # Contract details
-    contract_start_date = Column(DATE)
-    contract_end_date = Column(DATE)
-    account_manager_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    created_from_lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"), nullable=True)
+    contract_start_date: Mapped[Optional[date]] = mapped_column(DATE)
+    contract_end_date: Mapped[Optional[date]] = mapped_column(DATE)
+    account_manager_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
+    created_from_lead_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="SET NULL"), nullable=True)
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
     
     def __repr__(self):
         return f"<Client(id={self.id}, name={self.name}, status={self.status})>"
\ No newline at end of file
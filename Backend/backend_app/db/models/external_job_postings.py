@@ -2,10 +2,14 @@
 External Job Postings Model (Hot Drops)
 Persists the "Daily Hot Drops" found by the AI to prevent re-fetching.
 """
-from sqlalchemy import Column, String, Text, DATE, TIMESTAMP
+import uuid
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import String, Text, DATE, TIMESTAMP, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -15,22 +19,22 @@ class ExternalJobPosting(Base):
     __tablename__ = "external_job_postings"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Job details
-    source = Column(String(100), nullable=False)  # 'AI_Scraper', 'LinkedIn', 'Indeed'
-    original_url = Column(Text, nullable=False)
-    title = Column(String(500), nullable=False)
-    company_name = Column(String(255), nullable=False)
-    location = Column(String(255))
-    posted_date = Column(DATE)
-    summary = Column(Text)
-    salary_text = Column(String(255))  # Scraped salary (e.g., "$100k - $120k" or "Not Disclosed")
-    job_type = Column(String(100))  # 'Remote', 'Contract', 'Full-time'
+    source: Mapped[str] = mapped_column(String(100), nullable=False)  # 'AI_Scraper', 'LinkedIn', 'Indeed'
+    original_url: Mapped[str] = mapped_column(Text, nullable=False)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    company_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    location: Mapped[Optional[str]] = mapped_column(String(255))
+    posted_date: Mapped[Optional[date]] = mapped_column(DATE)
+    summary: Mapped[Optional[str]] = mapped_column(Text)
+    salary_text: Mapped[Optional[str]] = mapped_column(String(255))  # Scraped salary (e.g., "$100k - $120k" or "Not Disclosed")
+    job_type: Mapped[Optional[str]] = mapped_column(String(100))  # 'Remote', 'Contract', 'Full-time'
     
     # Metadata
-    fetched_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    expires_at = Column(TIMESTAMP(timezone=True))  # TTL for cache (e.g., 24 hours)
+    fetched_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    expires_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))  # TTL for cache (e.g., 24 hours)
     
     def __repr__(self):
         return f"<ExternalJobPosting(id={self.id}, title={self.title}, company={self.company_name})>"
\ No newline at end of file
@@ -2,10 +2,15 @@
 Jobs Model (Internal Postings)
 Manages internal job postings and the hiring pipeline. Google Jobs Compliant Schema.
 """
-from sqlalchemy import Column, String, Text, DATE, Integer, DECIMAL, TIMESTAMP, Enum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.sql import func
 import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+from sqlalchemy import String, Text, DATE, Integer, DECIMAL, TIMESTAMP, Enum, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,57 +18,63 @@ class Job(Base):
     """Jobs model for internal postings"""
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_job_required_skills_gin", "required_skills", postgresql_using="gin"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Basic details
-    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"))
-    assigned_recruiter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    title = Column(String(500), nullable=False)  # job_title
-    internal_job_id = Column(String(100))  # job_id
+    client_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="SET NULL"))
+    assigned_recruiter_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
+    title: Mapped[str] = mapped_column(String(500), nullable=False)  # job_title
+    internal_job_id: Mapped[Optional[str]] = mapped_column(String(100))  # job_id
     
     # Job type and classification
-    employment_type = Column(Enum('FULL_TIME', 'PART_TIME', 'CONTRACTOR', 'TEMPORARY', 'INTERN', name='employment_type_enum'))
-    work_mode = Column(Enum('On-site', 'Remote', 'Hybrid', name='work_mode_enum'))
-    industry = Column(String(255))
-    functional_area = Column(String(255))
+    employment_type: Mapped[Optional[str]] = mapped_column(Enum('FULL_TIME', 'PART_TIME', 'CONTRACTOR', 'TEMPORARY', 'INTERN', name='employment_type_enum', native_enum=False, create_constraint=True, length=32))
+    work_mode: Mapped[Optional[str]] = mapped_column(Enum('On-site', 'Remote', 'Hybrid', name='work_mode_enum', native_enum=False, create_constraint=True, length=32))
+    industry: Mapped[Optional[str]] = mapped_column(String(255))
+    functional_area: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Location and compensation
-    job_locations = Column(JSONB)  # Array of strings (City, State)
-    min_salary = Column(DECIMAL(10, 2))
-    max_salary = Column(DECIMAL(10, 2))
-    currency = Column(String(10))  # 'INR', 'USD'
-    salary_unit = Column(Enum('YEAR', 'MONTH', 'HOUR', name='salary_unit_enum'))
-    benefits_perks = Column(JSONB)  # Array of strings
+    job_locations: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # Array of strings (City, State)
+    min_salary: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(10, 2))
+    max_salary: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(10, 2))
+    currency: Mapped[Optional[str]] = mapped_column(String(10))  # 'INR', 'USD'
+    salary_unit: Mapped[Optional[str]] = mapped_column(Enum('YEAR', 'MONTH', 'HOUR', name='salary_unit_enum', native_enum=False, create_constraint=True, length=32))
+    benefits_perks: Mapped[Optional[Any]] = mapped_column(JSONB)  # Array of strings
     
     # Description and requirements
-    about_company = Column(Text)
-    job_summary = Column(Text)  # Full description
-    responsibilities = Column(JSONB)  # Key duties
-    experience_required = Column(String(100))  # e.g. "3-5 Years"
-    education_qualification = Column(String(255))  # e.g. "B.Tech"
-    required_skills = Column(JSONB)  # ["React", "Node"]
-    preferred_skills = Column(JSONB)
-    tools_tech_stack = Column(JSONB)
+    about_company: Mapped[Optional[str]] = mapped_column(Text)
+    job_summary: Mapped[Optional[str]] = mapped_column(Text)  # Full description
+    responsibilities: Mapped[Optional[Any]] = mapped_column(JSONB)  # Key duties
+    experience_required: Mapped[Optional[str]] = mapped_column(String(100))  # e.g. "3-5 Years"
+    education_qualification: Mapped[Optional[str]] = mapped_column(String(255))  # e.g. "B.Tech"
+    required_skills: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))  # ["React", "Node"]
+    preferred_skills: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    tools_tech_stack: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
     
     # Application and process
-    number_of_openings = Column(Integer)
-    application_deadline = Column(DATE)
-    hiring_process_rounds = Column(JSONB)  # Array of round names e.g. ["Screening", "Tech"]
-    notice_period_accepted = Column(String(100))  # e.g. "Immediate to 30 Days"
+    number_of_openings: Mapped[Optional[int]] = mapped_column(Integer)
+    application_deadline: Mapped[Optional[date]] = mapped_column(DATE)
+    hiring_process_rounds: Mapped[Optional[Any]] = mapped_column(JSONB)  # Array of round names e.g. ["Screening", "Tech"]
+    notice_period_accepted: Mapped[Optional[str]] = mapped_column(String(100))  # e.g. "Immediate to 30 Days"
     
     # SEO and metadata
-    slug_url = Column(String(500), unique=True)
-    meta_title = Column(String(500))
-    meta_description = Column(String(1000))
+    slug_url: Mapped[Optional[str]] = mapped_column(String(500), unique=True)
+    meta_title: Mapped[Optional[str]] = mapped_column(String(500))
+    meta_description: Mapped[Optional[str]] = mapped_column(String(1000))
     
     # Status
-    status = Column(Enum('Draft', 'Sourcing', 'Interview', 'Offer', 'Closed', name='job_status_enum'), default='Draft')
+    status: Mapped[Optional[str]] = mapped_column(Enum('Draft', 'Sourcing', 'Interview', 'Offer', 'Closed', name='job_status_enum', native_enum=False, create_constraint=True, length=32), default='Draft')
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    updated_at = Column(TIMESTAMP(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), onupdate=func.now())
+    
+    # Relationships (lazy="raise": load explicitly with selectinload/joinedload)
+    applications: Mapped[List["Application"]] = relationship("Application", back_populates="job", lazy="raise", passive_deletes=True)
     
     def __repr__(self):
         return f"<Job(id={self.id}, title={self.title}, client_id={self.client_id})>"
\ No newline at end of file
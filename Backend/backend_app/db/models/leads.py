@@ -1,10 +1,15 @@
 """
 Leads Model
 """
-from sqlalchemy import Column, String, Text, DATE, DECIMAL, TIMESTAMP, Enum, ForeignKey
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import String, Text, DATE, DECIMAL, Integer, TIMESTAMP, Enum, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -14,28 +19,28 @@ class Lead(Base):
     __tablename__ = "leads"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to owner
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    owner_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     
     # Lead details
-    company_name = Column(String(255), nullable=False)
-    contact_person = Column(String(255), nullable=False)
-    contact_email = Column(String(255), nullable=False)
-    contact_phone = Column(String(20))
+    company_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_person: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(20))
     
     # Lead status and details
-    status = Column(Enum('New', 'Contacted', 'Qualified', 'Proposal', 'Negotiation', 'Converted', 'Lost', name='lead_status_enum'), default='New')
-    service_type = Column(Enum('Permanent', 'Contract', 'RPO', 'Executive Search', name='service_type_enum'))
-    estimated_value = Column(DECIMAL(12, 2))
-    probability = Column(Integer)  # 0-100
-    expected_close_date = Column(DATE)
-    next_follow_up = Column(TIMESTAMP(timezone=True))
-    source = Column(String(255))
+    status: Mapped[Optional[str]] = mapped_column(Enum('New', 'Contacted', 'Qualified', 'Proposal', 'Negotiation', 'Converted', 'Lost', name='lead_status_enum', native_enum=False, create_constraint=True, length=32), default='New')
+    service_type: Mapped[Optional[str]] = mapped_column(Enum('Permanent', 'Contract', 'RPO', 'Executive Search', name='service_type_enum', native_enum=False, create_constraint=True, length=32))
+    estimated_value: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(12, 2))
+    probability: Mapped[Optional[int]] = mapped_column(Integer)  # 0-100
+    expected_close_date: Mapped[Optional[date]] = mapped_column(DATE)
+    next_follow_up: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
+    source: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
     
     def __repr__(self):
         return f"<Lead(id={self.id}, company={self.company_name}, status={self.status})>"
\ No newline at end of file
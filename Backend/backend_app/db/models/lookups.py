@@ -0,0 +1,87 @@
+"""
+Lookup Models
+Small smallint-keyed tables for categorical columns, so the referencing rows
+store a 2-byte id instead of repeating free text.
+"""
+from sqlalchemy import SmallInteger, String, event, DDL
+from sqlalchemy.orm import Mapped, mapped_column
+from backend_app.db.connection import Base
+
+
+class FollowUpStatus(Base):
+    """Manual follow-up status of an application"""
+    
+    __tablename__ = "follow_up_statuses"
+    
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f"<FollowUpStatus(id={self.id}, name={self.name})>"
+
+
+class JobTypePreference(Base):
+    """Candidate's preferred job type"""
+    
+    __tablename__ = "job_type_preferences"
+    
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f"<JobTypePreference(id={self.id}, name={self.name})>"
+
+
+class ShiftPreference(Base):
+    """Candidate's preferred shift"""
+    
+    __tablename__ = "shift_preferences"
+    
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f"<ShiftPreference(id={self.id}, name={self.name})>"
+
+
+class SectorPreference(Base):
+    """Candidate's preferred sector"""
+    
+    __tablename__ = "sector_preferences"
+    
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f"<SectorPreference(id={self.id}, name={self.name})>"
+
+
+class ReservationCategory(Base):
+    """Candidate's reservation category"""
+    
+    __tablename__ = "reservation_categories"
+    
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f"<ReservationCategory(id={self.id}, name={self.name})>"
+
+
+# Seed rows; ids are stable so they can be referenced from code and migrations
+LOOKUP_SEEDS = {
+    FollowUpStatus: ('Shortlisted', 'Int-scheduled', 'Offered', 'Joined', 'No Show', 'Under Follow-up', 'Rejected'),
+    JobTypePreference: ('Full-time', 'Contract'),
+    ShiftPreference: ('Day', 'Night', 'Flex'),
+    SectorPreference: ('Private', 'Govt'),
+    ReservationCategory: ('General', 'OBC', 'SC', 'ST')
+}
+
+for _model, _names in LOOKUP_SEEDS.items():
+    _values = ", ".join(f"({_id}, '{_name}')" for _id, _name in enumerate(_names, start=1))
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(f"INSERT INTO public.{_model.__tablename__} (id, name) VALUES {_values} ON CONFLICT DO NOTHING")
+    )
+del _model, _names, _values
@@ -2,10 +2,14 @@
 Sales Tasks Model
 Tracks tasks associated with leads.
 """
-from sqlalchemy import Column, String, Boolean, DATE, TIMESTAMP, ForeignKey
+import uuid
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import String, Boolean, DATE, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-import uuid
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -13,21 +17,24 @@ class SalesTask(Base):
     """Sales tasks model for lead tasks"""
     
     __tablename__ = "sales_tasks"
+    __table_args__ = (
+        Index("ix_sales_tasks_lead", "lead_id"),
+    )
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Foreign key to lead
-    lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id"))
+    lead_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"))
     
     # Task details
-    title = Column(String(500), nullable=False)
-    is_completed = Column(Boolean, default=False)
-    due_date = Column(DATE)
-    assigned_to = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    is_completed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    due_date: Mapped[Optional[date]] = mapped_column(DATE)
+    assigned_to: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
     
     def __repr__(self):
         return f"<SalesTask(id={self.id}, title={self.title}, lead_id={self.lead_id})>"
\ No newline at end of file
@@ -2,8 +2,11 @@
 System Settings Model
 Stores global configuration and feature flags.
 """
-from sqlalchemy import Column, String, TIMESTAMP, Text
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import String, TIMESTAMP, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from sqlalchemy import ForeignKey
 import uuid
@@ -16,15 +19,15 @@ class SystemSettings(Base):
     __tablename__ = "system_settings"
     
     # Primary key
-    key = Column(String(255), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
     
     # Settings
-    value = Column(JSONB, nullable=False)
-    description = Column(Text)
+    value: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
     
     # Metadata
-    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
-    updated_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     
     def __repr__(self):
         return f"<SystemSettings(key={self.key})>"
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Upcoming Follow-ups Model
+Narrow per-recruiter follow-up calendar, kept in sync with applications by a trigger.
+"""
+import uuid
+from datetime import date
+from sqlalchemy import DATE, ForeignKey, Index, event, DDL
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from backend_app.db.connection import Base
+
+
+class UpcomingFollowup(Base):
+    """Follow-up calendar entry: one row per active application with a follow-up date"""
+    
+    __tablename__ = "upcoming_followups"
+    __table_args__ = (
+        # The trigger replaces an application's row on every change
+        Index("ix_followup_application", "application_id"),
+    )
+    
+    # Primary key: "recruiter X's follow-ups on day D" is a PK range lookup
+    follow_up_date: Mapped[date] = mapped_column(DATE, primary_key=True)
+    recruiter_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    application_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    
+    def __repr__(self):
+        return f"<UpcomingFollowup(date={self.follow_up_date}, recruiter_id={self.recruiter_id}, application_id={self.application_id})>"
+
+
+# Rebuild an application's calendar entry whenever its follow-up inputs change.
+# The recruiter comes from the application's job.
+event.listen(
+    UpcomingFollowup.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION public.sync_upcoming_followup() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM public.upcoming_followups WHERE application_id = NEW.id;
+    IF NEW.next_follow_up_date IS NOT NULL AND NEW.is_active THEN
+        INSERT INTO public.upcoming_followups (follow_up_date, recruiter_id, application_id)
+        SELECT NEW.next_follow_up_date, jobs.assigned_recruiter_id, NEW.id
+        FROM public.jobs
+        WHERE jobs.id = NEW.job_id AND jobs.assigned_recruiter_id IS NOT NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+)
+event.listen(
+    UpcomingFollowup.__table__,
+    "after_create",
+    DDL("""
+CREATE TRIGGER trg_applications_upcoming_followup
+AFTER INSERT OR UPDATE OF next_follow_up_date, is_active, job_id ON public.applications
+FOR EACH ROW EXECUTE FUNCTION public.sync_upcoming_followup()
+""")
+)
@@ -2,10 +2,14 @@
 User Model
 Stores login credentials and global role.
 """
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, Enum, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
 import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Boolean, TIMESTAMP, Enum, Text, event, DDL, text
+from sqlalchemy.dialects.postgresql import UUID, CITEXT
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from backend_app.db.ids import uuid7
 from backend_app.db.connection import Base
 
 
@@ -15,25 +19,40 @@ class User(Base):
     __tablename__ = "users"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     
     # Authentication
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    password_hash = Column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(CITEXT(), unique=True, index=True, nullable=False)  # Case-insensitive equality, served by the unique index
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     
     # Profile
-    role = Column(Enum('ADMIN', 'RECRUITER', 'SALES', 'CANDIDATE', 'MANAGER', name='user_role_enum'), nullable=False)
-    full_name = Column(String(255), nullable=False)
-    avatar_url = Column(String(500))
+    role: Mapped[str] = mapped_column(Enum('ADMIN', 'RECRUITER', 'SALES', 'CANDIDATE', 'MANAGER', name='user_role_enum', native_enum=False, create_constraint=True, length=32), nullable=False)
+    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(500))
     
     # Status
-    status = Column(Enum('Active', 'Inactive', name='user_status_enum'), default='Active')
-    is_verified = Column(Boolean, default=False)
+    status: Mapped[Optional[str]] = mapped_column(Enum('Active', 'Inactive', name='user_status_enum', native_enum=False, create_constraint=True, length=32), default='Active')
+    is_verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    last_login = Column(TIMESTAMP(timezone=True))
-    last_active = Column(TIMESTAMP(timezone=True))
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    last_login: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
+    last_active: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
     
     def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
\ No newline at end of file
+        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
+
+
+# The email type comes from the citext extension
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS citext")
+)
+
+# last_active is bumped on every request; leave page room for HOT updates
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL("ALTER TABLE %(fullname)s SET (fillfactor = 80)")
+)
@@ -0,0 +1,189 @@
+"""
+Monthly Range Partitions
+Keeps the append-only log tables split by month so time-bounded queries
+only touch recent partitions, and old audit data can be dropped cheaply.
+"""
+import asyncio
+import logging
+from datetime import date
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend_app.config import settings
+from backend_app.db.connection import engine
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> months of data to keep (None keeps everything)
+PARTITIONED_TABLES = {
+    "activity_logs": 13,
+    "chat_messages": None
+}
+
+# Partitioned table -> partition key column
+PARTITION_KEYS = {
+    "activity_logs": "created_at",
+    "chat_messages": "sent_at"
+}
+
+_SCHEMA = "public"
+
+
+def _add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+def _partition_name(table: str, year: int, month: int) -> str:
+    return f"{table}_{year:04d}_{month:02d}"
+
+
+async def ensure_monthly_partitions(
+    conn: AsyncConnection,
+    table: str,
+    months_ahead: int = 2,
+    today: Optional[date] = None
+) -> None:
+    """Create the partitions for the current month and the next ``months_ahead``"""
+    today = today or date.today()
+    for offset in range(months_ahead + 1):
+        year, month = _add_months(today.year, today.month, offset)
+        next_year, next_month = _add_months(year, month, 1)
+        name = _partition_name(table, year, month)
+        if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": f"{_SCHEMA}.{name}"}):
+            continue
+        await _create_partition(
+            conn, table, name,
+            f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"
+        )
+
+
+async def _create_partition(conn: AsyncConnection, table: str, name: str, start: str, end: str) -> None:
+    """
+    Create one range partition.
+    
+    PostgreSQL refuses to add a partition while the DEFAULT partition holds
+    rows in its range, so any such rows are moved out first: copied aside,
+    deleted from the default partition, and re-inserted through the parent
+    once the new partition exists. Going through the parent keeps row
+    triggers (such as the unread message counter) balanced.
+    """
+    default = f"{_SCHEMA}.{table}_default"
+    key = PARTITION_KEYS[table]
+    in_range = f"{key} >= '{start}' AND {key} < '{end}'"
+    
+    stray = False
+    if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": default}):
+        # Keep new rows from landing in the default partition mid-move
+        await conn.execute(text(f"LOCK TABLE {default} IN SHARE ROW EXCLUSIVE MODE"))
+        stray = await conn.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})"))
+    
+    if stray:
+        moved = f"{name}_moving"
+        await conn.execute(text(f"CREATE TEMPORARY TABLE {moved} (LIKE {_SCHEMA}.{table}) ON COMMIT DROP"))
+        await conn.execute(text(f"INSERT INTO {moved} SELECT * FROM {default} WHERE {in_range}"))
+        await conn.execute(text(f"DELETE FROM {default} WHERE {in_range}"))
+    
+    await conn.execute(text(
+        f"CREATE TABLE {_SCHEMA}.{name} PARTITION OF {_SCHEMA}.{table} "
+        f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+    
+    if stray:
+        result = await conn.execute(text(f"INSERT INTO {_SCHEMA}.{table} SELECT * FROM {moved}"))
+        await conn.execute(text(f"DROP TABLE {moved}"))
+        logger.info("Moved %d rows from %s into new partition %s", result.rowcount, default, name)
+
+
+async def drop_expired_partitions(
+    conn: AsyncConnection,
+    table: str,
+    retention_months: int,
+    today: Optional[date] = None
+) -> None:
+    """Drop monthly partitions that end before the retention window"""
+    today = today or date.today()
+    cutoff_year, cutoff_month = _add_months(today.year, today.month, -retention_months)
+    cutoff = _partition_name(table, cutoff_year, cutoff_month)
+    
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "JOIN pg_namespace ns ON parent.relnamespace = ns.oid "
+            "WHERE ns.nspname = :schema AND parent.relname = :table"
+        ),
+        {"schema": _SCHEMA, "table": table}
+    )
+    prefix_length = len(table) + 1
+    for (name,) in result:
+        # Monthly partitions are named <table>_YYYY_MM, so names sort by month
+        suffix = name[prefix_length:]
+        if len(suffix) == 7 and suffix[4] == "_" and name < cutoff:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {_SCHEMA}.{name}"))
+            logger.info("Dropped expired partition %s", name)
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    """Whether ``table`` exists as a partitioned table"""
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "JOIN pg_class ON pg_partitioned_table.partrelid = pg_class.oid "
+            "JOIN pg_namespace ns ON pg_class.relnamespace = ns.oid "
+            "WHERE ns.nspname = :schema AND pg_class.relname = :table"
+        ),
+        {"schema": _SCHEMA, "table": table}
+    )
+    return result.first() is not None
+
+
+async def maintain_partitions(conn: AsyncConnection) -> None:
+    """Create upcoming partitions and apply retention for every partitioned table"""
+    for table, retention_months in PARTITIONED_TABLES.items():
+        # Databases created before partitioning need migration 202501010005
+        if not await is_partitioned(conn, table):
+            logger.warning("Table %s is not partitioned; skipping partition maintenance", table)
+            continue
+        await ensure_monthly_partitions(conn, table)
+        if retention_months is not None:
+            await drop_expired_partitions(conn, table, retention_months)
+
+
+class PartitionMaintainer:
+    """Run maintain_partitions every ``interval`` seconds in a background task"""
+    
+    def __init__(self, interval: float = 86400):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the periodic maintenance task (init_db has already run it once)"""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the maintenance task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                async with engine.begin() as conn:
+                    await maintain_partitions(conn)
+            except Exception:
+                logger.exception("Partition maintenance failed")
+
+
+# Shared maintainer; start() it on application startup and stop() on shutdown
+partition_maintainer = PartitionMaintainer(settings.PARTITION_MAINTENANCE_INTERVAL)
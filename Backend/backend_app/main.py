@@ -1,8 +1,9 @@
 """
 FastAPI Application Entry Point
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
@@ -11,7 +12,9 @@ from typing import AsyncGenerator
 
 from backend_app.config import settings
 from backend_app.api import api_router
-from backend_app.db.connection import init_db
+from backend_app.db.connection import init_db, warm_pool
+from backend_app.db.partitions import partition_maintainer
+from backend_app.repositories.user_repo import last_active_buffer, user_email_filter
 
 # Configure logging
 logging.basicConfig(
@@ -27,10 +30,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Initializing database...")
     await init_db()
     logger.info("Database initialized successfully")
+    await warm_pool()
+    last_active_buffer.start()
+    user_email_filter.start()
+    partition_maintainer.start()
     
     yield
     
     # Shutdown
+    await partition_maintainer.stop()
+    await user_email_filter.stop()
+    await last_active_buffer.stop()
     logger.info("Application shutdown complete")
 
 # Create FastAPI app
@@ -61,6 +71,12 @@ if os.path.exists(static_dir):
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Log any error a handler didn't turn into an HTTPException and return a 500"""
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -1,18 +1,23 @@
-from sqlalchemy import Column, String, DateTime, Boolean, func, JSON, Integer
+from sqlalchemy import Column, String, DateTime, Boolean, func, JSON, Integer, Index
+from sqlalchemy.dialects.postgresql import CITEXT
 import uuid
 from datetime import datetime, timedelta
 from ..db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination in UserRepository.get_all_users
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     
     # Primary identifier - phone number
     phone = Column(String, unique=True, nullable=False, index=True)
     
-    # Email for social login and fallback
-    email = Column(String, unique=True, nullable=True, index=True)
+    # Email for social login and fallback; case-insensitive on PostgreSQL (citext)
+    email = Column(String().with_variant(CITEXT(), "postgresql"), unique=True, nullable=True, index=True)
     
     # Social login identifiers
     whatsapp_number = Column(String, unique=True, nullable=True)
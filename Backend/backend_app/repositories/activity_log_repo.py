@@ -0,0 +1,109 @@
+"""
+Activity Log Repository
+Buffers audit/dashboard events and writes them to the database in batches.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from backend_app.db.connection import AsyncSessionLocal
+from backend_app.db.models.activity_logs import ActivityLog
+from backend_app.repositories.base_repo import bulk_insert
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = frozenset(column.key for column in ActivityLog.__table__.columns)
+_REQUIRED_COLUMNS = frozenset(("action_type", "description"))
+
+# Queued by stop() to tell the flush task to write its batch and exit
+_STOP = object()
+
+
+class ActivityLogWriter:
+    """
+    Queue activity log rows on the request path and insert them from a
+    background task, flushing every ``flush_interval`` seconds or every
+    ``batch_size`` rows, whichever comes first.
+    
+    Create one per process, start() it on application startup and stop()
+    it on shutdown.
+    """
+    
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = 500,
+        flush_interval: float = 0.1
+    ):
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the flush task once its current batch is written, then write whatever is still queued"""
+        if self._task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+        
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._write(batch)
+    
+    def log(self, **row: Any) -> None:
+        """
+        Queue one activity log row (ActivityLog column values); never blocks.
+        
+        Rows are checked here so a bad one fails its caller instead of the
+        whole batch it would be written with.
+        """
+        unknown = row.keys() - _COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown activity log columns: {', '.join(sorted(unknown))}")
+        missing = _REQUIRED_COLUMNS - row.keys()
+        if missing:
+            raise ValueError(f"Missing activity log columns: {', '.join(sorted(missing))}")
+        self._queue.put_nowait(row)
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            stopping = False
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._write(batch)
+            if stopping:
+                return
+    
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with self._session_factory() as session:
+                await bulk_insert(session, ActivityLog, batch, timestamp_column="created_at")
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to write %d activity log rows", len(batch))
+
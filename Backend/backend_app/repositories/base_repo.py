@@ -0,0 +1,111 @@
+"""
+Base Repository Helpers
+Shared database operations used by the model repositories.
+"""
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Type
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: Type[Any],
+    rows: List[Dict[str, Any]],
+    chunk: int = 1000,
+    timestamp_column: Optional[str] = None
+) -> None:
+    """
+    Insert many rows with multi-row INSERT statements.
+
+    Each chunk is sent as one executemany call, which SQLAlchemy compiles into
+    batched multi-row VALUES, instead of one round-trip per ORM object.
+    Python-side column defaults (e.g. primary keys) are still applied.
+    The caller owns the transaction and commits.
+    
+    If ``timestamp_column`` is given, rows that don't set it are stamped with
+    one Python-side UTC timestamp for the whole call, so the server default
+    isn't evaluated per row and never has to come back via RETURNING.
+    
+    Rows may set different columns. An executemany takes its column list
+    from the first row, so rows are grouped by the columns they set and
+    each group is inserted separately; unset columns keep their defaults.
+    """
+    if timestamp_column is not None:
+        now = datetime.now(timezone.utc)
+        rows = [{timestamp_column: now, **row} for row in rows]
+    
+    groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    
+    statement = insert(model)
+    for group in groups.values():
+        for start in range(0, len(group), chunk):
+            await session.execute(statement, group[start:start + chunk])
+
+
+class BatchLoader:
+    """
+    Coalesce ``load(key)`` calls made in the same event-loop tick into one
+    ``batch_load_fn(keys)`` call (DataLoader pattern), caching the results.
+    
+    ``batch_load_fn`` must return one value per key, in key order (None for
+    misses). Create one loader per request so the cache doesn't outlive it.
+    
+    Batches run one at a time under ``lock``. Loaders whose batch functions
+    share an AsyncSession must share one lock, since the session doesn't
+    allow concurrent operations.
+    """
+    
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[Hashable]], Awaitable[Sequence[Any]]],
+        lock: Optional[asyncio.Lock] = None
+    ):
+        self._batch_load_fn = batch_load_fn
+        self._lock = lock or asyncio.Lock()
+        self._cache: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+    
+    def load(self, key: Hashable) -> "asyncio.Future[Any]":
+        """Future resolving to the value for ``key``"""
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending[key] = future
+        return future
+    
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        """Forget one cached key, or all of them"""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+    
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        asyncio.ensure_future(self._resolve(batch))
+    
+    async def _resolve(self, batch: Dict[Hashable, "asyncio.Future[Any]"]) -> None:
+        keys = list(batch)
+        try:
+            async with self._lock:
+                values = await self._batch_load_fn(keys)
+        except Exception as e:
+            for key, future in batch.items():
+                # Don't cache failures, a later load may succeed
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, value in zip(batch.values(), values):
+            if not future.done():
+                future.set_result(value)
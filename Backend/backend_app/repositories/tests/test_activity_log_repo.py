@@ -0,0 +1,100 @@
+"""
+Test Activity Log Writer
+Tests for batching, validation and shutdown of ActivityLogWriter
+"""
+
+import asyncio
+
+import pytest
+
+from backend_app.repositories import activity_log_repo
+from backend_app.repositories.activity_log_repo import ActivityLogWriter
+
+
+class RecordingSession:
+    """Session stand-in that records committed rows; writes take ``delay`` seconds"""
+    
+    def __init__(self, written, delay):
+        self.written = written
+        self.delay = delay
+        self.pending = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def commit(self):
+        await asyncio.sleep(self.delay)
+        self.written.extend(self.pending)
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Rows committed by the writer, captured instead of hitting the database"""
+    rows = []
+    
+    async def fake_bulk_insert(session, model, batch, **kwargs):
+        session.pending.extend(batch)
+    
+    monkeypatch.setattr(activity_log_repo, "bulk_insert", fake_bulk_insert)
+    return rows
+
+
+def _writer(written, delay=0.0, **kwargs):
+    return ActivityLogWriter(session_factory=lambda: RecordingSession(written, delay), **kwargs)
+
+
+class TestActivityLogWriter:
+    """Test suite for ActivityLogWriter"""
+    
+    @pytest.mark.asyncio
+    async def test_stop_finishes_batch_in_flight(self, written):
+        """Test that rows the task has already taken are written before stop returns"""
+        writer = _writer(written, delay=0.05, flush_interval=0.01)
+        writer.start()
+        for i in range(3):
+            writer.log(action_type="LOGIN", description=f"row {i}")
+        
+        # Let the task take the batch and start writing it
+        await asyncio.sleep(0.02)
+        await writer.stop()
+        
+        assert [row["description"] for row in written] == ["row 0", "row 1", "row 2"]
+    
+    @pytest.mark.asyncio
+    async def test_stop_writes_rows_still_queued(self, written):
+        """Test that rows queued behind the current batch are written on stop"""
+        writer = _writer(written, delay=0.05, batch_size=2, flush_interval=1)
+        writer.start()
+        for i in range(5):
+            writer.log(action_type="LOGIN", description=f"row {i}")
+        
+        await writer.stop()
+        
+        assert len(written) == 5
+    
+    @pytest.mark.asyncio
+    async def test_stop_without_start(self, written):
+        """Test that rows logged before start are written on stop"""
+        writer = _writer(written)
+        writer.log(action_type="LOGIN", description="only")
+        
+        await writer.stop()
+        
+        assert [row["description"] for row in written] == ["only"]
+    
+    def test_log_rejects_unknown_column(self, written):
+        """Test that a row with an unknown column fails the caller, not the batch"""
+        writer = _writer(written)
+        
+        with pytest.raises(ValueError, match="detail"):
+            writer.log(action_type="LOGIN", description="x", detail="y")
+    
+    def test_log_rejects_missing_required_column(self, written):
+        """Test that a row without a required column fails the caller"""
+        writer = _writer(written)
+        
+        with pytest.raises(ValueError, match="description"):
+            writer.log(action_type="LOGIN")
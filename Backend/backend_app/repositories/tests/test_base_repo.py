@@ -0,0 +1,158 @@
+"""
+Test Base Repository Helpers
+Tests for bulk_insert and BatchLoader
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import declarative_base
+
+from backend_app.repositories.base_repo import BatchLoader, bulk_insert
+
+
+Base = declarative_base()
+
+
+class Event(Base):
+    """Table with a Python-side default and a server default"""
+    
+    __tablename__ = "events"
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    severity = Column(String, default="INFO")
+    ip_address = Column(String)
+    source = Column(String, server_default="api")
+
+
+class SyncConnectionAdapter:
+    """Expose a sync Connection through the awaitable execute() bulk_insert uses"""
+    
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.calls = []
+    
+    async def execute(self, statement, params=None):
+        self.calls.append(params)
+        return self.connection.execute(statement, params)
+
+
+@pytest.fixture
+def session():
+    """In-memory SQLite connection with the events table"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        yield SyncConnectionAdapter(connection)
+    engine.dispose()
+
+
+def _rows(session):
+    return session.connection.execute(
+        select(Event.kind, Event.severity, Event.ip_address, Event.source).order_by(Event.id)
+    ).all()
+
+
+class TestBulkInsert:
+    """Test suite for bulk_insert"""
+    
+    @pytest.mark.asyncio
+    async def test_mixed_rows_keep_their_columns(self, session):
+        """Test that later rows keep columns the first row doesn't set"""
+        await bulk_insert(session, Event, [
+            {"kind": "login"},
+            {"kind": "apply", "severity": "WARN", "ip_address": "10.0.0.1"},
+        ])
+        
+        assert _rows(session) == [
+            ("login", "INFO", None, "api"),
+            ("apply", "WARN", "10.0.0.1", "api"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_mixed_rows_missing_first_row_columns(self, session):
+        """Test that rows without the first row's columns still insert with defaults"""
+        await bulk_insert(session, Event, [
+            {"kind": "apply", "severity": "ERROR", "source": "bot"},
+            {"kind": "login"},
+            {"kind": "logout", "severity": "WARN", "source": "web"},
+        ])
+        
+        assert sorted(_rows(session)) == [
+            ("apply", "ERROR", None, "bot"),
+            ("login", "INFO", None, "api"),
+            ("logout", "WARN", None, "web"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_groups_by_column_set_and_chunks(self, session):
+        """Test that each executemany gets one column set and at most ``chunk`` rows"""
+        rows = [{"kind": f"a{i}"} for i in range(5)] + [{"kind": "b", "severity": "WARN"}]
+        
+        await bulk_insert(session, Event, rows, chunk=2)
+        
+        assert [len(call) for call in session.calls] == [2, 2, 1, 1]
+        for call in session.calls:
+            assert len({frozenset(row) for row in call}) == 1
+        assert len(_rows(session)) == 6
+
+
+class TestBatchLoader:
+    """Test suite for BatchLoader"""
+    
+    @pytest.mark.asyncio
+    async def test_coalesces_loads_in_one_tick(self):
+        """Test that loads made together become one batch call"""
+        calls = []
+        
+        async def load(keys):
+            calls.append(keys)
+            return [key * 2 for key in keys]
+        
+        loader = BatchLoader(load)
+        
+        assert await asyncio.gather(loader.load(1), loader.load(2), loader.load(1)) == [2, 4, 2]
+        assert calls == [[1, 2]]
+    
+    @pytest.mark.asyncio
+    async def test_loaders_sharing_a_lock_never_overlap(self):
+        """Test that batches dispatched in the same tick take turns on the shared session"""
+        active = 0
+        overlaps = []
+        
+        async def load(keys):
+            nonlocal active
+            active += 1
+            overlaps.append(active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return keys
+        
+        lock = asyncio.Lock()
+        by_id = BatchLoader(load, lock)
+        by_email = BatchLoader(load, lock)
+        
+        results = await asyncio.gather(by_id.load("u-1"), by_email.load("jane@example.com"))
+        
+        assert results == ["u-1", "jane@example.com"]
+        assert max(overlaps) == 1
+    
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self):
+        """Test that a failed batch is retried on the next load"""
+        attempts = []
+        
+        async def load(keys):
+            attempts.append(keys)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return keys
+        
+        loader = BatchLoader(load)
+        
+        with pytest.raises(RuntimeError):
+            await loader.load("k")
+        assert await loader.load("k") == "k"
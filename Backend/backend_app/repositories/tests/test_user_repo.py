@@ -0,0 +1,318 @@
+"""
+Test User Repository
+Tests for the cached and database-backed user lookups
+"""
+
+import dataclasses
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend_app.models.users import User
+from backend_app.repositories.user_repo import (
+    CachedUser, EmailFilter, UserRepository, _dump_user, _load_user
+)
+
+
+def _user(**overrides):
+    values = {
+        "id": "u-1",
+        "phone": "9876543210",
+        "email": "jane@example.com",
+        "role": "CANDIDATE",
+        "full_name": "Jane Doe",
+        "status": "Active",
+        "password_hash": "hashed",
+        "otp_attempts": 2,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5),
+    }
+    values.update(overrides)
+    return User(**values)
+
+
+class FakeCache:
+    """In-memory stand-in for UserCache"""
+    
+    def __init__(self, users=()):
+        self.rows = {user.id: _dump_user(user) for user in users}
+        self.emails = {user.email.lower(): user.id for user in users}
+    
+    async def get_many(self, user_ids):
+        return {user_id: _load_user(self.rows[user_id]) for user_id in user_ids if user_id in self.rows}
+    
+    async def get_ids(self, emails):
+        return {email: self.emails[email.lower()] for email in emails if email.lower() in self.emails}
+    
+    async def set_many(self, users):
+        for user in users:
+            self.rows[user.id] = _dump_user(user)
+            self.emails[user.email.lower()] = user.id
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def scalars(self):
+        return self
+    
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Session stand-in that answers every SELECT with ``rows`` and counts queries"""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+    
+    async def execute(self, statement):
+        self.queries += 1
+        return FakeResult(self.rows)
+
+
+class TestUserRepositoryCache:
+    """Test suite for UserRepository's cache use"""
+    
+    @pytest.mark.asyncio
+    async def test_get_by_id_reads_database_on_cache_hit(self):
+        """Test that entity getters never build a partial User from the cache"""
+        db_user = _user()
+        session = FakeSession([db_user])
+        repo = UserRepository(session, cache=FakeCache([_user()]), email_filter=None)
+        
+        user = await repo.get_by_id("u-1")
+        
+        assert user is db_user
+        assert user.password_hash == "hashed"
+        assert session.queries == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_cached_by_id_hit_skips_database(self):
+        """Test that a cache hit returns a snapshot without querying"""
+        session = FakeSession([])
+        repo = UserRepository(session, cache=FakeCache([_user()]), email_filter=None)
+        
+        user = await repo.get_cached_by_id("u-1")
+        
+        assert isinstance(user, CachedUser)
+        assert (user.email, user.role, user.created_at) == ("jane@example.com", "CANDIDATE", datetime(2025, 1, 2, 3, 4, 5))
+        assert session.queries == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_cached_by_id_miss_loads_and_caches(self):
+        """Test that a miss reads the database and fills the cache"""
+        cache = FakeCache()
+        session = FakeSession([_user()])
+        repo = UserRepository(session, cache=cache, email_filter=None)
+        
+        user = await repo.get_cached_by_id("u-1")
+        
+        assert isinstance(user, CachedUser)
+        assert session.queries == 1
+        assert "u-1" in cache.rows
+    
+    @pytest.mark.asyncio
+    async def test_get_cached_by_email_follows_pointer(self):
+        """Test that the email pointer leads to the cached snapshot"""
+        session = FakeSession([])
+        repo = UserRepository(session, cache=FakeCache([_user()]), email_filter=None)
+        
+        user = await repo.get_cached_by_email("jane@example.com")
+        
+        assert user.id == "u-1"
+        assert session.queries == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_cached_by_id_unknown_user(self):
+        """Test that an unknown id gives None"""
+        repo = UserRepository(FakeSession([]), cache=FakeCache(), email_filter=None)
+        
+        assert await repo.get_cached_by_id("missing") is None
+
+
+class TestEmailCaseInsensitivity:
+    """Test suite for mixed-case email lookups"""
+    
+    def test_email_column_is_citext_on_postgresql(self):
+        """Test that email equality is compared as citext by PostgreSQL"""
+        email_type = User.__table__.c.email.type
+        
+        assert email_type.compile(dialect=postgresql.dialect()) == "CITEXT"
+        assert email_type.compile(dialect=sqlite.dialect()) == "VARCHAR"
+    
+    def test_lookup_query_compares_as_citext(self):
+        """Test that the repository's email filter binds through the citext column"""
+        statement = select(User).where(User.email.in_(["Jane@Example.com"]))
+        
+        compiled = statement.compile(dialect=postgresql.dialect())
+        
+        assert "users.email IN" in str(compiled)
+        assert isinstance(compiled.binds["email_1"].type.dialect_impl(postgresql.dialect()), postgresql.CITEXT)
+    
+    @pytest.mark.asyncio
+    async def test_get_by_email_mixed_case(self):
+        """Test that a row stored with different casing is returned for the lookup"""
+        db_user = _user(email="Jane@Example.com")
+        repo = UserRepository(FakeSession([db_user]), cache=FakeCache(), email_filter=None)
+        
+        assert await repo.get_by_email("jane@EXAMPLE.com") is db_user
+    
+    @pytest.mark.asyncio
+    async def test_get_cached_by_email_mixed_case(self):
+        """Test that the cached email pointer ignores casing"""
+        session = FakeSession([])
+        repo = UserRepository(session, cache=FakeCache([_user(email="Jane@Example.com")]), email_filter=None)
+        
+        user = await repo.get_cached_by_email("JANE@example.com")
+        
+        assert user.id == "u-1"
+        assert session.queries == 0
+
+
+class TestCachedUser:
+    """Test suite for the cached snapshot"""
+    
+    def test_snapshot_has_no_secrets(self):
+        """Test that secrets and lockout counters are not part of the snapshot"""
+        fields = {field.name for field in dataclasses.fields(CachedUser)}
+        
+        assert not fields & {"password_hash", "otp_code", "otp_attempts", "totp_secret", "current_refresh_token"}
+    
+    def test_snapshot_is_read_only(self):
+        """Test that snapshots can't be modified"""
+        user = CachedUser(**_load_user(_dump_user(_user())))
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            user.role = "ADMIN"
+
+
+class FakeBloomRedis:
+    """Just enough of a RedisBloom client, with each filter held as a set"""
+    
+    def __init__(self):
+        self.filters = {}
+    
+    async def execute_command(self, command, key, *args):
+        if command == "BF.RESERVE":
+            self.filters[key] = set()
+        elif command == "BF.INSERT":
+            if key not in self.filters:
+                raise RuntimeError("ERR not found")
+            self.filters[key].update(args[args.index("ITEMS") + 1:])
+        elif command == "BF.EXISTS":
+            return int(args[0] in self.filters.get(key, ()))
+    
+    async def exists(self, key):
+        return int(key in self.filters)
+    
+    async def delete(self, key):
+        self.filters.pop(key, None)
+    
+    async def rename(self, source, target):
+        self.filters[target] = self.filters.pop(source)
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+    
+    async def execute(self, raise_on_error=True):
+        results = []
+        for name, args in self.calls:
+            try:
+                results.append(await getattr(self.client, name)(*args))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+
+
+class FakeEmailStream:
+    """Streams the registered emails, calling ``during_scan`` after the first batch"""
+    
+    def __init__(self, emails, during_scan):
+        self.emails = emails
+        self.during_scan = during_scan
+    
+    async def partitions(self, size):
+        yield self.emails
+        await self.during_scan()
+
+
+class FakeScanSession:
+    def __init__(self, emails, during_scan):
+        self.emails = emails
+        self.during_scan = during_scan
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def scalar(self, statement):
+        return len(self.emails)
+    
+    async def stream_scalars(self, statement):
+        return FakeEmailStream(self.emails, self.during_scan)
+    
+    async def scalars(self, statement):
+        # The new user's transaction hasn't committed by the time of the replay
+        return []
+
+
+class TestEmailFilter:
+    """Test suite for EmailFilter"""
+    
+    @pytest.mark.asyncio
+    async def test_email_added_during_rebuild_survives_swap(self):
+        """Test that an email registered mid-rebuild is still found afterwards"""
+        redis = FakeBloomRedis()
+        redis.filters[EmailFilter.KEY] = {"jane@example.com"}
+        cache = FakeCache()
+        cache._redis = lambda: redis
+        
+        async def register_during_scan():
+            await email_filter.add("New@Example.com")
+        
+        email_filter = EmailFilter(
+            cache,
+            session_factory=lambda: FakeScanSession(["jane@example.com"], register_during_scan)
+        )
+        await email_filter.rebuild()
+        
+        assert await email_filter.might_exist("new@example.com")
+        assert await email_filter.might_exist("jane@example.com")
+        assert not await email_filter.might_exist("nobody@example.com")
+        assert EmailFilter.BUILDING_KEY not in redis.filters
+    
+    @pytest.mark.asyncio
+    async def test_add_without_rebuild(self):
+        """Test that add writes the live filter when no rebuild is running"""
+        redis = FakeBloomRedis()
+        redis.filters[EmailFilter.KEY] = set()
+        cache = FakeCache()
+        cache._redis = lambda: redis
+        email_filter = EmailFilter(cache)
+        
+        await email_filter.add("jane@example.com")
+        
+        assert redis.filters == {EmailFilter.KEY: {"jane@example.com"}}
@@ -2,134 +2,559 @@
 User Repository
 Handles database operations for User model.
 """
-from datetime import datetime
-from typing import Optional, List
+import asyncio
+import json
+import logging
+from dataclasses import make_dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, List, Tuple
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import DateTime, Row, String, column, delete, func, select, tuple_, update, values
 
-from backend_app.db.connection import Base
+from backend_app.config import settings
+from backend_app.db.connection import AsyncSessionLocal, Base, get_db
 from backend_app.models.users import User
+from backend_app.repositories.base_repo import BatchLoader
+
+logger = logging.getLogger(__name__)
+
+# Columns kept in Redis. Credentials, OTP/TOTP secrets, refresh tokens and
+# lockout counters are left out, so cache hits are served as read-only
+# CachedUser snapshots rather than User entities.
+_CACHED_COLUMNS = (
+    "id", "phone", "email", "whatsapp_number", "telegram_id",
+    "role", "full_name", "avatar_url",
+    "is_verified", "email_verified", "phone_verified", "status",
+    "totp_enabled", "require_mfa", "preferred_auth_method", "session_timeout",
+    "language", "timezone", "notifications_enabled",
+    "created_at", "last_login", "last_active"
+)
+_CACHED_DATETIME_COLUMNS = frozenset(
+    key for key in _CACHED_COLUMNS if isinstance(User.__table__.c[key].type, DateTime)
+)
+
+# Read-only snapshot of a user's cached columns
+CachedUser = make_dataclass("CachedUser", _CACHED_COLUMNS, frozen=True, slots=True)
+
+
+def _snapshot(user: User) -> CachedUser:
+    return CachedUser(**{key: getattr(user, key) for key in _CACHED_COLUMNS})
+
+
+def _dump_user(user: User) -> str:
+    data = {}
+    for key in _CACHED_COLUMNS:
+        value = getattr(user, key)
+        if value is not None and key in _CACHED_DATETIME_COLUMNS:
+            value = value.isoformat()
+        data[key] = value
+    return json.dumps(data)
+
+
+def _load_user(value: bytes) -> Dict[str, Any]:
+    data = json.loads(value)
+    for key in _CACHED_DATETIME_COLUMNS:
+        if data.get(key) is not None:
+            data[key] = datetime.fromisoformat(data[key])
+    return data
+
+
+class UserCache:
+    """
+    Redis read-through cache of user rows.
+    
+    ``user:id:{id}`` holds the non-secret column values as JSON and
+    ``user:email:{email}`` (lower-cased, as emails compare case-insensitively)
+    points at the id. Redis errors are logged and
+    treated as misses, so the database stays the source of truth.
+    """
+    
+    def __init__(self, redis_url: str, ttl: int = 300):
+        self.ttl = ttl
+        self._redis_url = redis_url
+        self._client = None
+    
+    def _redis(self):
+        if self._client is None and self.ttl > 0:
+            try:
+                import redis.asyncio as redis
+                self._client = redis.from_url(self._redis_url)
+            except ImportError:
+                logger.warning("Redis not available, user cache disabled")
+                self.ttl = 0
+        return self._client
+    
+    async def get_many(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached column values for whichever ids are cached"""
+        client = self._redis()
+        if client is None or not user_ids:
+            return {}
+        try:
+            values = await client.mget([f"user:id:{user_id}" for user_id in user_ids])
+        except Exception as e:
+            logger.warning(f"User cache read failed: {e}")
+            return {}
+        return {
+            user_id: _load_user(value)
+            for user_id, value in zip(user_ids, values)
+            if value is not None
+        }
+    
+    async def get_ids(self, emails: List[str]) -> Dict[str, str]:
+        """Cached user ids for whichever emails are cached"""
+        client = self._redis()
+        if client is None or not emails:
+            return {}
+        try:
+            values = await client.mget([f"user:email:{email.lower()}" for email in emails])
+        except Exception as e:
+            logger.warning(f"User cache read failed: {e}")
+            return {}
+        return {
+            email: value.decode()
+            for email, value in zip(emails, values)
+            if value is not None
+        }
+    
+    async def set_many(self, users: Iterable[User]) -> None:
+        """Cache the given users under both keys"""
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for user in users:
+                    pipe.set(f"user:id:{user.id}", _dump_user(user), ex=self.ttl)
+                    if user.email:
+                        pipe.set(f"user:email:{user.email.lower()}", user.id, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"User cache write failed: {e}")
+    
+    async def invalidate(self, user_id: str, email: Optional[str] = None) -> None:
+        """Drop a user's cache entries; the email is read from the cache if not given"""
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            if email is None:
+                cached = await self.get_many([user_id])
+                email = cached.get(user_id, {}).get("email")
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.delete(f"user:id:{user_id}")
+                if email:
+                    pipe.delete(f"user:email:{email.lower()}")
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"User cache invalidation failed: {e}")
+
+
+# Shared cache; safe to use from every request
+user_cache = UserCache(settings.REDIS_URL, settings.USER_CACHE_TTL)
+
+
+class LastActiveBuffer:
+    """
+    Collect last-active timestamps in memory and write them every
+    ``flush_interval`` seconds as one ``UPDATE ... FROM (VALUES ...)``,
+    instead of an UPDATE and commit per request.
+    """
+    
+    def __init__(self, session_factory=AsyncSessionLocal, flush_interval: float = 30.0):
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval
+        self._pending: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+    
+    def touch(self, user_id: str) -> None:
+        """Record activity for a user; later calls overwrite earlier ones"""
+        self._pending[user_id] = datetime.utcnow()
+    
+    async def flush(self) -> None:
+        """Write all buffered timestamps in one statement"""
+        if not self._pending:
+            return
+        # Swap without awaiting, so touch() never sees a half-written batch
+        batch, self._pending = self._pending, {}
+        rows = values(
+            column("id", String),
+            column("ts", DateTime(timezone=True)),
+            name="v"
+        ).data(list(batch.items()))
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    update(User)
+                    .where(User.id == rows.c.id)
+                    .values(last_active=rows.c.ts)
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to write last_active for %d users", len(batch))
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+
+# Shared buffer; start() it on application startup and stop() on shutdown
+last_active_buffer = LastActiveBuffer()
+
+
+class EmailFilter:
+    """
+    Redis Bloom filter (RedisBloom ``BF.*``) of registered emails, so
+    ``get_by_email`` for an unknown address skips the database.
+    
+    Bloom filters can't forget deleted emails, so the filter is rebuilt from
+    the users table every ``rebuild_interval`` seconds. Until a rebuild has
+    completed, or if Redis lacks the module, every email may exist.
+    
+    A rebuild fills ``BUILDING_KEY`` and renames it over ``KEY``. While it
+    exists, add() writes to both, so emails registered mid-rebuild (by any
+    process) survive the swap.
+    """
+    
+    KEY = "user:email_filter"
+    BUILDING_KEY = "user:email_filter:building"
+    ERROR_RATE = 0.001
+    
+    def __init__(
+        self,
+        cache: UserCache,
+        session_factory=AsyncSessionLocal,
+        rebuild_interval: float = 3600
+    ):
+        self._cache = cache
+        self._session_factory = session_factory
+        self.rebuild_interval = rebuild_interval
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Build the filter now and rebuild it every ``rebuild_interval`` seconds"""
+        if self._task is None and self.rebuild_interval > 0:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the rebuild task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def might_exist(self, email: str) -> bool:
+        """False only when the email is certainly not registered"""
+        client = self._cache._redis()
+        if client is None or self.rebuild_interval <= 0:
+            return True
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.exists(self.KEY)
+                pipe.execute_command("BF.EXISTS", self.KEY, email.lower())
+                ready, found = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Email filter read failed: {e}")
+            return True
+        return not ready or bool(found)
+    
+    async def add(self, email: str) -> None:
+        """Add a new user's email; NOCREATE so a missing filter stays missing, not partial"""
+        client = self._cache._redis()
+        if client is None or self.rebuild_interval <= 0:
+            return
+        email = email.lower()
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.execute_command("BF.INSERT", self.KEY, "NOCREATE", "ITEMS", email)
+                # Fails harmlessly unless a rebuild is in progress
+                pipe.execute_command("BF.INSERT", self.BUILDING_KEY, "NOCREATE", "ITEMS", email)
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.debug(f"Email filter add skipped: {e}")
+            return
+        if isinstance(results[0], Exception):
+            logger.debug(f"Email filter add skipped: {results[0]}")
+    
+    async def rebuild(self) -> None:
+        """Build a fresh filter from the users table and swap it in"""
+        client = self._cache._redis()
+        if client is None:
+            return
+        building = self.BUILDING_KEY
+        async with self._session_factory() as session:
+            # add() feeds the building filter too. Users committed while we
+            # scan are also re-added after the swap; the margin covers
+            # transactions that began before the building filter existed
+            started = await session.scalar(select(func.now() - timedelta(minutes=1)))
+            count = await session.scalar(select(func.count()).select_from(User))
+            await client.delete(building)
+            await client.execute_command(
+                "BF.RESERVE", building, self.ERROR_RATE, max(count * 2, 1000)
+            )
+            emails = await session.stream_scalars(
+                select(User.email).where(User.email.isnot(None))
+            )
+            async for batch in emails.partitions(1000):
+                await client.execute_command(
+                    "BF.INSERT", building, "NOCREATE", "ITEMS",
+                    *(email.lower() for email in batch)
+                )
+            await client.rename(building, self.KEY)
+            
+            recent = await session.scalars(
+                select(User.email)
+                .where(User.email.isnot(None), User.created_at >= started)
+            )
+            recent = [email.lower() for email in recent]
+            if recent:
+                await client.execute_command("BF.INSERT", self.KEY, "NOCREATE", "ITEMS", *recent)
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.rebuild()
+            except Exception:
+                logger.exception("Failed to rebuild the email filter")
+            await asyncio.sleep(self.rebuild_interval)
+
+
+# Shared filter; start() it on application startup and stop() on shutdown
+user_email_filter = EmailFilter(user_cache, rebuild_interval=settings.USER_EMAIL_FILTER_REBUILD_INTERVAL)
 
 
 class UserRepository:
-    """Repository for User model operations"""
+    """
+    Repository for User model operations.
     
-    def __init__(self, db: AsyncSession):
+    ``get_by_id``/``get_by_email`` always read the database and return User
+    entities with every column loaded. ``get_cached_by_id``/``get_cached_by_email``
+    answer from Redis when they can and return read-only CachedUser snapshots
+    without secrets, for hot paths such as token checks.
+    
+    Writes are flushed, not committed: the caller owns the transaction
+    and calls commit() once per unit of work, before building its response.
+    Database errors propagate; the uncommitted work is rolled back when the
+    session closes, and the application's exception handler answers with a 500.
+    """
+    
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: Optional[UserCache] = user_cache,
+        email_filter: Optional[EmailFilter] = user_email_filter
+    ):
         self.db = db
+        self.cache = cache
+        self.email_filter = email_filter
+        # user id -> email (if known) of rows written since the last commit
+        self._dirty: Dict[str, Optional[str]] = {}
+        # Lookups made concurrently within one request share a single SELECT,
+        # and both loaders take turns on the session
+        session_lock = asyncio.Lock()
+        self._id_loader = BatchLoader(self._load_by_ids, session_lock)
+        self._email_loader = BatchLoader(self._load_by_emails, session_lock)
+    
+    async def _load_by_ids(self, user_ids: List[str]) -> List[Optional[User]]:
+        result = await self.db.execute(
+            select(User).where(User.id.in_(user_ids))
+        )
+        loaded = result.scalars().all()
+        if self.cache is not None:
+            await self.cache.set_many(loaded)
+        users = {user.id: user for user in loaded}
+        return [users.get(user_id) for user_id in user_ids]
+    
+    async def _load_by_emails(self, emails: List[str]) -> List[Optional[User]]:
+        result = await self.db.execute(
+            select(User).where(User.email.in_(emails))
+        )
+        loaded = result.scalars().all()
+        if self.cache is not None:
+            await self.cache.set_many(loaded)
+        # citext matches emails case-insensitively, so map results the same way
+        users = {user.email.lower(): user for user in loaded}
+        return [users.get(email.lower()) for email in emails]
+    
+    def _invalidate(self, user_id: Optional[str] = None, email: Optional[str] = None) -> None:
+        """Drop cached lookups after a write; the shared cache is cleared on commit"""
+        self._id_loader.clear(user_id)
+        self._email_loader.clear()
+        if user_id is not None:
+            self._dirty[user_id] = email or self._dirty.get(user_id)
+    
+    async def commit(self) -> None:
+        """
+        Commit the writes made through this repository, then drop the
+        written users from the shared cache. Invalidating only after the
+        commit keeps a concurrent reader from re-caching the old row.
+        """
+        await self.db.commit()
+        dirty, self._dirty = self._dirty, {}
+        if self.cache is not None:
+            for user_id, email in dirty.items():
+                await self.cache.invalidate(user_id, email)
+    
+    async def load_columns(self, user: User, keys: Iterable[str]) -> None:
+        """Re-read columns from the database, e.g. ones another transaction may have changed"""
+        await self.db.refresh(user, list(keys))
+    
+    async def save(self, user: User) -> None:
+        """Flush changes made directly on a User entity"""
+        self.db.add(user)
+        await self.db.flush()
+        self._invalidate(str(user.id), user.email)
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
-        try:
-            result = await self.db.execute(
-                select(User).where(User.id == user_id)
-            )
-            return result.scalar_one_or_none()
-        except Exception:
-            return None
+        return await self._id_loader.load(str(user_id))
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        try:
-            result = await self.db.execute(
-                select(User).where(User.email == email)
-            )
-            return result.scalar_one_or_none()
-        except Exception:
+        if self.email_filter is not None and not await self.email_filter.might_exist(email):
+            return None
+        return await self._email_loader.load(email)
+    
+    async def get_cached_by_id(self, user_id: str) -> Optional[CachedUser]:
+        """Get a read-only snapshot of a user, from the cache when possible"""
+        user_id = str(user_id)
+        if self.cache is not None:
+            cached = await self.cache.get_many([user_id])
+            if user_id in cached:
+                return CachedUser(**cached[user_id])
+        user = await self.get_by_id(user_id)
+        return _snapshot(user) if user is not None else None
+    
+    async def get_cached_by_email(self, email: str) -> Optional[CachedUser]:
+        """Get a read-only snapshot of a user by email, from the cache when possible"""
+        if self.email_filter is not None and not await self.email_filter.might_exist(email):
             return None
+        if self.cache is not None:
+            user_id = (await self.cache.get_ids([email])).get(email)
+            if user_id is not None:
+                snapshot = await self.get_cached_by_id(user_id)
+                # A stale pointer falls through to the database
+                if snapshot is not None and snapshot.email and snapshot.email.lower() == email.lower():
+                    return snapshot
+        user = await self.get_by_email(email)
+        return _snapshot(user) if user is not None else None
+    
+    async def get_login_row(self, email: str) -> Optional[Row]:
+        """Get just the columns login needs, without building a User entity"""
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.email,
+                User.password_hash,
+                User.role,
+                User.status,
+                User.full_name
+            ).where(User.email == email)
+        )
+        return result.first()
     
     async def create(self, user_data: dict) -> User:
         """Create a new user"""
-        try:
-            user = User(**user_data)
-            self.db.add(user)
-            await self.db.commit()
-            await self.db.refresh(user)
-            return user
-        except IntegrityError:
-            await self.db.rollback()
-            raise
-        except Exception as e:
-            await self.db.rollback()
-            raise e
+        user = User(**user_data)
+        self.db.add(user)
+        await self.db.flush()
+        self._invalidate()
+        if self.email_filter is not None and user.email:
+            await self.email_filter.add(user.email)
+        await self.db.refresh(user)
+        return user
     
     async def update_last_login(self, user_id: str) -> bool:
         """Update user's last login timestamp"""
-        try:
-            await self.db.execute(
-                update(User)
-                .where(User.id == user_id)
-                .values(last_login=datetime.utcnow())
-            )
-            await self.db.commit()
-            return True
-        except Exception:
-            await self.db.rollback()
-            return False
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(last_login=func.now())
+        )
+        self._invalidate(str(user_id))
+        return True
     
     async def update_last_active(self, user_id: str) -> bool:
-        """Update user's last active timestamp"""
-        try:
-            await self.db.execute(
-                update(User)
-                .where(User.id == user_id)
-                .values(last_active=datetime.utcnow())
-            )
-            await self.db.commit()
-            return True
-        except Exception:
-            await self.db.rollback()
-            return False
+        """Update user's last active timestamp (written in batches by last_active_buffer)"""
+        last_active_buffer.touch(str(user_id))
+        return True
     
     async def update_status(self, user_id: str, status: str) -> bool:
         """Update user status"""
-        try:
-            await self.db.execute(
-                update(User)
-                .where(User.id == user_id)
-                .values(status=status)
-            )
-            await self.db.commit()
-            return True
-        except Exception:
-            await self.db.rollback()
-            return False
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(status=status)
+        )
+        self._invalidate(str(user_id))
+        return True
     
     async def update_verification_status(self, user_id: str, is_verified: bool) -> bool:
         """Update user verification status"""
-        try:
-            await self.db.execute(
-                update(User)
-                .where(User.id == user_id)
-                .values(is_verified=is_verified)
-            )
-            await self.db.commit()
-            return True
-        except Exception:
-            await self.db.rollback()
-            return False
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_verified=is_verified)
+        )
+        self._invalidate(str(user_id))
+        return True
     
-    async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination"""
-        try:
-            result = await self.db.execute(
-                select(User)
-                .offset(skip)
-                .limit(limit)
-            )
-            return result.scalars().all()
-        except Exception:
-            return []
+    async def get_all_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[User]:
+        """
+        Get all users ordered by (created_at, id).
+        
+        Pass the last row's ``(created_at, id)`` as ``after`` to fetch the next
+        page with an index seek; ``skip`` (OFFSET) still works but gets slower
+        with depth.
+        """
+        stmt = select(User).order_by(User.created_at, User.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(tuple_(User.created_at, User.id) > tuple_(*after))
+        elif skip:
+            stmt = stmt.offset(skip)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
     
     async def delete_user(self, user_id: str) -> bool:
         """Delete user by ID"""
-        try:
-            user = await self.get_by_id(user_id)
-            if user:
-                await self.db.delete(user)
-                await self.db.commit()
-                return True
+        # One statement; RETURNING gives the email for cache invalidation
+        result = await self.db.execute(
+            delete(User)
+            .where(User.id == user_id)
+            .returning(User.email)
+        )
+        row = result.first()
+        if row is None:
             return False
-        except Exception:
-            await self.db.rollback()
-            return False
\ No newline at end of file
+        self._invalidate(str(user_id), row.email)
+        return True
+
+
+async def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
+    """FastAPI dependency: a UserRepository (and its lookup cache) per request; call commit() after writes"""
+    return UserRepository(db)
@@ -4,12 +4,17 @@ Security Scan Module - API Endpoints
 FastAPI router for security scan operations.
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
+import asyncio
 import logging
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ..security_scan.io_contract import ScanRequest, ScanResult, VirusUpdateStatus, ScanStatus
 from ..security_scan.scan_service import ClamAVScanService
@@ -43,16 +48,42 @@ class ManualRestoreResponse(BaseModel):
 
 
 # Router setup
+# orjson serializes the polled status/summary payloads much faster than json
 router = APIRouter(
     prefix="/security",
     tags=["Security Scan"],
+    default_response_class=ORJSONResponse,
     responses={404: {"description": "Not found"}}
 )
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
+# Configuration is fixed for the process, so derive the byte limits once
+_config = get_config()
+_HARD_LIMIT_BYTES = _config.max_hard_limit_mb << 20
+_UPLOAD_LIMIT_BYTES = _config.max_upload_size_mb << 20
+
+# /summary responses are reused for this many seconds
+SUMMARY_CACHE_TTL = 5.0
+_summary_cache: Optional[Tuple[float, dict]] = None
+_summary_lock = asyncio.Lock()
+
+# Serialises start/stop on the shared scheduler instance
+_scheduler_lock = asyncio.Lock()
+
+# Blocking ClamAV scans run here, sized to clamd's MaxThreads so concurrent
+# uploads scan in parallel without oversubscribing the daemon
+_scan_executor = ThreadPoolExecutor(
+    max_workers=_config.clamav_max_threads,
+    thread_name_prefix="clamav-scan"
+)
+
+
+@lru_cache(maxsize=1)
 def get_scan_service() -> ClamAVScanService:
     """Dependency to get scan service instance."""
     config = get_config()
@@ -61,6 +92,7 @@ def get_scan_service() -> ClamAVScanService:
     return scan_service
 
 
+@lru_cache(maxsize=1)
 def get_quarantine_manager() -> FileQuarantineManager:
     """Dependency to get quarantine manager instance."""
     config = get_config()
@@ -68,6 +100,7 @@ def get_quarantine_manager() -> FileQuarantineManager:
     return quarantine_manager
 
 
+@lru_cache(maxsize=1)
 def get_virus_update_manager() -> ClamAVUpdateManager:
     """Dependency to get virus update manager instance."""
     config = get_config()
@@ -80,10 +113,12 @@ def get_virus_update_manager() -> ClamAVUpdateManager:
     return update_manager
 
 
-def get_scheduler() -> APSchedulerManager:
+@lru_cache(maxsize=1)
+def get_scheduler(
+    update_manager: ClamAVUpdateManager = Depends(get_virus_update_manager),
+    quarantine_manager: FileQuarantineManager = Depends(get_quarantine_manager)
+) -> APSchedulerManager:
     """Dependency to get scheduler instance."""
-    update_manager = get_virus_update_manager()
-    quarantine_manager = get_quarantine_manager()
     scheduler = APSchedulerManager(update_manager, quarantine_manager)
     return scheduler
 
@@ -110,38 +145,45 @@ async def scan_file(
         HTTP 400 BAD REQUEST for unsupported file types
         HTTP 200 OK with ScanResult for successful scans
     """
+    temp_path = None
     try:
-        # Validate file size
-        config = get_config()
-        content = await file.read()
-        
-        file_size = len(content)
-        
-        if file_size > config.max_hard_limit_mb * 1024 * 1024:
-            # File exceeds hard limit (15MB) - immediate rejection
+        # Validate MIME type before reading the body
+        if file.content_type not in _config.allowed_mime_types:
             raise HTTPException(
-                status_code=413,
-                detail=f"File exceeds {config.max_hard_limit_mb}MB limit"
+                status_code=400,
+                detail=f"Unsupported file type: {file.content_type}"
             )
-        elif file_size > config.max_upload_size_mb * 1024 * 1024:
+        
+        # Stream the upload to a temporary file in the incoming folder,
+        # checking the size as we go instead of buffering it in memory
+        file_size = 0
+        os.makedirs(quarantine_manager.incoming_path, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=quarantine_manager.incoming_path, suffix=".part", delete=False) as tmp:
+            temp_path = tmp.name
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > _HARD_LIMIT_BYTES:
+                    # File exceeds hard limit (15MB) - immediate rejection
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File exceeds {_config.max_hard_limit_mb}MB limit"
+                    )
+                if file_size <= _UPLOAD_LIMIT_BYTES:
+                    tmp.write(chunk)
+        
+        if file_size > _UPLOAD_LIMIT_BYTES:
             # File exceeds default limit (5MB) but under hard limit
             raise HTTPException(
                 status_code=413,
-                detail=f"File exceeds {config.max_upload_size_mb}MB default limit, please compress and retry"
-            )
-        
-        # Validate MIME type
-        if file.content_type not in config.allowed_mime_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type: {file.content_type}"
+                detail=f"File exceeds {_config.max_upload_size_mb}MB default limit, please compress and retry"
             )
         
         # Move to incoming folder
-        incoming_path = quarantine_manager.move_to_incoming(content, file.filename)
+        incoming_path = await asyncio.to_thread(quarantine_manager.move_file_to_incoming, temp_path, file.filename)
+        temp_path = None
         
         # Move to scanning folder
-        scanning_path = quarantine_manager.move_to_scanning(incoming_path)
+        scanning_path = await asyncio.to_thread(quarantine_manager.move_to_scanning, incoming_path)
         
         # Create scan request
         scan_request = ScanRequest(
@@ -150,15 +192,16 @@ async def scan_file(
             mime_type=file.content_type
         )
         
-        # Perform scan
-        scan_result = scan_service.scan_file(scan_request)
+        # Perform scan off the event loop
+        loop = asyncio.get_running_loop()
+        scan_result = await loop.run_in_executor(_scan_executor, scan_service.scan_file, scan_request)
         
         # Move file based on scan result
         if scan_result.status == ScanStatus.SAFE:
-            final_path = quarantine_manager.mark_as_safe(scanning_path)
+            final_path = await asyncio.to_thread(quarantine_manager.mark_as_safe, scanning_path)
             response_path = final_path
         elif scan_result.status == ScanStatus.INFECTED:
-            final_path = quarantine_manager.mark_as_infected(scanning_path)
+            final_path = await asyncio.to_thread(quarantine_manager.mark_as_infected, scanning_path)
             response_path = final_path
         else:
             # ERROR or REJECTED_SIZE_LIMIT status - keep in scanning folder for investigation
@@ -173,11 +216,10 @@ async def scan_file(
             timestamp=scan_result.timestamp.isoformat()
         )
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Scan file error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Drop a partial upload that never reached the incoming folder
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
 
 
 @router.get("/virus-db-status", response_model=VirusDBStatusResponse)
@@ -190,18 +232,13 @@ async def get_virus_db_status(
     Returns:
         VirusUpdateStatus: Database validation status
     """
-    try:
-        db_status = update_manager.validate_virus_db()
-        
-        return VirusDBStatusResponse(
-            last_update=db_status.last_update.isoformat(),
-            checksum_valid=db_status.checksum_valid,
-            db_version=db_status.db_version
-        )
-        
-    except Exception as e:
-        logger.error(f"Get virus DB status error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    db_status = update_manager.validate_virus_db()
+    
+    return VirusDBStatusResponse(
+        last_update=db_status.last_update.isoformat(),
+        checksum_valid=db_status.checksum_valid,
+        db_version=db_status.db_version
+    )
 
 
 @router.post("/manual-db-restore", response_model=ManualRestoreResponse)
@@ -215,30 +252,25 @@ async def manual_db_restore(
     Returns:
         bool: True if restore successful, False otherwise
     """
-    try:
-        # Perform restore in background
-        success = update_manager.restore_backup_db()
+    # Perform restore in background
+    success = update_manager.restore_backup_db()
+    
+    if success:
+        # Reload engine after successful restore
+        reload_success = update_manager.reload_clamav_engine()
         
-        if success:
-            # Reload engine after successful restore
-            reload_success = update_manager.reload_clamav_engine()
-            
-            if reload_success:
-                message = "Database restored and engine reloaded successfully"
-            else:
-                message = "Database restored but engine reload failed"
-                success = False
+        if reload_success:
+            message = "Database restored and engine reloaded successfully"
         else:
-            message = "Database restore failed"
-        
-        return ManualRestoreResponse(
-            success=success,
-            message=message
-        )
-        
-    except Exception as e:
-        logger.error(f"Manual DB restore error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+            message = "Database restored but engine reload failed"
+            success = False
+    else:
+        message = "Database restore failed"
+    
+    return ManualRestoreResponse(
+        success=success,
+        message=message
+    )
 
 
 @router.post("/start-scheduler")
@@ -249,21 +281,17 @@ async def start_scheduler(
     """
     Start the daily virus database maintenance scheduler.
     """
-    try:
+    async with _scheduler_lock:
         scheduler.start()
         scheduler.schedule_midnight_db_check()
-        
-        jobs = scheduler.get_jobs()
-        
-        return {
-            "message": "Scheduler started successfully",
-            "scheduled_jobs": len(jobs),
-            "jobs": [job.id for job in jobs]
-        }
-        
-    except Exception as e:
-        logger.error(f"Start scheduler error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    jobs = scheduler.get_jobs()
+    
+    return {
+        "message": "Scheduler started successfully",
+        "scheduled_jobs": len(jobs),
+        "jobs": [job.id for job in jobs]
+    }
 
 
 @router.post("/stop-scheduler")
@@ -273,16 +301,13 @@ async def stop_scheduler(
     """
     Stop the daily virus database maintenance scheduler.
     """
-    try:
-        scheduler.stop()
-        
-        return {
-            "message": "Scheduler stopped successfully"
-        }
-        
-    except Exception as e:
-        logger.error(f"Stop scheduler error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with _scheduler_lock:
+        # shutdown waits for a running job, so keep it off the event loop
+        await asyncio.to_thread(scheduler.stop)
+    
+    return {
+        "message": "Scheduler stopped successfully"
+    }
 
 
 @router.get("/scheduler-status")
@@ -291,26 +316,11 @@ async def get_scheduler_status(
 ):
     """
     Get current scheduler status and jobs.
+    
+    Served from a snapshot the scheduler rebuilds only after a job or
+    state change, so dashboards can poll this cheaply.
     """
-    try:
-        jobs = scheduler.get_jobs()
-        
-        return {
-            "running": scheduler.scheduler.running,
-            "job_count": len(jobs),
-            "jobs": [
-                {
-                    "id": job.id,
-                    "name": job.name,
-                    "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None
-                }
-                for job in jobs
-            ]
-        }
-        
-    except Exception as e:
-        logger.error(f"Get scheduler status error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return scheduler.get_status()
 
 
 @router.get("/health")
@@ -325,6 +335,56 @@ async def health_check():
     }
 
 
+def _count_quarantine_files(quarantine_manager: FileQuarantineManager) -> dict:
+    """Count the files in each quarantine folder (blocking directory reads)."""
+    folders = quarantine_manager.get_quarantine_paths()
+    folder_counts = {}
+    
+    for folder_name, folder_path in folders.items():
+        if folder_name == 'logs':
+            folder_counts[folder_name] = 0
+            continue
+        try:
+            # DirEntry.is_file() uses the d_type from the directory read,
+            # so counting needs no stat per file
+            with os.scandir(folder_path) as entries:
+                folder_counts[folder_name] = sum(
+                    1 for entry in entries if entry.is_file(follow_symlinks=False)
+                )
+        except Exception:
+            # Includes FileNotFoundError for a missing folder
+            folder_counts[folder_name] = 0
+    
+    return folder_counts
+
+
+async def _build_security_summary(
+    update_manager: ClamAVUpdateManager,
+    quarantine_manager: FileQuarantineManager,
+    scheduler: APSchedulerManager
+) -> dict:
+    """Collect the security summary; folder counting and DB checksumming run concurrently."""
+    folder_counts, db_status = await asyncio.gather(
+        asyncio.to_thread(_count_quarantine_files, quarantine_manager),
+        asyncio.to_thread(update_manager.validate_virus_db)
+    )
+    
+    # Get ClamAV status (simplified check)
+    clamav_status = "running"  # In real implementation, check ClamAV daemon
+    
+    # Get scheduler status
+    scheduler_active = scheduler.scheduler.running
+    
+    return {
+        "folders": folder_counts,
+        "clamav": clamav_status,
+        "db_checksum_valid": db_status.checksum_valid,
+        "scheduler_active": scheduler_active,
+        "last_db_update": db_status.last_update.isoformat() if db_status.last_update else None,
+        "db_version": db_status.db_version
+    }
+
+
 @router.get("/summary")
 async def get_security_summary(
     update_manager: ClamAVUpdateManager = Depends(get_virus_update_manager),
@@ -335,44 +395,12 @@ async def get_security_summary(
     Lightweight health summary endpoint.
     
     Returns folder counts, ClamAV status, DB checksum, and scheduler status.
+    The summary is cached for SUMMARY_CACHE_TTL seconds so polling dashboards
+    share one computation; concurrent misses wait for a single rebuild.
     """
-    try:
-        # Get folder counts
-        folders = quarantine_manager.get_quarantine_paths()
-        folder_counts = {}
-        
-        for folder_name, folder_path in folders.items():
-            if folder_name != 'logs' and os.path.exists(folder_path):
-                try:
-                    file_count = len([
-                        f for f in os.listdir(folder_path)
-                        if os.path.isfile(os.path.join(folder_path, f))
-                    ])
-                    folder_counts[folder_name] = file_count
-                except Exception:
-                    folder_counts[folder_name] = 0
-            else:
-                folder_counts[folder_name] = 0
-        
-        # Get ClamAV status (simplified check)
-        clamav_status = "running"  # In real implementation, check ClamAV daemon
-        
-        # Get DB checksum status
-        db_status = update_manager.validate_virus_db()
-        db_checksum_valid = db_status.checksum_valid
-        
-        # Get scheduler status
-        scheduler_active = scheduler.scheduler.running
-        
-        return {
-            "folders": folder_counts,
-            "clamav": clamav_status,
-            "db_checksum_valid": db_checksum_valid,
-            "scheduler_active": scheduler_active,
-            "last_db_update": db_status.last_update.isoformat() if db_status.last_update else None,
-            "db_version": db_status.db_version
-        }
-        
-    except Exception as e:
-        logger.error(f"Security summary error: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    global _summary_cache
+    async with _summary_lock:
+        if _summary_cache is None or time.monotonic() - _summary_cache[0] >= SUMMARY_CACHE_TTL:
+            summary = await _build_security_summary(update_manager, quarantine_manager, scheduler)
+            _summary_cache = (time.monotonic(), summary)
+        return _summary_cache[1]
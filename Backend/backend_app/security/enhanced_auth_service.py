@@ -16,6 +16,9 @@ from ..shared.exceptions import AuthenticationError, RateLimitError, SecurityErr
 
 logger = logging.getLogger(__name__)
 
+# Refresh-token state, which UserRepository's cache never holds
+_TOKEN_COLUMNS = ("current_refresh_token", "refresh_token_version")
+
 class EnhancedAuthService:
     def __init__(self, db: Session):
         self.db = db
@@ -140,14 +143,16 @@ class EnhancedAuthService:
             if not self.otp_service.verify_otp(user, otp_code):
                 # Increment failed attempts
                 user.increment_login_attempts()
-                self.user_repo.save(user)
+                await self.user_repo.save(user)
+                await self.user_repo.commit()
                 raise AuthenticationError("Invalid OTP")
             
             # Reset failed attempts
             user.reset_login_attempts()
             user.mark_verified()
             user.update_last_login()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             # Generate tokens
             tokens = self.token_manager.create_tokens_for_user(user.id, user.role)
@@ -181,7 +186,8 @@ class EnhancedAuthService:
                 # Send OTP via email
                 otp_code = self.email_service.send_otp(user.email)
                 user.update_otp(otp_code, datetime.utcnow() + timedelta(minutes=5))
-                self.user_repo.save(user)
+                await self.user_repo.save(user)
+                await self.user_repo.commit()
                 
                 return {
                     "status": "otp_sent",
@@ -193,7 +199,8 @@ class EnhancedAuthService:
             # Verify OTP
             if not user.is_otp_valid(otp_code):
                 user.increment_login_attempts()
-                self.user_repo.save(user)
+                await self.user_repo.save(user)
+                await self.user_repo.commit()
                 raise AuthenticationError("Invalid OTP")
             
             # Reset failed attempts
@@ -202,7 +209,8 @@ class EnhancedAuthService:
             user.email_verified = True
             user.update_last_login()
             user.clear_otp()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             # Generate tokens
             tokens = self.token_manager.create_tokens_for_user(user.id, user.role)
@@ -238,14 +246,16 @@ class EnhancedAuthService:
             # Verify video OTP
             if not self.video_otp_service.verify_video_otp_session(session_id, user_otp):
                 user.increment_login_attempts()
-                self.user_repo.save(user)
+                await self.user_repo.save(user)
+                await self.user_repo.commit()
                 raise AuthenticationError("Invalid video OTP")
             
             # Reset failed attempts
             user.reset_login_attempts()
             user.mark_verified()
             user.update_last_login()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             # Generate tokens
             tokens = self.token_manager.create_tokens_for_user(user.id, user.role)
@@ -273,12 +283,13 @@ class EnhancedAuthService:
             # Link social account if not already linked
             if not user.has_social_login(provider):
                 user.set_social_login_id(provider, social_user["id"])
-                self.user_repo.save(user)
+                await self.user_repo.save(user)
             
             # Mark user as verified
             user.mark_verified()
             user.update_last_login()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             # Generate tokens
             tokens = self.token_manager.create_tokens_for_user(user.id, user.role)
@@ -308,13 +319,15 @@ class EnhancedAuthService:
                     logger.info("User authenticated with backup code")
                 else:
                     user.increment_login_attempts()
-                    self.user_repo.save(user)
+                    await self.user_repo.save(user)
+                    await self.user_repo.commit()
                     raise AuthenticationError("Invalid TOTP code")
             
             # Reset failed attempts
             user.reset_login_attempts()
             user.update_last_login()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             # Generate tokens
             tokens = self.token_manager.create_tokens_for_user(user.id, user.role)
@@ -375,11 +388,14 @@ class EnhancedAuthService:
                 raise AuthenticationError("Invalid refresh token")
             
             user_id = payload.get("sub")
-            user = self.user_repo.get_by_id(user_id)
+            user = await self.user_repo.get_by_id(user_id)
             
             if not user:
                 raise AuthenticationError("User not found")
             
+            # Token columns are never cached; read them from the database
+            await self.user_repo.load_columns(user, _TOKEN_COLUMNS)
+            
             # Check if refresh token is valid
             if user.current_refresh_token != refresh_token:
                 raise AuthenticationError("Refresh token revoked")
@@ -391,7 +407,8 @@ class EnhancedAuthService:
             user.current_refresh_token = tokens["refresh_token"]
             user.rotate_refresh_token()
             user.update_last_login()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "tokens_refreshed",
@@ -408,13 +425,14 @@ class EnhancedAuthService:
         try:
             # Invalidate refresh token
             if refresh_token:
+                await self.user_repo.load_columns(user, _TOKEN_COLUMNS)
                 user.current_refresh_token = None
                 user.rotate_refresh_token()
-                self.user_repo.save(user)
             
             # Update last activity
             user.update_last_active()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "logged_out",
@@ -428,9 +446,11 @@ class EnhancedAuthService:
     async def revoke_all_tokens(self, user: User) -> Dict[str, Any]:
         """Revoke all user tokens"""
         try:
+            await self.user_repo.load_columns(user, _TOKEN_COLUMNS)
             user.current_refresh_token = None
             user.rotate_refresh_token()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "tokens_revoked",
@@ -459,7 +479,8 @@ class EnhancedAuthService:
             
             # Store secret temporarily (don't enable yet)
             user.set_totp_secret(secret)
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "totp_setup",
@@ -485,7 +506,8 @@ class EnhancedAuthService:
             
             # Enable TOTP
             user.enable_totp()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "totp_enabled",
@@ -508,7 +530,8 @@ class EnhancedAuthService:
             
             # Disable TOTP
             user.disable_totp()
-            self.user_repo.save(user)
+            await self.user_repo.save(user)
+            await self.user_repo.commit()
             
             return {
                 "status": "totp_disabled",
@@ -5,31 +5,66 @@ Configuration and folder setup for the security scan module.
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+
+# Checked on every upload: hashed O(1) membership, and immutable so every
+# config instance can share it
+_ALLOWED_MIME_TYPES: frozenset = frozenset({
+    'application/pdf',
+    'application/msword',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'text/plain',
+    'application/zip',
+    'application/x-rar-compressed'
+})
+
+
+@lru_cache(maxsize=None)
+def _create_folders(folders: Tuple[str, ...]) -> None:
+    """
+    Create whichever of ``folders`` are missing.
+    
+    Each parent directory is listed once with os.scandir and only absent
+    children are created, instead of a makedirs (several syscalls) per
+    folder. Parents must come before their children. Memoized, so repeated
+    calls for the same layout are no-ops.
+    
+    Args:
+        folders (Tuple[str, ...]): Folder paths, parents first
+    """
+    children: Dict[str, List[str]] = {}
+    for folder in folders:
+        parent, name = os.path.split(os.path.normpath(folder))
+        children.setdefault(parent, []).append(name)
+    
+    for parent, names in children.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            os.makedirs(parent, exist_ok=True)
+            existing = set()
+        for name in names:
+            if name not in existing:
+                os.makedirs(os.path.join(parent, name), exist_ok=True)
 
 
 class SecurityScanConfig:
     """Configuration class for security scan module."""
     
     def __init__(self):
-        """Initialize configuration with default values."""
-        # Base paths
-        self.base_data_path = self._get_base_data_path()
-        self.quarantine_base_path = os.path.join(self.base_data_path, "quarantine")
-        self.virus_db_path = os.path.join(self.base_data_path, "virus_db")
-        self.backup_db_path = os.path.join(self.base_data_path, "virus_db_backup")
-        
-        # Quarantine subfolders
-        self.incoming_path = os.path.join(self.quarantine_base_path, "incoming")
-        self.scanning_path = os.path.join(self.quarantine_base_path, "scanning")
-        self.clean_path = os.path.join(self.quarantine_base_path, "clean")
-        self.infected_path = os.path.join(self.quarantine_base_path, "infected")
-        self.logs_path = os.path.join(self.quarantine_base_path, "logs")
+        """
+        Initialize configuration with default values.
         
+        Folder paths are cached properties, built on first access.
+        """
         # ClamAV configuration
         self.clamav_socket = None  # None for localhost, or specify socket path
         self.clamav_timeout = 30  # seconds
+        self.clamav_max_threads = 10  # match clamd's MaxThreads so scans don't queue inside clamd
         
         # Security settings - File Size Validation
         # Default mode: 5 MB
@@ -38,36 +73,72 @@ class SecurityScanConfig:
         self.max_upload_size_mb = 5  # Default upload limit: 5MB
         self.max_hard_limit_mb = 15  # Absolute fail-safe limit: 15MB
         self.max_file_size = self.max_hard_limit_mb * 1024 * 1024  # Convert to bytes
-        self.allowed_mime_types = [
-            'application/pdf',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'text/plain',
-            'application/zip',
-            'application/x-rar-compressed'
-        ]
+        self.allowed_mime_types = _ALLOWED_MIME_TYPES
         
         # Logging configuration
         self.log_level = "INFO"
-        self.log_file = os.path.join(self.logs_path, "security_scan.log")
     
-    def _get_base_data_path(self) -> str:
+    @cached_property
+    def base_data_path(self) -> Path:
         """
         Get the base data path for the application.
         
         Returns:
-            str: Base data path
+            Path: Base data path
         """
         # Try to get from environment variable first
         base_path = os.environ.get('SECURITY_SCAN_DATA_PATH')
         if base_path:
-            return base_path
+            return Path(base_path)
         
         # Default to data directory in project root
-        project_root = self._get_project_root()
-        default_path = os.path.join(project_root, "data")
-        
-        return default_path
+        return Path(self._get_project_root()) / "data"
+    
+    @cached_property
+    def quarantine_base_path(self) -> Path:
+        """Root of the quarantine folders."""
+        return Path(self.base_data_path) / "quarantine"
+    
+    @cached_property
+    def virus_db_path(self) -> Path:
+        """ClamAV database folder."""
+        return Path(self.base_data_path) / "virus_db"
+    
+    @cached_property
+    def backup_db_path(self) -> Path:
+        """Last known-good ClamAV database."""
+        return Path(self.base_data_path) / "virus_db_backup"
+    
+    # Quarantine subfolders
+    @cached_property
+    def incoming_path(self) -> Path:
+        """Uploads waiting to be scanned."""
+        return Path(self.quarantine_base_path) / "incoming"
+    
+    @cached_property
+    def scanning_path(self) -> Path:
+        """Files being scanned."""
+        return Path(self.quarantine_base_path) / "scanning"
+    
+    @cached_property
+    def clean_path(self) -> Path:
+        """Files that scanned clean."""
+        return Path(self.quarantine_base_path) / "clean"
+    
+    @cached_property
+    def infected_path(self) -> Path:
+        """Files that scanned infected."""
+        return Path(self.quarantine_base_path) / "infected"
+    
+    @cached_property
+    def logs_path(self) -> Path:
+        """Quarantine operation logs."""
+        return Path(self.quarantine_base_path) / "logs"
+    
+    @cached_property
+    def log_file(self) -> Path:
+        """Security scan log file."""
+        return Path(self.logs_path) / "security_scan.log"
     
     def _get_project_root(self) -> str:
         """
@@ -82,10 +153,30 @@ class SecurityScanConfig:
         
         return str(project_root)
     
+    def add_allowed_mime(self, mime_type: str) -> frozenset:
+        """
+        Allow another MIME type for this configuration.
+        
+        Args:
+            mime_type (str): MIME type to allow
+            
+        Returns:
+            frozenset: The new set of allowed MIME types
+        """
+        self.allowed_mime_types = self.allowed_mime_types | {mime_type}
+        return self.allowed_mime_types
+    
     def ensure_folder_structure(self) -> None:
         """
         Ensure all required folders exist and create them if necessary.
+        
+        A ``.initialized`` marker in the base data path records a completed
+        run, so later calls cost a single stat.
         """
+        marker = Path(self.base_data_path) / ".initialized"
+        if marker.exists():
+            return
+        
         folders = [
             self.base_data_path,
             self.quarantine_base_path,
@@ -98,8 +189,8 @@ class SecurityScanConfig:
             self.logs_path
         ]
         
-        for folder in folders:
-            os.makedirs(folder, exist_ok=True)
+        _create_folders(tuple(str(folder) for folder in folders))
+        marker.touch()
     
     def get_quarantine_paths(self) -> dict:
         """
@@ -142,18 +233,26 @@ class SecurityScanConfig:
         return config
 
 
-# Default configuration instance
-default_config = SecurityScanConfig.create_default_config()
-
-
+@lru_cache(maxsize=None)
 def get_config() -> SecurityScanConfig:
     """
-    Get the default configuration instance.
+    Get the default configuration instance, built on first use.
     
     Returns:
         SecurityScanConfig: Configuration instance
     """
-    return default_config
+    return SecurityScanConfig.create_default_config()
+
+
+# Environment variables get_config_from_env() reads
+_ENV_VARS = (
+    'SECURITY_SCAN_DATA_PATH',
+    'CLAMAV_SOCKET',
+    'CLAMAV_TIMEOUT',
+    'MAX_UPLOAD_SIZE_MB',
+    'MAX_HARD_LIMIT_MB',
+    'CLAMAV_MAX_THREADS'
+)
 
 
 # Environment-based configuration
@@ -161,24 +260,41 @@ def get_config_from_env() -> SecurityScanConfig:
     """
     Get configuration based on environment variables.
     
+    Parsed configurations are cached per snapshot of the environment
+    variables, so repeat calls with an unchanged environment return the same
+    (shared, so treat it as read-only) instance.
+    
     Returns:
         SecurityScanConfig: Configuration instance
     """
+    return _config_from_env(tuple(os.environ.get(name) for name in _ENV_VARS))
+
+
+@lru_cache(maxsize=4)
+def _config_from_env(snapshot: Tuple[Optional[str], ...]) -> SecurityScanConfig:
+    """
+    Build a configuration from a snapshot of the environment variables.
+    
+    Args:
+        snapshot: Values of _ENV_VARS, in order (SECURITY_SCAN_DATA_PATH is
+            part of the key because it is read by base_data_path)
+        
+    Returns:
+        SecurityScanConfig: Configuration instance
+    """
+    _, clamav_socket, clamav_timeout, max_upload_size, max_hard_limit, clamav_max_threads = snapshot
     config = SecurityScanConfig()
     
     # Override with environment variables if present
-    clamav_socket = os.environ.get('CLAMAV_SOCKET')
     if clamav_socket:
         config.clamav_socket = clamav_socket
     
-    clamav_timeout = os.environ.get('CLAMAV_TIMEOUT')
     if clamav_timeout:
         try:
             config.clamav_timeout = int(clamav_timeout)
         except ValueError:
             pass
     
-    max_upload_size = os.environ.get('MAX_UPLOAD_SIZE_MB')
     if max_upload_size:
         try:
             config.max_upload_size_mb = int(max_upload_size)
@@ -186,13 +302,18 @@ def get_config_from_env() -> SecurityScanConfig:
         except ValueError:
             pass
     
-    max_hard_limit = os.environ.get('MAX_HARD_LIMIT_MB')
     if max_hard_limit:
         try:
             config.max_hard_limit_mb = int(max_hard_limit)
         except ValueError:
             pass
     
+    if clamav_max_threads:
+        try:
+            config.clamav_max_threads = int(clamav_max_threads)
+        except ValueError:
+            pass
+    
     # Ensure folders exist
     config.ensure_folder_structure()
     
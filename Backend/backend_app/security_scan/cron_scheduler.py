@@ -5,9 +5,24 @@ Interface definitions for scheduled virus database maintenance.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 import logging
+import threading
+from apscheduler.events import (
+    EVENT_JOB_ADDED,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_ERROR,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+    EVENT_ALL_JOBS_REMOVED,
+    EVENT_SCHEDULER_PAUSED,
+    EVENT_SCHEDULER_RESUMED,
+    EVENT_SCHEDULER_SHUTDOWN,
+    EVENT_SCHEDULER_START,
+)
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -50,6 +65,16 @@ class CronScheduler(ABC):
         pass
 
 
+# Events after which the status snapshot is stale: the job list or a
+# next_run_time changed, or the scheduler changed state
+_STATUS_EVENTS = (
+    EVENT_JOB_ADDED | EVENT_JOB_REMOVED | EVENT_JOB_MODIFIED | EVENT_ALL_JOBS_REMOVED
+    | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
+    | EVENT_SCHEDULER_START | EVENT_SCHEDULER_SHUTDOWN
+    | EVENT_SCHEDULER_PAUSED | EVENT_SCHEDULER_RESUMED
+)
+
+
 class APSchedulerManager(CronScheduler):
     """Concrete implementation using APScheduler."""
     
@@ -67,8 +92,24 @@ class APSchedulerManager(CronScheduler):
         """
         self.virus_update_manager = virus_update_manager
         self.quarantine_manager = quarantine_manager
-        self.scheduler = BackgroundScheduler()
+        self.scheduler = BackgroundScheduler(
+            executors={
+                # Maintenance is I/O-bound and runs once a day; 2 threads instead of 10
+                'default': ThreadPoolExecutor(2)
+            },
+            job_defaults={
+                'coalesce': True,  # run missed firings once after downtime
+                'max_instances': 1,  # never reload/back up the DB concurrently
+                'misfire_grace_time': 3600
+            }
+        )
         self.logger = logging.getLogger(__name__)
+        
+        # Cached get_status() payload, dropped whenever APScheduler reports a change
+        self._status: Optional[Dict[str, Any]] = None
+        self._status_version = 0
+        self._status_lock = threading.Lock()
+        self.scheduler.add_listener(self._invalidate_status, _STATUS_EVENTS)
     
     def schedule_midnight_db_check(self) -> None:
         """
@@ -233,4 +274,44 @@ class APSchedulerManager(CronScheduler):
         Returns:
             List of scheduled jobs
         """
-        return self.scheduler.get_jobs()
\ No newline at end of file
+        return self.scheduler.get_jobs()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the scheduler state and its jobs.
+        
+        The snapshot is built once and reused until a scheduler event
+        invalidates it, so polling doesn't enumerate jobs on every call.
+        
+        Returns:
+            dict: running flag, job count, and id/name/next_run_time per job
+        """
+        status = self._status
+        if status is None:
+            # Built outside _status_lock: APScheduler fires listeners while
+            # holding its jobstore lock, which get_jobs() also takes
+            version = self._status_version
+            jobs = self.scheduler.get_jobs()
+            status = {
+                "running": self.scheduler.running,
+                "job_count": len(jobs),
+                "jobs": [
+                    {
+                        "id": job.id,
+                        "name": job.name,
+                        "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None
+                    }
+                    for job in jobs
+                ]
+            }
+            with self._status_lock:
+                # Don't cache a snapshot an event has already made stale
+                if self._status_version == version:
+                    self._status = status
+        return status
+    
+    def _invalidate_status(self, event) -> None:
+        """APScheduler listener: drop the cached status snapshot."""
+        with self._status_lock:
+            self._status_version += 1
+            self._status = None
\ No newline at end of file
@@ -28,6 +28,20 @@ class QuarantineManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def move_file_to_incoming(self, file_path: str, original_filename: str) -> str:
+        """
+        Move an already-written file into the incoming folder with unique naming.
+        
+        Args:
+            file_path (str): Path of the file to move (same filesystem)
+            original_filename (str): Original filename
+            
+        Returns:
+            str: Path to the file in incoming folder
+        """
+        pass
+    
     @abstractmethod
     def move_to_scanning(self, file_path: str) -> str:
         """
@@ -104,6 +118,42 @@ class FileQuarantineManager(QuarantineManager):
         Returns:
             str: Path to the saved file in incoming folder
         """
+        destination_path = self._incoming_destination(original_filename)
+        
+        # Save file bytes
+        with open(destination_path, 'wb') as f:
+            f.write(file_bytes)
+        
+        return destination_path
+    
+    def move_file_to_incoming(self, file_path: str, original_filename: str) -> str:
+        """
+        Move an already-written file into the incoming folder with unique naming.
+        
+        The rename is atomic, so callers can stream uploads to a temporary
+        file in the incoming folder instead of holding them in memory.
+        
+        Args:
+            file_path (str): Path of the file to move (same filesystem)
+            original_filename (str): Original filename
+            
+        Returns:
+            str: Path to the file in incoming folder
+        """
+        destination_path = self._incoming_destination(original_filename)
+        os.replace(file_path, destination_path)
+        return destination_path
+    
+    def _incoming_destination(self, original_filename: str) -> str:
+        """
+        Build a unique destination path in the incoming folder.
+        
+        Args:
+            original_filename (str): Original filename
+            
+        Returns:
+            str: Destination path in incoming folder
+        """
         # Ensure folder exists
         os.makedirs(self.incoming_path, exist_ok=True)
         
@@ -111,13 +161,7 @@ class FileQuarantineManager(QuarantineManager):
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         file_extension = os.path.splitext(original_filename)[1]
         unique_filename = f"incoming_{timestamp}_{original_filename}{file_extension}"
-        destination_path = os.path.join(self.incoming_path, unique_filename)
-        
-        # Save file bytes
-        with open(destination_path, 'wb') as f:
-            f.write(file_bytes)
-        
-        return destination_path
+        return os.path.join(self.incoming_path, unique_filename)
     
     def move_to_scanning(self, file_path: str) -> str:
         """
@@ -208,6 +252,22 @@ class FileQuarantineManager(QuarantineManager):
         for folder in folders:
             os.makedirs(folder, exist_ok=True)
     
+    def get_quarantine_paths(self) -> dict:
+        """
+        Get all quarantine folder paths.
+        
+        Returns:
+            dict: Dictionary of quarantine paths
+        """
+        return {
+            'base': self.base_path,
+            'incoming': self.incoming_path,
+            'scanning': self.scanning_path,
+            'clean': self.clean_path,
+            'infected': self.infected_path,
+            'logs': self.logs_path
+        }
+    
     def get_log_path(self) -> str:
         """
         Get the path for quarantine operation logs.
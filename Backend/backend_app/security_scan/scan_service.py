@@ -8,6 +8,10 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 import os
 import time
+import socket
+import struct
+import threading
+from concurrent.futures import Future
 import subprocess
 import mimetypes
 from .io_contract import ScanRequest, ScanResult, ScanStatus
@@ -54,6 +58,191 @@ class ScanService(ABC):
         pass
 
 
+class ClamdSession:
+    """
+    Persistent clamd connection using the IDSESSION protocol.
+    
+    Scans share one socket instead of connecting per file. Commands from
+    concurrent threads are pipelined: each is written whole under a lock, and
+    a reader thread hands replies (which clamd may send out of order) back by
+    request id. A keepalive PING stops clamd's idle timeout from closing the
+    session, and a dropped session is reopened and the command retried once.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, address: str, timeout: float = 30, keepalive_interval: float = 20):
+        """
+        Initialize the session (connection is opened lazily).
+        
+        Args:
+            address (str): clamd UNIX socket path, or "host:port" for TCP
+            timeout (float): Socket and reply timeout in seconds
+            keepalive_interval (float): Idle seconds before a PING; keep it under clamd's IdleTimeout (30s default)
+        """
+        self.address = address
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self._sock: Optional[socket.socket] = None
+        self._request_id = 0
+        self._pending: Dict[int, Future] = {}
+        self._send_lock = threading.Lock()
+        self._last_used = 0.0
+    
+    def instream(self, file_path: str) -> str:
+        """
+        Scan a file with INSTREAM.
+        
+        Args:
+            file_path (str): Path to the file to scan
+            
+        Returns:
+            str: clamd reply without the request id, e.g. "stream: OK"
+        """
+        return self._command(b"zINSTREAM\0", file_path)
+    
+    def ping(self) -> bool:
+        """
+        Check that clamd answers on the session.
+        
+        Returns:
+            bool: True if clamd replied PONG
+        """
+        return self._command(b"zPING\0") == "PONG"
+    
+    def close(self) -> None:
+        """End the session and close the socket."""
+        with self._send_lock:
+            self._close()
+    
+    def _command(self, command: bytes, file_path: Optional[str] = None) -> str:
+        for attempt in range(2):
+            try:
+                return self._send(command, file_path).result(self.timeout)
+            except (ConnectionError, EOFError):
+                if attempt:
+                    raise
+    
+    def _send(self, command: bytes, file_path: Optional[str]) -> Future:
+        with self._send_lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                self._request_id += 1
+                future = Future()
+                self._pending[self._request_id] = future
+                self._sock.sendall(command)
+                if file_path is not None:
+                    self._send_stream(file_path)
+                self._last_used = time.monotonic()
+                return future
+            except OSError as e:
+                self._close(e)
+                raise
+    
+    def _connect(self) -> None:
+        if ":" in self.address and not self.address.startswith("/"):
+            host, port = self.address.rsplit(":", 1)
+            sock = socket.create_connection((host, int(port)), timeout=self.timeout)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+        sock.sendall(b"zIDSESSION\0")
+        self._sock = sock
+        self._request_id = 0
+        self._last_used = time.monotonic()
+        threading.Thread(target=self._read_replies, args=(sock,), daemon=True).start()
+        threading.Thread(target=self._keepalive, args=(sock,), daemon=True).start()
+    
+    def _send_stream(self, file_path: str) -> None:
+        # socket.sendfile lets the kernel copy the file into the socket
+        # (os.sendfile), falling back to read/send where that isn't available
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = 0
+            while offset < size:
+                count = min(self.CHUNK_SIZE, size - offset)
+                self._sock.sendall(struct.pack("!L", count))
+                sent = self._sock.sendfile(f, offset, count)
+                if sent != count:
+                    # The length prefix is already on the wire; the stream is unusable
+                    raise OSError(f"{file_path} changed size while streaming to clamd")
+                offset += count
+        self._sock.sendall(struct.pack("!L", 0))
+    
+    def _read_replies(self, sock: socket.socket) -> None:
+        buffer = bytearray()
+        try:
+            while True:
+                try:
+                    data = sock.recv(4096)
+                except socket.timeout:
+                    # Idle; pending commands time out on their own
+                    continue
+                if not data:
+                    raise EOFError("clamd closed the session")
+                buffer += data
+                while (end := buffer.find(b"\0")) != -1:
+                    reply = bytes(buffer[:end]).decode()
+                    del buffer[:end + 1]
+                    reply_id, _, message = reply.partition(": ")
+                    future = self._pending.pop(int(reply_id), None)
+                    if future is not None:
+                        future.set_result(message)
+        except (EOFError, OSError, ValueError) as e:
+            with self._send_lock:
+                if self._sock is sock:
+                    self._close(e)
+    
+    def _keepalive(self, sock: socket.socket) -> None:
+        while True:
+            time.sleep(self.keepalive_interval)
+            if self._sock is not sock:
+                return
+            if time.monotonic() - self._last_used >= self.keepalive_interval:
+                try:
+                    self.ping()
+                except Exception:
+                    return
+    
+    def _close(self, error: Optional[BaseException] = None) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.sendall(b"zEND\0")
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"clamd session closed: {error}"))
+
+
+# One session per clamd address, shared by every scan service in the process
+_clamd_sessions: Dict[str, ClamdSession] = {}
+_clamd_sessions_lock = threading.Lock()
+
+
+def get_clamd_session(address: str, timeout: float = 30) -> ClamdSession:
+    """
+    Get the shared clamd session for an address.
+    
+    Args:
+        address (str): clamd UNIX socket path, or "host:port" for TCP
+        timeout (float): Socket timeout in seconds
+        
+    Returns:
+        ClamdSession: Shared session
+    """
+    with _clamd_sessions_lock:
+        session = _clamd_sessions.get(address)
+        if session is None:
+            session = _clamd_sessions[address] = ClamdSession(address, timeout)
+        return session
+
+
 class ClamAVScanService(ScanService):
     """Concrete implementation of ScanService using ClamAV."""
     
@@ -181,28 +370,30 @@ class ClamAVScanService(ScanService):
         Returns:
             Dict[str, Any]: Scan results from ClamAV
         """
-        # This is a placeholder implementation
-        # In a real implementation, this would:
-        # 1. Connect to ClamAV daemon
-        # 2. Execute the scan
-        # 3. Parse and return results
-        
         try:
             start_time = time.time()
             
-            # Example command (would need actual ClamAV integration)
-            # result = subprocess.run(['clamdscan', '--fd-pass', file_path], 
-            #                        capture_output=True, text=True)
+            if not self.clamav_socket:
+                # No clamd configured: placeholder result
+                return {
+                    'status': 'OK',
+                    'virus_name': None,
+                    'scan_time': time.time() - start_time,
+                    'error': None
+                }
             
-            # Placeholder result structure
-            result = {
-                'status': 'OK',  # or 'FOUND' or 'ERROR'
-                'virus_name': None,
-                'scan_time': time.time() - start_time,
-                'error': None
-            }
+            session = get_clamd_session(self.clamav_socket, get_config().clamav_timeout)
+            reply = session.instream(file_path)
+            scan_time = time.time() - start_time
             
-            return result
+            # Replies look like "stream: OK", "stream: <name> FOUND"
+            # or "<message> ERROR"
+            message = reply.partition("stream: ")[2] or reply
+            if message == 'OK':
+                return {'status': 'OK', 'virus_name': None, 'scan_time': scan_time, 'error': None}
+            if message.endswith(' FOUND'):
+                return {'status': 'FOUND', 'virus_name': message[:-len(' FOUND')], 'scan_time': scan_time, 'error': None}
+            return {'status': 'ERROR', 'virus_name': None, 'scan_time': scan_time, 'error': reply}
             
         except Exception as e:
             return {
@@ -10,6 +10,7 @@ from datetime import datetime
 import os
 import hashlib
 import shutil
+from .io_contract import VirusUpdateStatus
 
 
 class VirusUpdateManager(ABC):
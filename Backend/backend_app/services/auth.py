@@ -10,7 +10,7 @@ from sqlalchemy import select
 
 from backend_app.config import settings
 from backend_app.models.users import User
-from backend_app.repositories.user_repo import UserRepository
+from backend_app.repositories.user_repo import CachedUser, UserRepository
 from backend_app.schemas.auth import LoginResponse
 
 
@@ -30,7 +30,7 @@ class AuthService:
     ) -> User:
         """Create a new user"""
         # Check if user already exists
-        existing_user = await self.user_repo.get_by_email(email)
+        existing_user = await self.user_repo.get_cached_by_email(email)
         if existing_user:
             raise Exception("User with this email already exists")
         
@@ -41,12 +41,13 @@ class AuthService:
             full_name=full_name,
             role=role
         )
+        await self.user_repo.commit()
         
         return user
     
     async def login(self, email: str, password: str) -> Optional[Dict]:
         """Authenticate user and return tokens"""
-        user = await self.user_repo.get_by_email(email)
+        user = await self.user_repo.get_login_row(email)
         if not user or not self.user_repo.verify_password(password, user.password_hash):
             return None
         
@@ -56,6 +57,7 @@ class AuthService:
         
         # Update last login
         await self.user_repo.update_last_login(user.id)
+        await self.user_repo.commit()
         
         return {
             "access_token": access_token,
@@ -78,7 +80,7 @@ class AuthService:
             if not user_id:
                 return None
             
-            user = await self.user_repo.get_by_id(user_id)
+            user = await self.user_repo.get_cached_by_id(user_id)
             if not user:
                 return None
             
@@ -129,7 +131,7 @@ class AuthService:
     async def get_current_user(
         db: AsyncSession = None,
         token: str = None
-    ) -> User:
+    ) -> CachedUser:
         """Get current user from token"""
         if not token:
             raise Exception("Authentication required")
@@ -147,7 +149,7 @@ class AuthService:
             
             # Get user from database
             user_repo = UserRepository(db)
-            user = await user_repo.get_by_id(user_id)
+            user = await user_repo.get_cached_by_id(user_id)
             if not user:
                 raise Exception("User not found")
             
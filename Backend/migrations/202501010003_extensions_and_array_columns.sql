@@ -0,0 +1,60 @@
+-- Migration C: Extensions and column type changes
+-- Enables citext and pgvector, and moves users.email, the candidate skill
+-- embedding and the flat skill/location lists to their new column types
+
+CREATE EXTENSION IF NOT EXISTS citext;
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- Case-insensitive email equality, still served by the unique index
+ALTER TABLE users ALTER COLUMN email TYPE CITEXT;
+
+-- Skill embeddings move from a serialized string to a 384-dimension vector.
+-- Stored strings must already be in pgvector's '[x, y, ...]' text form.
+DO $$ BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'candidate_profiles' AND column_name = 'ai_skills_vector'
+          AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE candidate_profiles
+        ALTER COLUMN ai_skills_vector TYPE vector(384) USING NULLIF(ai_skills_vector, '')::vector(384);
+    END IF;
+END $$;
+
+-- JSONB string arrays become text arrays. ALTER COLUMN ... USING does not
+-- allow subqueries, so the conversion goes through a session-local function.
+CREATE FUNCTION pg_temp.jsonb_to_text_array(value JSONB) RETURNS VARCHAR[] AS $$
+    SELECT CASE
+        WHEN jsonb_typeof(value) = 'array'
+        THEN ARRAY(SELECT jsonb_array_elements_text(value))::VARCHAR[]
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE data_type = 'jsonb' AND (table_name, column_name) IN (
+            ('candidate_profiles', 'skills'),
+            ('candidate_profiles', 'certificates'),
+            ('candidate_profiles', 'current_locations'),
+            ('candidate_profiles', 'preferred_locations'),
+            ('candidate_profiles', 'preferred_industries'),
+            ('candidate_profiles', 'languages'),
+            ('jobs', 'job_locations'),
+            ('jobs', 'required_skills'),
+            ('jobs', 'preferred_skills'),
+            ('jobs', 'tools_tech_stack')
+        )
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE VARCHAR[] USING pg_temp.jsonb_to_text_array(%I)',
+            col.table_name, col.column_name, col.column_name
+        );
+    END LOOP;
+END $$;
+
+COMMENT ON COLUMN users.email IS 'Login email, compared case-insensitively';
+COMMENT ON COLUMN candidate_profiles.ai_skills_vector IS 'Skills embedding for semantic matching (pgvector, 384 dimensions)';
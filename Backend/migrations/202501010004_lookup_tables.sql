@@ -0,0 +1,90 @@
+-- Migration D: Smallint lookup tables for categorical columns
+-- Creates and seeds the lookup tables, then replaces the free-text follow-up
+-- and preference columns with smallint foreign keys. Seed ids match
+-- LOOKUP_SEEDS in backend_app/db/models/lookups.py and must not change.
+
+CREATE TABLE IF NOT EXISTS follow_up_statuses (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS job_type_preferences (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS shift_preferences (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS sector_preferences (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS reservation_categories (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(50) NOT NULL UNIQUE
+);
+
+INSERT INTO follow_up_statuses (id, name) VALUES
+    (1, 'Shortlisted'), (2, 'Int-scheduled'), (3, 'Offered'), (4, 'Joined'),
+    (5, 'No Show'), (6, 'Under Follow-up'), (7, 'Rejected')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO job_type_preferences (id, name) VALUES
+    (1, 'Full-time'), (2, 'Contract')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO shift_preferences (id, name) VALUES
+    (1, 'Day'), (2, 'Night'), (3, 'Flex')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO sector_preferences (id, name) VALUES
+    (1, 'Private'), (2, 'Govt')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO reservation_categories (id, name) VALUES
+    (1, 'General'), (2, 'OBC'), (3, 'SC'), (4, 'ST')
+ON CONFLICT DO NOTHING;
+
+-- Add the id columns
+ALTER TABLE applications
+ADD COLUMN IF NOT EXISTS follow_up_status_id SMALLINT REFERENCES follow_up_statuses(id);
+
+ALTER TABLE candidate_profiles
+ADD COLUMN IF NOT EXISTS job_type_preference_id SMALLINT REFERENCES job_type_preferences(id),
+ADD COLUMN IF NOT EXISTS shift_preference_id SMALLINT REFERENCES shift_preferences(id),
+ADD COLUMN IF NOT EXISTS sector_preference_id SMALLINT REFERENCES sector_preferences(id),
+ADD COLUMN IF NOT EXISTS reservation_category_id SMALLINT REFERENCES reservation_categories(id);
+
+-- Carry the existing text values over, then drop the text columns.
+-- Values that match no lookup row become NULL.
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('applications', 'follow_up_status', 'follow_up_statuses'),
+            ('candidate_profiles', 'job_type_preference', 'job_type_preferences'),
+            ('candidate_profiles', 'shift_preference', 'shift_preferences'),
+            ('candidate_profiles', 'sector_preference', 'sector_preferences'),
+            ('candidate_profiles', 'reservation_category', 'reservation_categories')
+        ) AS mapping (table_name, column_name, lookup_table)
+    LOOP
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = col.table_name AND column_name = col.column_name
+        ) THEN
+            EXECUTE format(
+                'UPDATE %I t SET %I = l.id FROM %I l WHERE l.name = t.%I',
+                col.table_name, col.column_name || '_id', col.lookup_table, col.column_name
+            );
+            EXECUTE format('ALTER TABLE %I DROP COLUMN %I', col.table_name, col.column_name);
+        END IF;
+    END LOOP;
+END $$;
+
+COMMENT ON COLUMN applications.follow_up_status_id IS 'Manual follow-up status, see follow_up_statuses';
@@ -0,0 +1,102 @@
+-- Migration E: Range-partition activity_logs and chat_messages by month
+-- Rebuilds each table as a partitioned table (activity_logs by created_at,
+-- chat_messages by sent_at), creates a monthly partition for every month that
+-- already holds rows plus a DEFAULT partition, and copies the rows across.
+-- Later months are created by backend_app.db.partitions.maintain_partitions.
+-- Tables that are already partitioned are left alone.
+
+-- Application.unread_candidate_msgs is kept by a trigger on chat_messages
+ALTER TABLE applications
+ADD COLUMN IF NOT EXISTS unread_candidate_msgs INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION count_unread_candidate_msgs() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' AND OLD.sender_type = 'CANDIDATE' AND OLD.is_read IS NOT TRUE THEN
+        UPDATE applications
+        SET unread_candidate_msgs = unread_candidate_msgs - 1
+        WHERE id = OLD.application_id;
+    END IF;
+    IF TG_OP <> 'DELETE' AND NEW.sender_type = 'CANDIDATE' AND NEW.is_read IS NOT TRUE THEN
+        UPDATE applications
+        SET unread_candidate_msgs = unread_candidate_msgs + 1
+        WHERE id = NEW.application_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Rebuild one table as RANGE (part_column) partitions
+CREATE FUNCTION pg_temp.partition_by_month(tbl TEXT, part_column TEXT) RETURNS void AS $$
+DECLARE
+    legacy TEXT := tbl || '_unpartitioned';
+    month_start DATE;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table pt
+        JOIN pg_class c ON c.oid = pt.partrelid
+        WHERE c.relname = tbl
+    ) THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', tbl, legacy);
+    EXECUTE format('ALTER TABLE %I RENAME CONSTRAINT %I TO %I', legacy, tbl || '_pkey', legacy || '_pkey');
+    EXECUTE format('UPDATE %I SET %I = now() WHERE %I IS NULL', legacy, part_column, part_column);
+
+    -- The partition key has to be part of the primary key
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id, %I)) '
+        'PARTITION BY RANGE (%I)',
+        tbl, legacy, part_column, part_column
+    );
+    EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', tbl || '_default', tbl);
+
+    FOR month_start IN EXECUTE format(
+        'SELECT DISTINCT date_trunc(''month'', %I)::date FROM %I', part_column, legacy
+    ) LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            tbl || '_' || to_char(month_start, 'YYYY_MM'), tbl,
+            month_start, (month_start + INTERVAL '1 month')::date
+        );
+    END LOOP;
+
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', tbl, legacy);
+    EXECUTE format('DROP TABLE %I', legacy);
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT pg_temp.partition_by_month('activity_logs', 'created_at');
+SELECT pg_temp.partition_by_month('chat_messages', 'sent_at');
+
+-- Indexes and foreign keys are not copied by LIKE
+CREATE INDEX IF NOT EXISTS ix_al_user_time ON activity_logs(user_id, created_at);
+CREATE INDEX IF NOT EXISTS ix_al_entity ON activity_logs(entity_id);
+CREATE INDEX IF NOT EXISTS ix_cm_app_sent ON chat_messages(application_id, sent_at);
+CREATE INDEX IF NOT EXISTS ix_cm_unread ON chat_messages(application_id) WHERE is_read = false;
+
+DO $$ BEGIN
+    ALTER TABLE activity_logs
+    ADD CONSTRAINT activity_logs_user_id_fkey FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL;
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+DO $$ BEGIN
+    ALTER TABLE chat_messages
+    ADD CONSTRAINT chat_messages_application_id_fkey FOREIGN KEY (application_id) REFERENCES applications(id) ON DELETE CASCADE;
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+DROP TRIGGER IF EXISTS trg_chat_messages_unread_count ON chat_messages;
+CREATE TRIGGER trg_chat_messages_unread_count
+AFTER INSERT OR DELETE OR UPDATE OF is_read, sender_type, application_id ON chat_messages
+FOR EACH ROW EXECUTE FUNCTION count_unread_candidate_msgs();
+
+-- Bring the counters in line with the copied messages
+UPDATE applications a
+SET unread_candidate_msgs = (
+    SELECT count(*) FROM chat_messages m
+    WHERE m.application_id = a.id AND m.sender_type = 'CANDIDATE' AND m.is_read IS NOT TRUE
+);
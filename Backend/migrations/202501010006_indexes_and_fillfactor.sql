@@ -0,0 +1,47 @@
+-- Migration F: Query indexes and storage tuning
+-- Adds the dashboard, foreign key, skill-matching and embedding indexes,
+-- drops the redundant single-column indexes on primary keys, and lowers the
+-- fillfactor on update-heavy tables so status updates can stay HOT
+
+-- Dashboard queries
+CREATE INDEX IF NOT EXISTS ix_aq_user_open ON action_queue(user_id, created_at) WHERE is_dismissed = false;
+CREATE INDEX IF NOT EXISTS ix_app_candidate_active ON applications(candidate_id, is_active);
+CREATE INDEX IF NOT EXISTS ix_app_job_status ON applications(job_id, status);
+CREATE INDEX IF NOT EXISTS ix_app_followup_date ON applications(next_follow_up_date) WHERE is_active = true;
+
+-- Foreign keys with ON DELETE actions
+CREATE INDEX IF NOT EXISTS ix_aq_user ON action_queue(user_id);
+CREATE INDEX IF NOT EXISTS ix_timeline_app ON application_timeline(application_id);
+CREATE INDEX IF NOT EXISTS ix_work_history_profile ON candidate_work_history(profile_id);
+CREATE INDEX IF NOT EXISTS ix_sales_tasks_lead ON sales_tasks(lead_id);
+
+-- Skill containment matching: skills @> ARRAY['React', 'TypeScript']
+CREATE INDEX IF NOT EXISTS ix_candidate_skills_gin ON candidate_profiles USING gin (skills);
+CREATE INDEX IF NOT EXISTS ix_job_required_skills_gin ON jobs USING gin (required_skills);
+
+-- Top-K semantic matching: ORDER BY ai_skills_vector <=> :query_vec LIMIT k
+CREATE INDEX IF NOT EXISTS ix_candidate_skills_hnsw ON candidate_profiles
+USING hnsw (ai_skills_vector vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+-- The primary key index already covers these
+DROP INDEX IF EXISTS ix_public_action_queue_id;
+DROP INDEX IF EXISTS ix_public_activity_logs_id;
+DROP INDEX IF EXISTS ix_public_application_timeline_id;
+DROP INDEX IF EXISTS ix_public_applications_id;
+DROP INDEX IF EXISTS ix_public_chat_messages_id;
+DROP INDEX IF EXISTS ix_public_clients_id;
+DROP INDEX IF EXISTS ix_public_external_job_postings_id;
+DROP INDEX IF EXISTS ix_public_jobs_id;
+DROP INDEX IF EXISTS ix_public_leads_id;
+DROP INDEX IF EXISTS ix_public_sales_tasks_id;
+DROP INDEX IF EXISTS ix_public_users_id;
+
+-- Follow-up status has seven values, too few for a useful index; databases
+-- built by create_all before this migration have it
+DROP INDEX IF EXISTS ix_app_follow_up_status;
+
+-- Leave page room for HOT updates. Applies to newly written pages; a
+-- VACUUM FULL or pg_repack rewrites existing ones.
+ALTER TABLE applications SET (fillfactor = 80);
+ALTER TABLE users SET (fillfactor = 80);
+ALTER TABLE action_queue SET (fillfactor = 80);